@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+import time
+import traceback
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import override
+
+from loguru import logger
+
+from python_ecs.ecs import ECS
+from python_ecs.storage.database_api import DatabaseAPI
+from python_ecs.system import System, SystemBag
+from python_ecs.telemetry import SystemStats
+
+
+class AsyncSystem[T](System[T]):
+    """System whose update is a coroutine: it may await I/O across several frames without blocking them."""
+
+    @override
+    async def update(self, db: DatabaseAPI, dt: float):
+        pass
+
+
+def is_async(sys: System) -> bool:
+    return inspect.iscoroutinefunction(sys.update)
+
+
+class AsyncECS(ECS):
+    """ECS driven by an asyncio loop.
+
+    At each frame, the due synchronous systems run off the loop in the executor (through the scheduler if any),
+    while the due async systems are started as tasks and are not awaited by the frame: a system still running from
+    a previous frame is skipped. Async systems run in the loop thread, their structural changes are applied at the
+    next frame boundary. The synchronous update / tick raise a TypeError when the ECS has async systems.
+    """
+
+    def __init__(self, *args, executor: Executor = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending: dict[int, asyncio.Task] = {}
+        self.running = False
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ecs')
+        return self._executor
+
+    def close(self):
+        """Shut down the default executor (done at the end of run), a given executor is left to its owner."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def update_async(self):
+        for now in self._tick_times(time.time()):
+            await self.tick_async(now)
+
+    async def tick_async(self, now: float):
+        due = self._begin_frame(now)
+        blocking = []
+        for sys, elapsed in due:
+            if is_async(sys):
+                self._start(sys, elapsed)
+            else:
+                blocking.append((sys, elapsed))
+        if blocking:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self._run_blocking, blocking)
+        self._end_frame()
+
+    async def run(self, tick_hz: float, frames: int = None):
+        """Tick at tick_hz until stop() (or for a number of frames). A late frame shifts the next deadlines
+        instead of running a burst of frames to catch up."""
+        period = 1 / tick_hz
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        self.running = True
+        count = 0
+        try:
+            while self.running and (frames is None or count < frames):
+                await self.update_async()
+                count += 1
+                deadline += period
+                delay = deadline - loop.time()
+                if delay < 0:
+                    deadline = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+        finally:
+            self.running = False
+            self.close()
+
+    def stop(self):
+        self.running = False
+
+    async def join(self):
+        """Wait for the async systems still running."""
+        await asyncio.gather(*self.pending.values(), return_exceptions=True)
+
+    @override
+    def tick(self, now: float):
+        """Synchronous frame: refused (before it starts) when an async system could be due, see update_async."""
+        for sys in self.systems:
+            for _ in sys.steps if isinstance(sys, SystemBag) else [sys]:
+                if is_async(_):
+                    raise TypeError(f'{_.__class__.__name__}: async systems only run with update_async / run')
+        super().tick(now)
+
+    def _run_blocking(self, due: list[tuple[System, float]]):
+        # no deferred buffer: entity ids are given at once, so a system can link the entities it creates
+        if self.scheduler is None:
+            for sys, elapsed in due:
+                self._update_system(sys, elapsed)
+        else:
+            self.scheduler.run(self.db, due, self._update_system)
+
+    def _start(self, sys: System, elapsed: float):
+        stats = self._system_stats[id(sys)]
+        if id(sys) in self.pending:
+            stats.skipped = True
+            return
+        if self._over_budget(sys):
+            stats.skipped = True
+            self.buckets.defer(sys, self.time - elapsed)
+            return
+        self.last_updates[sys.__class__] = self.time
+        stats.entities = self.index.count(sys)
+        stats.start = time.perf_counter() - self._frame_start
+        self.pending[id(sys)] = asyncio.create_task(self._run_async(sys, elapsed, stats))
+
+    async def _run_async(self, sys: System, elapsed: float, stats: SystemStats):
+        start = time.perf_counter()
+        try:
+            await sys.update(self.db, elapsed)
+        except Exception as e:
+            stats.failed = True
+            logger.error(f'{sys.__class__.__name__}: {e}\n{traceback.format_exc()}')
+        finally:
+            stats.duration = time.perf_counter() - start
+            del self.pending[id(sys)]
@@ -0,0 +1,255 @@
+"""Benchmark suite of the ECS core operations, with a JSON baseline to track regressions.
+
+python -m python_ecs.benchmark run --scales 1000 100000 --output baseline.json
+python -m python_ecs.benchmark compare baseline.json current.json --threshold 0.1
+
+Run with PYTHON_ECS_PROFILING=off to measure without the instrumentation overhead (the profiling mode is saved
+with the results: only compare runs of the same mode).
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Type, override
+
+from loguru import logger
+
+from python_ecs.component import Component
+from python_ecs.ecs import ECS
+from python_ecs.profiling import MODE
+from python_ecs.signature import Signature
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from python_ecs.storage.database_api import DatabaseAPI
+from python_ecs.system import System
+
+SCALES = (1_000, 100_000, 1_000_000)
+STORAGES: dict[str, Type[Database]] = {
+    'Database': Database,
+    'ArchetypeDatabase': ArchetypeDatabase,
+}
+
+type PathLike = Path | str
+
+
+class BenchPosition(Component):
+    x: float = 0.
+    y: float = 0.
+
+
+class BenchSpeed(Component):
+    x: float = 1.
+    y: float = 1.
+
+
+class BenchMove(Signature):
+    pos: BenchPosition
+    speed: BenchSpeed
+
+
+class BenchMoveSystem(System[BenchMove]):
+    _signature = BenchMove
+
+    @override
+    def update_single(self, db: DatabaseAPI, item: BenchMove, dt: float):
+        item.pos.x += item.speed.x * dt
+        item.pos.y += item.speed.y * dt
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    storage: str
+    scale: int
+    value: float  # best of the runs (lower is better)
+    unit: str = 'sec'
+
+    @property
+    def key(self) -> str:
+        return f'{self.name}[{self.storage}:{self.scale}]'
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+    def __str__(self):
+        return f'{self.key}: {self.baseline:.6g} -> {self.current:.6g} (x{self.ratio:.2f})'
+
+
+def _entities(n: int) -> list[list[Component]]:
+    """Half of the entities are moving (BenchMove), the others only have a position."""
+    return [
+        [BenchPosition(x=i), BenchSpeed()] if i % 2 == 0 else [BenchPosition(x=i)]
+        for i in range(n)
+    ]
+
+
+def _populated(storage: Type[Database], n: int, systems: list[System] = None) -> ECS:
+    ecs = ECS(db=storage(), systems=systems)
+    ecs.create_all(_entities(n))
+    ecs.apply_demography()
+    return ecs
+
+
+def _timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_create_all(storage: Type[Database], n: int) -> float:
+    """create_all then the flush that actually stores the entities."""
+    ecs = ECS(db=storage())
+    items = _entities(n)
+
+    def run():
+        ecs.create_all(items)
+        ecs.apply_demography()
+
+    return _timed(run)
+
+
+def bench_apply_demography(storage: Type[Database], n: int) -> float:
+    """Flush of n/2 deaths and n/2 births, on n live entities."""
+    ecs = _populated(storage, n, systems=[BenchMoveSystem()])
+    ecs.db.destroy_all([BenchPosition.model_construct(eid=_) for _ in sorted(ecs.db.entities())[::2]])
+    ecs.create_all(_entities(n // 2))
+    return _timed(ecs.apply_demography)
+
+
+def bench_system_update(storage: Type[Database], n: int) -> float:
+    system = BenchMoveSystem()
+    ecs = _populated(storage, n, systems=[system])
+    return _timed(lambda: system.update(ecs.db, .1))
+
+
+def bench_signature_cast(storage: Type[Database], n: int) -> float:
+    """Independent of the storage."""
+    items = _entities(n)
+    return _timed(lambda: [BenchMove.cast(_) for _ in items])
+
+
+def bench_intersect_entities(storage: Type[Database], n: int) -> float:
+    db = _populated(storage, n).db
+    return _timed(lambda: db.intersect_entities([BenchPosition, BenchSpeed]))
+
+
+def bench_memory_per_entity(storage: Type[Database], n: int) -> float:
+    """Bytes allocated per stored entity (including the components and the storage structures)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        ecs = _populated(storage, n)
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del ecs
+    return size / n
+
+
+BENCHMARKS: dict[str, tuple[Callable[[Type[Database], int], float], str]] = {
+    'create_all': (bench_create_all, 'sec'),
+    'apply_demography': (bench_apply_demography, 'sec'),
+    'system_update': (bench_system_update, 'sec'),
+    'signature_cast': (bench_signature_cast, 'sec'),
+    'intersect_entities': (bench_intersect_entities, 'sec'),
+    'memory_per_entity': (bench_memory_per_entity, 'bytes'),
+}
+
+
+def run_suite(scales: tuple[int, ...] = SCALES,
+              storages: list[str] = None,
+              benchmarks: list[str] = None,
+              repeat: int = 3) -> list[BenchmarkResult]:
+    """Best of `repeat` runs of each benchmark (memory is measured once), each run with a fresh setup."""
+    storages = storages or list(STORAGES)
+    benchmarks = benchmarks or list(BENCHMARKS)
+    unknown = (set(storages) - set(STORAGES)) | (set(benchmarks) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f'run_suite: unknown storages or benchmarks {sorted(unknown)}')
+
+    res = []
+    for scale in scales:
+        for storage in storages:
+            for name in benchmarks:
+                func, unit = BENCHMARKS[name]
+                runs = 1 if unit == 'bytes' else repeat
+                value = min(func(STORAGES[storage], scale) for _ in range(runs))
+                result = BenchmarkResult(name=name, storage=storage, scale=scale, value=value, unit=unit)
+                logger.info(f'{result.key}: {value:.6g} {unit}')
+                res.append(result)
+    return res
+
+
+def save_results(path: PathLike, results: list[BenchmarkResult]):
+    with Path(path).open('w') as _:
+        json.dump({
+            'created': time.time(),
+            'python': platform.python_version(),
+            'profiling': MODE,
+            'results': [asdict(_) for _ in results],
+        }, _, indent=2)
+
+
+def load_results(path: PathLike) -> list[BenchmarkResult]:
+    with Path(path).open() as _:
+        raw = json.load(_)
+    return [BenchmarkResult(**_) for _ in raw['results']]
+
+
+def compare(baseline: list[BenchmarkResult],
+            current: list[BenchmarkResult],
+            threshold: float = .1) -> list[Regression]:
+    """Results more than `threshold` (relative) above the baseline, benchmarks missing on one side are ignored."""
+    reference = {_.key: _.value for _ in baseline}
+    return [
+        Regression(key=_.key, baseline=reference[_.key], current=_.value)
+        for _ in current
+        if _.key in reference and _.value > reference[_.key] * (1 + threshold)
+    ]
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m python_ecs.benchmark', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the suite and save the results')
+    run.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    run.add_argument('--storages', nargs='+', choices=list(STORAGES))
+    run.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS))
+    run.add_argument('--repeat', type=int, default=3)
+    run.add_argument('--output', default='benchmark.json')
+
+    check = commands.add_parser('compare', help='exit with 1 when a result regressed from the baseline')
+    check.add_argument('baseline')
+    check.add_argument('current')
+    check.add_argument('--threshold', type=float, default=.1, help='tolerated relative increase')
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        results = run_suite(tuple(args.scales), args.storages, args.benchmarks, args.repeat)
+        save_results(args.output, results)
+        return 0
+
+    regressions = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    for _ in regressions:
+        logger.warning(f'regression: {_}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,40 @@
-from typing import Self, Type, Any
+from typing import Self, Type, Any, Callable
 
 from pydantic import Field
 
 from easy_config.my_model import MyModel
-from easy_kit.timing import time_func
+from python_ecs.profiling import time_func
 from python_ecs.storage.id_generator import IdGenerator
 from python_ecs.types import ComponentId, EntityId
 
 CID_GEN = IdGenerator()
 
 
-class Component(MyModel):
+class ComponentMeta(type(MyModel)):
+    """Lets FastComponent classes (plain slotted classes) pass isinstance / issubclass checks against Component.
+
+    The extended checks are Python level calls: only Component itself has them, its subclasses are created with
+    _SubclassMeta which keeps the native checks of pydantic models.
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any):
+        if mcs is ComponentMeta and any(isinstance(_, ComponentMeta) for _ in bases):
+            mcs = _SubclassMeta
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return type(MyModel).__instancecheck__(cls, instance) or getattr(type(instance), '_fast_component', False)
+
+    def __subclasscheck__(cls, subclass: type) -> bool:
+        return type(MyModel).__subclasscheck__(cls, subclass) or getattr(subclass, '_fast_component', False)
+
+
+class _SubclassMeta(ComponentMeta):
+    __instancecheck__ = type(MyModel).__instancecheck__
+    __subclasscheck__ = type(MyModel).__subclasscheck__
+
+
+class Component(MyModel, metaclass=ComponentMeta):
     cid: ComponentId = Field(default_factory=CID_GEN.new_id)
     eid: EntityId = -1
 
@@ -33,3 +57,30 @@ class Component(MyModel):
 
     def get[T:Component](self, ctype: Type[T]) -> T | None:
         return self.db.get_table(ctype).read(self.eid)
+
+
+def watch_writes(ctype: type):
+    """Record the field assignments of a component type (and of its subclasses) with Database.mark_changed.
+
+    Installed by the database on the types it tracks or indexes, the other types keep the plain assignment.
+    """
+    assign = ctype.__setattr__
+    if getattr(assign, 'watched', False):
+        return
+
+    def __setattr__(self, name: str, value: Any):
+        assign(self, name, value)
+        if name != 'db':
+            db = getattr(self, 'db', None)
+            if db is not None:
+                db.mark_changed(self.__class__, self.eid)
+
+    __setattr__.watched = True
+    __setattr__.__wrapped__ = assign
+    ctype.__setattr__ = __setattr__
+
+
+def plain_setattr(ctype: type) -> Callable[[Any, str, Any], None]:
+    """Field assignment of a component type, without the mark_changed call of watch_writes."""
+    assign = ctype.__setattr__
+    return getattr(assign, '__wrapped__', assign)
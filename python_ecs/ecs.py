@@ -1,23 +1,53 @@
+import itertools
+import threading
 import traceback
-from typing import Type
+from typing import Type, Any
 
+import numpy as np
 import time
 from loguru import logger
 
-from easy_kit.timing import time_func, timing
 from python_ecs.component import Component
 from python_ecs.component_set import ComponentSet
+from python_ecs.profiling import time_func, timing
+from python_ecs.scheduler import Scheduler, SystemUpdate
+from python_ecs.signature import Signature
 from python_ecs.storage.database import Database
-from python_ecs.storage.demography import Demography
+from python_ecs.storage.replication import DeltaWriter
 from python_ecs.system import System, SystemBag
+from python_ecs.system_index import SystemIndex
+from python_ecs.telemetry import FrameHistory, FrameStats, SystemStats
+from python_ecs.timestep import FixedTimestep, PeriodicityBuckets
 from python_ecs.types import EntityId
 
 
+SPAWN_BATCH_SIZE = 10_000
+
+
 class ECS:
-    def __init__(self, systems: list[System] = None):
-        self.db = Database()
+    def __init__(self,
+                 systems: list[System] = None,
+                 db: Database = None,
+                 scheduler: Scheduler = None,
+                 telemetry: FrameHistory = None,
+                 timestep: FixedTimestep = None,
+                 budget_sec: float = None,
+                 replication: DeltaWriter = None):
+        self.db = db or Database()
         self.systems = systems or []
-        self.last_updates = {}
+        self.scheduler = scheduler
+        self.telemetry = telemetry or FrameHistory()
+        self.timestep = timestep
+        self.budget_sec = budget_sec  # frame time after which negative priority systems are deferred
+        self.replication = replication  # delta of the database streamed at each frame end
+        self.buckets = PeriodicityBuckets()
+        self.last_updates: dict[type, float] = {}  # time of the last actual run per system class
+        self.index = SystemIndex()
+        self.time: float | None = None  # clock of the periodicity buckets (simulation time with a timestep)
+        self._last_update: float | None = None
+        self._frame: FrameStats | None = None
+        self._frame_start = 0.
+        self._system_stats: dict[int, SystemStats] = {}
 
     def find(self, stype: Type[System]):
         for sys in self.systems:
@@ -27,11 +57,91 @@ class ECS:
     def create_all(self, items: list[ComponentSet]):
         self.db.create_all(items)
 
+    @time_func
+    def spawn_many(self,
+                   component_types: list[Type[Component]],
+                   n: int,
+                   batch_size: int = SPAWN_BATCH_SIZE,
+                   **column_arrays: dict[str, Any]) -> np.ndarray:
+        """Bulk creation (see Database.spawn_many): entities are stored immediately then registered to the
+        interested systems by chunks of batch_size."""
+        eids = self.db.spawn_many(component_types, n, **column_arrays)
+        eid_list = eids.tolist()
+
+        self.index.update(self._signature_systems())
+        for sys in self.index.interested(frozenset(component_types)):
+            signature = sys._signature
+            table = self.db.get_table(signature)
+            for start in range(0, len(eid_list), batch_size):
+                chunk = eid_list[start:start + batch_size]
+                items = [self._load(signature, _) for _ in chunk]
+                if issubclass(signature, Signature):
+                    for _ in items:
+                        table.create(_)
+                for _ in chunk:
+                    self.index.register(_, sys)
+                sys.register_batch(items)
+        return eids
+
+    def register_all(self):
+        """Register every stored entity to the interested systems (e.g. after Database.load)."""
+        self.index.update(self._signature_systems())
+        for eid in sorted(self.db.entities()):
+            types = self.db.entity_types(eid)
+            items = [self.db.get_table(_).read(eid) for _ in types]
+            for sys in self.index.interested(types):
+                self._handle_birth(sys, items)
+
+    def _load(self, signature: Type[Component | Signature], eid: EntityId):
+        if issubclass(signature, Component):
+            return self.db.get_table(signature).read(eid)
+        return signature.model_construct(**{
+            name: self.db.get_table(ctype).read(eid)
+            for name, ctype in zip(signature.field_names(), signature.signature())
+        })
+
+    @property
+    def alpha(self) -> float:
+        """Interpolation factor between the last two fixed steps (1 without a fixed timestep)."""
+        return 1. if self.timestep is None else self.timestep.alpha
+
     @time_func
     def update(self):
+        """One frame: a single tick at wall time, or as many fixed steps as the elapsed time requires."""
+        for now in self._tick_times(time.time()):
+            self.tick(now)
+
+    def tick(self, now: float):
+        """Run the systems due at `now` (see PeriodicityBuckets)."""
+        due = self._begin_frame(now)
+        if self.scheduler is None:
+            for sys, elapsed in due:
+                self._update_system(sys, elapsed)
+        else:
+            self.scheduler.run(self.db, due, self._update_system)
+        self._end_frame()
+
+    def _tick_times(self, now: float) -> list[float]:
+        if self.timestep is None:
+            return [now]
+
+        step = self.timestep.step_sec
+        elapsed = step if self._last_update is None else now - self._last_update
+        self._last_update = now
+        if self.time is None:
+            self.time = now
+        return [self.time + (i + 1) * step for i in range(self.timestep.advance(elapsed))]
+
+    def _begin_frame(self, now: float) -> list[tuple[System, float]]:
+        self.time = now
+        self._frame = frame = FrameStats(index=self.telemetry.count, start=time.time())
+        self._frame_start = time.perf_counter()
+        self._system_stats = {}
+
         self.apply_demography()
+        if self.db.spatial:
+            self.db.refresh_spatial()
 
-        now = time.time()
         systems = []
         for _ in self.systems:
             if isinstance(_, SystemBag):
@@ -39,46 +149,114 @@ class ECS:
             else:
                 systems.append(_)
 
+        self.buckets.update(systems)
+        due = self.buckets.due(now)
+        running = {id(sys) for sys, _ in due}
         for sys in systems:
-            sys_key = sys.__class__
-            if sys_key not in self.last_updates:
-                self.last_updates[sys_key] = now
-            elapsed = now - self.last_updates[sys_key]
-            if elapsed < sys.periodicity_sec:
-                continue
-            self.last_updates[sys_key] = now
+            stats = SystemStats(name=sys.__class__.__name__, skipped=id(sys) not in running)
+            frame.systems.append(stats)
+            self._system_stats[id(sys)] = stats
+        return due
 
-            try:
-                with timing(f'ECS.{sys.__class__.__name__}.update'):
-                    sys.update(self.db, elapsed)
-            except Exception as e:
-                logger.error(f'{sys.__class__.__name__}: {e}\n{traceback.format_exc()}')
+    def _end_frame(self):
         self.apply_demography()
+        self.db.events.swap()
+        if self.replication is not None:
+            self.replication.write(self.db)
+        frame = self._frame
+        frame.duration = time.perf_counter() - self._frame_start
+        frame.entities = len(self.db.entities())
+        self.telemetry.record(frame)
+        self._frame = None
+
+    def _update_system(self, sys: System, elapsed: float, update: SystemUpdate = None):
+        """Budget, telemetry and update of one system: update replaces sys.update (e.g. sharded BatchSystems)."""
+        stats = self._system_stats.get(id(sys)) or SystemStats(name=sys.__class__.__name__)
+        if self._over_budget(sys):
+            # run late rather than never: a system is not deferred twice in a row
+            stats.skipped = True
+            self.buckets.defer(sys, self.time - elapsed)
+            return
+        self.last_updates[sys.__class__] = self.time
+        stats.entities = self.index.count(sys)
+        stats.thread = threading.get_ident()
+        start = time.perf_counter()
+        stats.start = start - self._frame_start
+        try:
+            with timing(f'ECS.{sys.__class__.__name__}.update'):
+                if update is None:
+                    sys.update(self.db, elapsed)
+                else:
+                    update(sys, elapsed)
+        except Exception as e:
+            stats.failed = True
+            logger.error(f'{sys.__class__.__name__}: {e}\n{traceback.format_exc()}')
+        stats.duration = time.perf_counter() - start
+
+    def _over_budget(self, sys: System) -> bool:
+        return (
+                self.budget_sec is not None
+                and sys.priority < 0
+                and id(sys) not in self.buckets.overdue
+                and time.perf_counter() - self._frame_start > self.budget_sec
+        )
 
     @time_func
     def apply_demography(self):
-        status = Demography().load(self.db.dirty)
-        self.db.dirty.clear()
+        start = time.perf_counter()
+        status = self.db.drain()
+        if self._frame is not None:
+            self._frame.births += len(status.birth)
+            self._frame.deaths += len(status.death)
 
-        systems = [_ for _ in self.systems if _._signature is not None]
-        for sys in systems:
-            for _ in status.death:
-                self._handle_death(sys, _)
-        for sys in systems:
-            for _ in status.birth:
-                self._handle_birth(sys, _)
+        born = [_[0].eid for _ in map(self._components, status.birth) if _]
+        moved = {_.eid for _ in status.added} | {eid for eid, _ in status.removed}
+        moved.difference_update(status.death, born)
+
+        self.index.update(self._signature_systems())
+        # entities changing of components are unregistered then registered again with their new components
+        for eid in itertools.chain(status.death, sorted(moved)):
+            for sys in self.index.unregister(eid):
+                self._handle_death(sys, eid)
 
         self.db.update_demography(status)
 
-    def _handle_birth(self, sys: System, items: Component | list[Component]):
+        births: dict[int, list[list[Component]]] = {}
+        for eid in itertools.chain(born, sorted(moved)):
+            items = self._current(eid)
+            if not items:
+                continue
+            for sys in self.index.interested(frozenset(_.type_id for _ in items)):
+                births.setdefault(id(sys), []).append(items)
+        for sys in self.index.systems:
+            for _ in births.get(id(sys), []):
+                self._handle_birth(sys, _)
+
+        if self._frame is not None:
+            self._frame.demography_duration += time.perf_counter() - start
+
+    def _signature_systems(self):
+        return [_ for _ in self.systems if getattr(_, '_signature', None) is not None]
+
+    @staticmethod
+    def _components(items: Component | list[Component]) -> list[Component]:
         if isinstance(items, Component):
             items = [items]
-        for item in items:
-            item.db = self.db
+        return [_ for _ in items if _ is not None]
+
+    def _current(self, eid: EntityId) -> list[Component]:
+        # storage may keep its own representation of the components (e.g. views over columns)
+        return list(filter(None, [
+            self.db.get_table(_).read(eid)
+            for _ in self.db.entity_types(eid)
+        ]))
+
+    def _handle_birth(self, sys: System, items: list[Component]):
         signature = sys._signature
         item = signature.cast(items)
         if item is not None:
             self.db.get_table(signature).create(item)
+            self.index.register(item.eid, sys)
             sys.register(item)
 
     def _handle_death(self, sys: System, eid: EntityId):
@@ -86,7 +264,9 @@ class ECS:
         item = index.read(eid)
         if item:
             sys.unregister(item)
-        index.destroy(eid)
+        if issubclass(sys._signature, Signature):
+            # component tables are cleaned by Database.update_demography
+            index.destroy(eid)
 
 
 # default simulator
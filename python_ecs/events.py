@@ -0,0 +1,148 @@
+import functools
+import threading
+import typing
+from typing import Type, Any
+
+import numpy as np
+
+from python_ecs.profiling import time_func
+
+SCALAR_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+
+class Event:
+    """Event type declaration: annotated scalar fields (int, float, bool or numpy scalar types) with optional
+    defaults. Events are never instantiated: they are rows of a numpy structured array (see EventChannel).
+
+    class Collision(Event):
+        a: int
+        b: int
+        force: float = 0.
+    """
+
+    @classmethod
+    @functools.lru_cache()
+    def dtype(cls) -> np.dtype:
+        hints = typing.get_type_hints(cls)
+        if not hints:
+            raise TypeError(f'{cls.__name__}: an event needs at least one annotated field')
+        return np.dtype([(name, SCALAR_DTYPES.get(_, _)) for name, _ in hints.items()])
+
+    @classmethod
+    @functools.lru_cache()
+    def defaults(cls) -> dict[str, Any]:
+        return {name: getattr(cls, name, 0) for name in cls.dtype().names}
+
+
+class EventChannel:
+    """Ring buffer of the events of one type, indexed by a growing sequence number.
+
+    The events of the current and previous frames are kept (see swap): a reader running once per frame never
+    misses one, older events are overwritten by the next ones. The buffer only grows when a frame emits more than
+    it can hold, so steady state emission allocates nothing.
+    """
+
+    def __init__(self, etype: Type[Event], capacity: int = 1024):
+        self.etype = etype
+        self.buffer = np.zeros(capacity, dtype=etype.dtype())
+        self.head = 0  # sequence of the next event
+        self.tail = 0  # sequence of the oldest kept event
+        self._frame = 0  # sequence of the first event of the current frame
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of kept events."""
+        return self.head - self.tail
+
+    def emit(self, **values: Any):
+        row = tuple(values.get(_, default) for _, default in self.etype.defaults().items())
+        with self._lock:
+            start = self._reserve(1)
+            self.buffer[start % len(self.buffer)] = row
+
+    @time_func
+    def emit_many(self, n: int = None, **columns: Any):
+        """Vectorized emission: one array (or scalar) per field, missing fields get their default."""
+        if n is None:
+            n = max((len(_) for _ in columns.values() if np.ndim(_) > 0), default=1)
+        if n == 0:
+            return
+        with self._lock:
+            start = self._reserve(n)
+            index = np.arange(start, start + n) % len(self.buffer)
+            for name, default in self.etype.defaults().items():
+                self.buffer[name][index] = columns.get(name, default)
+
+    def read(self, cursor: int) -> tuple[np.ndarray, int, int]:
+        """Events from sequence cursor: (events, next cursor, events missed because already overwritten)."""
+        with self._lock:
+            start = max(cursor, self.tail)
+            index = np.arange(start, self.head) % len(self.buffer)
+            return self.buffer[index], self.head, start - cursor
+
+    def swap(self):
+        """Frame boundary: the events older than the previous frame can be overwritten."""
+        with self._lock:
+            self.tail = self._frame
+            self._frame = self.head
+
+    def _reserve(self, n: int) -> int:
+        start = self.head
+        needed = start + n - self.tail
+        if needed > len(self.buffer):
+            capacity = max(1, len(self.buffer))
+            while capacity < needed:
+                capacity *= 2
+            kept = self.buffer[np.arange(self.tail, start) % len(self.buffer)]
+            self.buffer = np.zeros(capacity, dtype=self.buffer.dtype)
+            self.buffer[np.arange(self.tail, start) % capacity] = kept
+        self.head += n
+        return start
+
+
+class EventReader:
+    """Consumer of a channel with its own cursor: each event is read once, in emission order."""
+
+    def __init__(self, channel: EventChannel):
+        self.channel = channel
+        self.cursor = channel.tail
+        self.missed = 0
+
+    def __len__(self):
+        """Number of events not read yet."""
+        return self.channel.head - max(self.cursor, self.channel.tail)
+
+    def read(self) -> np.ndarray:
+        """Unread events as a structured array (one column per field: `events['force']`)."""
+        events, self.cursor, missed = self.channel.read(self.cursor)
+        self.missed += missed
+        return events
+
+
+class EventBus:
+    """Typed event channels shared by the systems of an ECS (see Database.events), swapped at each frame end."""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.channels: dict[Type[Event], EventChannel] = {}
+        self._lock = threading.Lock()
+
+    def channel(self, etype: Type[Event]) -> EventChannel:
+        if etype not in self.channels:
+            with self._lock:
+                if etype not in self.channels:
+                    self.channels[etype] = EventChannel(etype, self.capacity)
+        return self.channels[etype]
+
+    def emit(self, etype: Type[Event], **values: Any):
+        self.channel(etype).emit(**values)
+
+    def emit_many(self, etype: Type[Event], n: int = None, **columns: Any):
+        self.channel(etype).emit_many(n, **columns)
+
+    def reader(self, etype: Type[Event]) -> EventReader:
+        return EventReader(self.channel(etype))
+
+    def swap(self):
+        for _ in self.channels.values():
+            _.swap()
@@ -0,0 +1,178 @@
+import copy
+import typing
+from types import FunctionType
+from typing import Self, Type, Any, ClassVar
+
+from pydantic import TypeAdapter, Field
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined, core_schema
+
+from python_ecs.component import Component, CID_GEN
+from python_ecs.types import ComponentId, EntityId
+
+MISSING = object()
+
+
+class FastComponentMeta(type):
+    """Turn the annotated fields of the class body into __slots__, described by pydantic FieldInfo in model_fields.
+
+    `class Position(FastComponent, validate=True)` validates the field values at construction (off by default).
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], validate: bool = None, **kwargs):
+        annotations = namespace.get('__annotations__', {})
+        inherited = {}
+        for base in reversed(bases):
+            inherited.update(getattr(base, 'model_fields', {}))
+
+        own = [_ for _ in annotations if not _is_class_var(annotations[_])]
+        defaults = {_: namespace.pop(_) for _ in own if _ in namespace}
+        namespace['__slots__'] = tuple(_ for _ in own if _ not in inherited)
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        hints = typing.get_type_hints(cls)
+        fields = dict(inherited)
+        for field in own:
+            fields[field] = FieldInfo.from_annotated_attribute(hints[field], defaults.get(field, PydanticUndefined))
+        cls.model_fields = fields
+        if validate is not None:
+            cls._validate = validate
+        cls.__init__ = _make_init(fields, validate=cls._validate, strict=True)
+        cls._construct = _make_init(fields, validate=False, strict=False)
+        return cls
+
+
+def _make_init(fields: dict[str, FieldInfo], validate: bool, strict: bool) -> FunctionType:
+    """Keyword only __init__ generated for the fields (as dataclasses do): plain slot writes, no per field loop.
+
+    strict: missing required fields raise a TypeError (otherwise they are set to None).
+    Mutable (unhashable) defaults are deep copied for each instance, as pydantic does. db is assigned last, so the
+    writes of the constructor are never recorded (see watch_writes).
+    """
+    scope: dict[str, Any] = {'MISSING': MISSING, 'deepcopy': copy.deepcopy}
+    params, lines = [], []
+    for name, info in sorted(fields.items(), key=lambda _: _[0] == 'db'):
+        value = name
+        if info.default_factory is not None:
+            scope[f'_f_{name}'] = info.default_factory
+            params.append(f'{name}=MISSING')
+            value = f'_f_{name}() if {name} is MISSING else {name}'
+        elif info.default is PydanticUndefined:
+            params.append(name if strict else f'{name}=None')
+        elif _is_mutable(info.default):
+            scope[f'_d_{name}'] = info.default
+            params.append(f'{name}=MISSING')
+            value = f'deepcopy(_d_{name}) if {name} is MISSING else {name}'
+        else:
+            scope[f'_d_{name}'] = info.default
+            params.append(f'{name}=_d_{name}')
+        if validate and name != 'db':
+            scope[f'_a_{name}'] = TypeAdapter(info.annotation)
+            value = f'_a_{name}.validate_python({value})'
+        lines.append(f'    self.{name} = {value}')
+    exec(f'def __init__(self, *, {", ".join(params)}):\n' + '\n'.join(lines), scope)
+    return scope['__init__']
+
+
+def _is_mutable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return True
+    return False
+
+
+def _is_class_var(annotation: Any) -> bool:
+    return annotation is ClassVar or typing.get_origin(annotation) is ClassVar
+
+
+class FastComponent(metaclass=FastComponentMeta):
+    """Slotted plain class alternative to Component for hot, numerous component types.
+
+    Same contract as Component (eid, cid, db, get, signature, cast, model_fields, model_construct) and accepted
+    wherever a Component is (see ComponentMeta), at a fraction of the memory and construction cost. Field
+    assignments are plain slot writes, recorded like the Component ones once the type is change tracked or value
+    indexed (see watch_writes).
+    """
+    model_fields: ClassVar[dict[str, FieldInfo]]
+    _fast_component: ClassVar[bool] = True
+    _validate: ClassVar[bool] = False
+    _construct: ClassVar[FunctionType]
+
+    cid: ComponentId = Field(default_factory=CID_GEN.new_id)
+    eid: EntityId = -1
+    db: Any = None
+
+    @classmethod
+    def model_construct(cls, **kwargs: Any) -> Self:
+        """No validation, missing fields get their default (None when required)."""
+        res = cls.__new__(cls)
+        cls._construct(res, **kwargs)
+        return res
+
+    def model_dump(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.model_fields if name != 'db'}
+
+    def model_copy(self) -> Self:
+        return self.model_construct(**{name: getattr(self, name) for name in self.model_fields})
+
+    @classmethod
+    def signature(cls) -> list[Type[Self]]:
+        return [cls]
+
+    @classmethod
+    def cast(cls, items: list[Component]):
+        for item in items:
+            if isinstance(item, cls):
+                return item
+
+    @property
+    def type_id(self):
+        return self.__class__
+
+    def get[T: Component](self, ctype: Type[T]) -> T | None:
+        return self.db.get_table(ctype).read(self.eid)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, _) == getattr(other, _) for _ in self.model_fields if _ != 'db')
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for k, v in self.model_dump().items())
+        return f'{self.__class__.__name__}({values})'
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # fields of this type in pydantic models (e.g. Signature) are checked with isinstance
+        return core_schema.is_instance_schema(cls)
+
+
+PYDANTIC_ATTRIBUTES = {'model_config', 'model_fields', 'model_computed_fields', 'model_post_init'}
+
+
+def fast_component(ctype: Type[Component], validate: bool = False) -> Type[FastComponent]:
+    """Convert a Component subclass: same fields, defaults and methods, on a FastComponent base.
+
+    The result is a new class (same name and module): register it under that name in its module to keep snapshot
+    type resolution working.
+    """
+    namespace: dict[str, Any] = {'__module__': ctype.__module__, '__qualname__': ctype.__qualname__}
+    annotations = {}
+    for base in reversed(ctype.__mro__):
+        if not issubclass(base, Component) or base is Component or isinstance(base, FastComponentMeta):
+            continue
+        for name, value in vars(base).items():
+            if name in PYDANTIC_ATTRIBUTES or name.startswith(('__pydantic', '_abc')):
+                continue
+            if isinstance(value, (FunctionType, property, classmethod, staticmethod)):
+                namespace[name] = value
+    for name, info in ctype.model_fields.items():
+        if name in FastComponent.model_fields:
+            continue
+        annotations[name] = info.annotation
+        namespace[name] = info
+    namespace['__annotations__'] = annotations
+    return FastComponentMeta(ctype.__name__, (FastComponent,), namespace, validate=validate)
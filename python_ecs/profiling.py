@@ -0,0 +1,68 @@
+"""Instrumentation of the hot paths, configured once at import time.
+
+PYTHON_ECS_PROFILING environment variable:
+- `on` (default): every call is timed by easy_kit.timing
+- `off`: decorators return the function itself, no overhead at all
+- `sample:N`: one call out of N is timed (reported counts are divided by N)
+"""
+import itertools
+import os
+from contextlib import nullcontext
+from functools import wraps
+from typing import Callable
+
+from easy_kit import timing as easy_timing
+
+PROFILING_ENV = 'PYTHON_ECS_PROFILING'
+
+
+def parse_mode(raw: str) -> tuple[str, int]:
+    raw = raw.strip().lower()
+    if raw in ('', 'on', '1', 'true'):
+        return 'on', 1
+    if raw in ('off', '0', 'false'):
+        return 'off', 0
+    if raw.startswith('sample:'):
+        rate = int(raw.split(':', maxsplit=1)[1])
+        if rate < 1:
+            raise ValueError(f'{PROFILING_ENV}: sample rate must be >= 1 (got {rate})')
+        return 'sample', rate
+    raise ValueError(f'{PROFILING_ENV}: unknown mode {raw!r} (expected on, off or sample:N)')
+
+
+def sampled[**P, R](func: Callable[P, R], rate: int) -> Callable[P, R]:
+    label = func.__qualname__
+    counter = itertools.count()
+
+    @wraps(func)
+    def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+        if next(counter) % rate:
+            return func(*args, **kwargs)
+        with easy_timing.timing(label):
+            return func(*args, **kwargs)
+
+    return inner
+
+
+def time_func_for(mode: str, rate: int = 1):
+    """time_func decorator for a given mode."""
+
+    def decorator[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+        if mode == 'off':
+            return func
+        if mode == 'sample' and rate > 1:
+            return sampled(func, rate)
+        return easy_timing.time_func(func)
+
+    return decorator
+
+
+MODE, SAMPLE_RATE = parse_mode(os.environ.get(PROFILING_ENV, 'on'))
+
+time_func = time_func_for(MODE, SAMPLE_RATE)
+
+
+def timing(name: str):
+    if MODE == 'off':
+        return nullcontext()
+    return easy_timing.timing(name)
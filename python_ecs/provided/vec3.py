@@ -14,9 +14,14 @@ class Vec3(Component):
     def create(cls, x: float = 0, y: float = 0, z: float = 0):
         return cls(raw=np.array([x, y, z], dtype=float))
 
+    @classmethod
+    def view(cls, raw: np.ndarray):
+        """Unvalidated Vec3 over an existing buffer (e.g. one row of a Vec3Array): no copy, no cid drawn."""
+        return cls.model_construct(raw=raw, cid=-1)
+
     @staticmethod
     def direction(a: 'Vec3', b: 'Vec3'):
-        return Vec3(raw=b.raw - a.raw)
+        return Vec3.model_construct(raw=b.raw - a.raw, cid=-1)
 
     @property
     def x(self):
@@ -43,8 +48,8 @@ class Vec3(Component):
         self.raw[2] = value
 
     def norm(self):
-        # return np.linalg.vector_norm(self.raw)
-        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        raw = self.raw
+        return math.sqrt(raw.dot(raw))
 
     def normal(self, size: float = 1.0):
         n = self.norm()
@@ -61,7 +66,7 @@ class Vec3(Component):
     def __add__(self, other):
         if isinstance(other, Vec3):
             other = other.raw
-        return self.__class__(raw=self.raw + other)
+        return self.__class__.model_construct(raw=self.raw + other, cid=-1)
 
     def __iadd__(self, other):
         if isinstance(other, Vec3):
@@ -72,7 +77,7 @@ class Vec3(Component):
     def __sub__(self, other):
         if isinstance(other, Vec3):
             other = other.raw
-        return self.__class__(raw=self.raw - other)
+        return self.__class__.model_construct(raw=self.raw - other, cid=-1)
 
     def __isub__(self, other):
         if isinstance(other, Vec3):
@@ -83,7 +88,7 @@ class Vec3(Component):
     def __mul__(self, other):
         if isinstance(other, Vec3):
             other = other.raw
-        return self.__class__(raw=self.raw * other)
+        return self.__class__.model_construct(raw=self.raw * other, cid=-1)
 
     def __imul__(self, other):
         if isinstance(other, Vec3):
@@ -94,7 +99,7 @@ class Vec3(Component):
     def __truediv__(self, other):
         if isinstance(other, Vec3):
             other = other.raw
-        return self.__class__(raw=self.raw / other)
+        return self.__class__.model_construct(raw=self.raw / other, cid=-1)
 
     def __itruediv__(self, other):
         if isinstance(other, Vec3):
@@ -0,0 +1,128 @@
+from typing import Iterable, Self
+
+import numpy as np
+
+from python_ecs.provided.vec3 import Vec3
+
+type Operand = Vec3Array | Vec3 | np.ndarray | float
+
+
+class Vec3Array:
+    """Structure of arrays companion of Vec3: one (N, 3) float array, vector math is vectorized over the rows.
+
+    Wrapping a column does not copy it (e.g. `Vec3Array(batch.pos.raw)` in a BatchSystem), so in place operators
+    write straight into the storage. Rows are returned as Vec3 views.
+
+    Operands: Vec3Array / (N, 3) arrays are applied row by row, a Vec3, a (3,) array or a scalar to every row,
+    (N, 1) arrays are per row scalars (e.g. `arr / arr.norm()[:, None]`).
+    """
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: np.ndarray):
+        if raw.ndim != 2 or raw.shape[1] != 3:
+            raise ValueError(f'Vec3Array: expected a (N, 3) array (got {raw.shape})')
+        self.raw = raw
+
+    @classmethod
+    def zeros(cls, n: int) -> Self:
+        return cls(np.zeros((n, 3)))
+
+    @classmethod
+    def random(cls, n: int) -> Self:
+        return cls(np.random.rand(n, 3))
+
+    @classmethod
+    def stack(cls, items: Iterable[Vec3]) -> Self:
+        return cls(np.array([_.raw for _ in items], dtype=float).reshape(-1, 3))
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.raw[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.raw[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.raw[:, 2]
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self):
+        for _ in range(len(self.raw)):
+            yield self[_]
+
+    def __getitem__(self, item) -> Vec3 | Self:
+        if isinstance(item, (int, np.integer)):
+            return Vec3.view(self.raw[item])
+        return self.__class__(self.raw[item])
+
+    def __setitem__(self, item, value: Operand):
+        self.raw[item] = self._operand(value)
+
+    def copy(self) -> Self:
+        return self.__class__(self.raw.copy())
+
+    def norm(self) -> np.ndarray:
+        return np.sqrt(np.einsum('ij,ij->i', self.raw, self.raw))
+
+    def normal(self, size: float = 1.0) -> Self:
+        res = self.copy()
+        res.normalize(size)
+        return res
+
+    def normalize(self, size: float = 1.0) -> Self:
+        """In place: rows of zero norm are left unchanged."""
+        n = self.norm()
+        mask = n > 0
+        self.raw[mask] *= (size / n[mask])[:, None]
+        return self
+
+    def dot(self, other: Operand) -> np.ndarray:
+        return np.einsum('ij,ij->i', self.raw, np.broadcast_to(self._operand(other), self.raw.shape))
+
+    def cross(self, other: Operand) -> Self:
+        return self.__class__(np.cross(self.raw, self._operand(other)))
+
+    def __add__(self, other: Operand) -> Self:
+        return self.__class__(self.raw + self._operand(other))
+
+    def __iadd__(self, other: Operand) -> Self:
+        self.raw += self._operand(other)
+        return self
+
+    def __sub__(self, other: Operand) -> Self:
+        return self.__class__(self.raw - self._operand(other))
+
+    def __isub__(self, other: Operand) -> Self:
+        self.raw -= self._operand(other)
+        return self
+
+    def __mul__(self, other: Operand) -> Self:
+        return self.__class__(self.raw * self._operand(other))
+
+    def __imul__(self, other: Operand) -> Self:
+        self.raw *= self._operand(other)
+        return self
+
+    def __truediv__(self, other: Operand) -> Self:
+        return self.__class__(self.raw / self._operand(other))
+
+    def __itruediv__(self, other: Operand) -> Self:
+        self.raw /= self._operand(other)
+        return self
+
+    def __repr__(self):
+        return f'Vec3Array({self.raw!r})'
+
+    @staticmethod
+    def _operand(other: Operand) -> np.ndarray | float:
+        if isinstance(other, (Vec3Array, Vec3)):
+            return other.raw
+        if isinstance(other, np.ndarray) and other.ndim == 1 and other.shape != (3,):
+            # a (N,) array would be a vector when N == 3: per row scalars must be explicit
+            raise ValueError(f'Vec3Array: 1-D operands are vectors of shape (3,), per row scalars are (N, 1) '
+                             f'(got {other.shape})')
+        return other
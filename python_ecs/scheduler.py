@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Protocol
+
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.system import BaseSystem
+
+type SystemUpdate = Callable[[BaseSystem, float], None]
+
+
+class SystemStep(Protocol):
+    """Run one system with the frame bookkeeping (see ECS._update_system), update replaces `sys.update(db, dt)`."""
+
+    def __call__(self, sys: BaseSystem, dt: float, update: SystemUpdate = None) -> None:
+        ...
+
+
+def conflicts(a: BaseSystem, b: BaseSystem) -> bool:
+    """Two systems conflict if one writes a component type the other reads or writes (or if one is undeclared)."""
+    ra, wa, rb, wb = a.reads(), a.writes(), b.reads(), b.writes()
+    if None in (ra, wa, rb, wb):
+        return True
+    return not (wa.isdisjoint(rb | wb) and wb.isdisjoint(ra))
+
+
+def build_stages(systems: list[BaseSystem]) -> list[list[BaseSystem]]:
+    """Dependency DAG flattened into stages: a system runs after every earlier system it conflicts with.
+
+    Placement only depends on the list order, so the stages are deterministic.
+    """
+    stages: list[list[BaseSystem]] = []
+    placement: list[int] = []
+    for i, sys in enumerate(systems):
+        stage = 0
+        for j in range(i):
+            if conflicts(systems[j], sys):
+                stage = max(stage, placement[j] + 1)
+        placement.append(stage)
+        if stage == len(stages):
+            stages.append([])
+        stages[stage].append(sys)
+    return stages
+
+
+class Scheduler:
+    """Run systems on a thread pool, one stage at a time (systems of a stage do not conflict).
+
+    In deterministic mode, structural changes of a stage are recorded in per system buffers and merged in the
+    system list order, so entity ids do not depend on thread timing: entities created by a system running in a
+    thread only get their id once its stage is over.
+    """
+
+    def __init__(self, max_workers: int = None, deterministic: bool = True):
+        self.max_workers = max_workers
+        self.deterministic = deterministic
+        self.stages: list[list[BaseSystem]] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='ecs')
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(self, db: Database, items: list[tuple[BaseSystem, float]], step: SystemStep):
+        elapsed = {id(sys): dt for sys, dt in items}
+        self.stages = build_stages([sys for sys, _ in items])
+
+        for stage in self.stages:
+            if len(stage) == 1:
+                step(stage[0], elapsed[id(stage[0])])
+                continue
+            if not self.deterministic:
+                futures = [self.executor.submit(step, _, elapsed[id(_)]) for _ in stage]
+                for _ in futures:
+                    _.result()
+                continue
+
+            futures = [self.executor.submit(self._deferred, db, step, _, elapsed[id(_)]) for _ in stage]
+            for _ in futures:
+                db.merge(_.result())
+
+    @staticmethod
+    def _deferred(db: Database, step: SystemStep, sys: BaseSystem, dt: float) -> Demography:
+        with db.deferred() as buffer:
+            step(sys, dt)
+        return buffer
@@ -0,0 +1,286 @@
+import functools
+import multiprocessing
+import os
+import pickle
+import sys
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Type, Iterable
+
+import numpy as np
+
+from python_ecs.component import Component
+from python_ecs.component_set import ComponentSet
+from python_ecs.scheduler import SystemStep
+from python_ecs.signature import Signature
+from python_ecs.storage.archetype import Archetype
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.batch import Batch, Columns
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.system import BaseSystem, BatchSystem
+from python_ecs.types import EntityId
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    from multiprocessing import resource_tracker
+    # the creator (coordinator) owns the segment: keep it out of the worker tracker, which may be the coordinator one
+    register, resource_tracker.register = resource_tracker.register, lambda *_: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    name: str
+    dtype: str
+    shape: tuple[int, ...]
+
+    def attach(self, handles: dict[str, SharedMemory]) -> np.ndarray:
+        if self.name not in handles:
+            handles[self.name] = _attach(self.name)
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=handles[self.name].buf)
+
+
+@dataclass(frozen=True)
+class ArchetypeSlice:
+    """Rows [start:stop] of an archetype living in shared memory (the columns of the system signature)."""
+    eids: SharedArray
+    columns: dict[Type[Component], dict[str, SharedArray]]
+    start: int
+    stop: int
+
+    def batch[T: Signature | Component](self, signature: Type[T], handles: dict[str, SharedMemory]) -> Batch[T]:
+        return Batch(signature, self.eids.attach(handles)[self.start:self.stop], {
+            ctype: Columns(ctype, {
+                name: _.attach(handles)[self.start:self.stop]
+                for name, _ in columns.items()
+            })
+            for ctype, columns in self.columns.items()
+        })
+
+
+class SharedColumnPool:
+    """Move archetype columns into shared memory: the archetype keeps working on the shared arrays.
+
+    When an archetype grows its columns are reallocated as plain arrays, they are shared again at the next sync.
+    """
+
+    def __init__(self):
+        self._arrays: dict[int, tuple[np.ndarray, SharedMemory, SharedArray]] = {}
+
+    def share(self, data: np.ndarray) -> tuple[np.ndarray, SharedArray]:
+        entry = self._arrays.get(id(data))
+        if entry is not None and entry[0] is data:
+            return data, entry[2]
+        shm = SharedMemory(create=True, size=max(data.nbytes, 1))
+        array = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        array[...] = data
+        ref = SharedArray(name=shm.name, dtype=data.dtype.str, shape=data.shape)
+        self._arrays[id(array)] = (array, shm, ref)
+        return array, ref
+
+    def sync(self,
+             archetype: Archetype,
+             types: list[Type[Component]]) -> tuple[SharedArray, dict[Type[Component], dict[str, SharedArray]]]:
+        """Share the eids and the columns of the given component types (object columns can not be shared)."""
+        for ctype in types:
+            for name, data in archetype.columns[ctype].items():
+                if data.dtype == object:
+                    raise TypeError(f'ShardedScheduler: {ctype.__name__}.{name} is an object column, '
+                                    f'only numeric columns can be shared with the workers')
+        archetype.eids, eids = self.share(archetype.eids)
+        refs = {}
+        for ctype in types:
+            columns = archetype.columns[ctype]
+            refs[ctype] = {}
+            for name, data in columns.items():
+                columns[name], refs[ctype][name] = self.share(data)
+        return eids, refs
+
+    def release_unused(self, archetypes: Iterable[Archetype]):
+        live = set()
+        for archetype in archetypes:
+            live.add(id(archetype.eids))
+            for columns in archetype.columns.values():
+                live.update(id(_) for _ in columns.values())
+        for key in list(self._arrays):
+            if key not in live:
+                self._release(key)
+
+    def close(self):
+        for key in list(self._arrays):
+            self._release(key)
+
+    def _release(self, key: int):
+        array, shm, _ = self._arrays.pop(key)
+        del array
+        try:
+            shm.close()
+        except BufferError:
+            pass  # still referenced by a view: the mapping is freed with it
+        shm.unlink()
+
+
+class ShardDatabase:
+    """Structural changes recorded by a worker, merged by the coordinator at the frame barrier."""
+
+    def __init__(self):
+        self.dirty = Demography()
+
+    def create_all(self, items: list[ComponentSet]):
+        self.dirty.with_birth(items)
+
+    def destroy_all(self, items: Component | Signature | list[Component | Signature]):
+        self.dirty.with_death(items)
+
+    def destroy_entities(self, eids: Iterable[EntityId]):
+        self.dirty.death.update(int(_) for _ in eids)
+
+    def add_component(self, eid: EntityId, item: Component):
+        self.dirty.with_component(eid, item)
+
+    def remove_component(self, eid: EntityId, ctype: Type[Component]):
+        self.dirty.without_component(eid, ctype)
+
+
+# system key, pickled system (None when the worker copy is up to date), dt, slices of the worker
+type ShardTask = tuple[int, bytes | None, float, list[ArchetypeSlice]]
+
+
+def _worker(conn: Connection):
+    handles: dict[str, SharedMemory] = {}
+    systems: dict[int, BatchSystem] = {}
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        tasks: list[ShardTask] = message
+        _release_stale(handles, tasks)
+
+        db = ShardDatabase()
+        try:
+            for key, state, dt, slices in tasks:
+                if state is not None:
+                    systems[key] = pickle.loads(state)
+                system = systems[key]
+                for _ in slices:
+                    system.update_batch(db, _.batch(system._signature, handles), dt)
+            conn.send((None, db.dirty))
+        except Exception as e:
+            conn.send((f'{e}\n{traceback.format_exc()}', None))
+    _release_stale(handles, [])
+
+
+def _release_stale(handles: dict[str, SharedMemory], tasks: list[ShardTask]):
+    names = set()
+    for *_, slices in tasks:
+        for item in slices:
+            names.add(item.eids.name)
+            names.update(ref.name for columns in item.columns.values() for ref in columns.values())
+    for name in list(handles):
+        if name not in names:
+            try:
+                handles.pop(name).close()
+            except BufferError:
+                pass
+
+
+class ShardedScheduler:
+    """Split the rows of every archetype across worker processes for BatchSystem updates.
+
+    Component columns live in shared memory, so workers update their slice in place with no pickling (object
+    columns can not be shared: a BatchSystem reading one fails). Each BatchSystem update is one round over the
+    workers, run through the ECS step (telemetry, frame budget), other systems run in the coordinator in list
+    order. Structural changes of the workers are merged (in worker order) at the frame barrier and applied by
+    ECS.apply_demography. Requires an ArchetypeDatabase.
+
+    Workers keep their copy of each system across frames, it is sent again when the coordinator copy changes:
+    state set by update_batch stays in the worker (one copy per worker) and is not seen by the coordinator.
+    """
+
+    def __init__(self, workers: int = None, context: str = None):
+        self.workers = workers or os.cpu_count()
+        self.context = multiprocessing.get_context(context)
+        self.pool = SharedColumnPool()
+        self._processes: list[multiprocessing.Process] = []
+        self._pipes: list[Connection] = []
+        self._sent: dict[int, bytes] = {}  # last state of each system sent to the workers
+
+    def start(self):
+        if self._processes:
+            return
+        for _ in range(self.workers):
+            parent, child = self.context.Pipe()
+            process = self.context.Process(target=_worker, args=(child,), daemon=True)
+            process.start()
+            self._pipes.append(parent)
+            self._processes.append(process)
+
+    def close(self):
+        for _ in self._pipes:
+            _.send(None)
+        for _ in self._processes:
+            _.join()
+        self._pipes.clear()
+        self._processes.clear()
+        self._sent.clear()
+        self.pool.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def run(self, db: Database, items: list[tuple[BaseSystem, float]], step: SystemStep):
+        if not isinstance(db, ArchetypeDatabase):
+            raise TypeError(f'ShardedScheduler: requires an ArchetypeDatabase (got {type(db).__name__})')
+        for sys, dt in items:
+            if isinstance(sys, BatchSystem):
+                step(sys, dt, functools.partial(self._dispatch, db))
+            else:
+                step(sys, dt)
+
+    def _dispatch(self, db: ArchetypeDatabase, sys: BatchSystem, dt: float):
+        """One round: every worker updates its slice of the matching archetypes."""
+        self.start()
+        types = sys._signature.signature()
+        slices: list[list[ArchetypeSlice]] = [[] for _ in range(self.workers)]
+        for archetype in db.archetypes_with(types):
+            if archetype.size == 0:
+                continue
+            eids, columns = self.pool.sync(archetype, types)
+            for w in range(self.workers):
+                start = w * archetype.size // self.workers
+                stop = (w + 1) * archetype.size // self.workers
+                if start < stop:
+                    slices[w].append(ArchetypeSlice(eids, columns, start, stop))
+        self.pool.release_unused(db.archetypes.values())
+
+        state = pickle.dumps(sys)
+        if self._sent.get(id(sys)) == state:
+            state = None
+        else:
+            self._sent[id(sys)] = state
+        for pipe, _ in zip(self._pipes, slices):
+            pipe.send([(id(sys), state, dt, _)])
+        errors = []
+        for pipe in self._pipes:
+            error, buffer = pipe.recv()
+            if error is not None:
+                errors.append(error)
+                continue
+            db.merge(buffer)
+        for ctype in sys._writes or ():
+            if ctype in db.changes.versions or ctype in db.value_indexes:
+                db.mark_changed(ctype, db.entity_array(types))
+        if errors:
+            raise RuntimeError(f'{sys.__class__.__name__}: failed in {len(errors)} worker(s)\n' + '\n'.join(errors))
@@ -1,11 +1,11 @@
 import functools
-from typing import Type
+from typing import Type, Self
 
 from pydantic import model_validator
 
 from easy_config.my_model import MyModel
-from easy_kit.timing import time_func
 from python_ecs.component import Component
+from python_ecs.profiling import time_func
 from python_ecs.types import EntityId
 
 
@@ -34,37 +34,79 @@ class Signature(MyModel):
         return list(sorted(cls.model_fields.keys()))
 
     @classmethod
-    @time_func
-    # @functools.lru_cache()
-    def field_mapping(cls):
+    @functools.lru_cache()
+    def field_mapping(cls) -> dict[Type[Component], str]:
+        """Shared (cached) mapping: do not mutate."""
         return dict(zip(cls.signature(), cls.field_names()))
 
     @classmethod
-    def match(cls, items: list[Component]):
-        mapping = cls.field_mapping()
-        for item in items:
-            name = mapping.pop(item.type_id)
-        return len(mapping) == 0
+    @functools.lru_cache()
+    def matcher(cls) -> 'SignatureMatcher':
+        return SignatureMatcher(cls)
+
+    @classmethod
+    def match(cls, items: list[Component]) -> bool:
+        return cls.matcher().offsets(items) is not None
 
     @classmethod
     @time_func
     def cast(cls, items: list[Component]):
-        mapping = cls.field_mapping()
-        if len(items) < len(mapping):
+        offsets = cls.matcher().offsets(items)
+        if offsets is None:
             return None
+        return cls.model_construct(**{name: items[_] for name, _ in offsets})
 
-        res = cls.model_construct()
-        for item in items:
-            name = mapping.pop(item.type_id, None)
-            if name is not None:
-                setattr(res, name, item)
-        if len(mapping) > 0:
+    def bind(self, items: list[Component]) -> Self | None:
+        """Point this instance to the components of another entity (no allocation): a reusable view for loops."""
+        offsets = self.matcher().offsets(items)
+        if offsets is None:
             return None
-        return res
+        for name, _ in offsets:
+            self.__dict__[name] = items[_]
+        return self
 
     @model_validator(mode='after')
     def post_init(self):
         for name, _ in self.model_fields.items():
-            if not isinstance(_.annotation, type(Component)):
+            if not (isinstance(_.annotation, type) and issubclass(_.annotation, Component)):
                 raise ValueError(f'Signature: {name} type is [{_.annotation}] (must be a Component)')
         return self
+
+
+class SignatureMatcher:
+    """Compiled matching of component lists against a Signature.
+
+    A failed match only scans the item types (no allocation), a successful one maps the tuple of item types to
+    the (field name, item offset) pairs, computed once per distinct layout.
+    """
+
+    def __init__(self, signature: Type[Signature]):
+        self.required = frozenset(signature.signature())
+        self.mapping = signature.field_mapping()
+        self.layouts: dict[tuple[Type[Component], ...], tuple[tuple[str, int], ...] | None] = {}
+
+    def offsets(self, items: list[Component]) -> tuple[tuple[str, int], ...] | None:
+        required = self.required
+        if len(items) < len(required):
+            return None
+        hits = 0
+        for item in items:
+            if item.type_id in required:
+                hits += 1
+        if hits < len(required):
+            return None
+
+        key = tuple(_.type_id for _ in items)
+        if key not in self.layouts:
+            self.layouts[key] = self._layout(key)
+        return self.layouts[key]
+
+    def _layout(self, key: tuple[Type[Component], ...]) -> tuple[tuple[str, int], ...] | None:
+        res = {}
+        for i, ctype in enumerate(key):
+            if ctype in self.required:
+                res.setdefault(self.mapping[ctype], i)
+        if len(res) < len(self.required):
+            # duplicated types
+            return None
+        return tuple(res.items())
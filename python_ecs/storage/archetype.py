@@ -0,0 +1,220 @@
+import functools
+from typing import Type, Any, Iterable
+
+import numpy as np
+
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+INITIAL_CAPACITY = 16
+RESERVED_FIELDS = ('eid', 'db')
+SCALAR_DTYPES = {
+    bool: np.bool_,
+    int: np.int64,
+    float: np.float64,
+}
+
+type ArchetypeKey = frozenset[Type[Component]]
+
+
+@functools.lru_cache()
+def component_fields(ctype: Type[Component]) -> list[str]:
+    return [_ for _ in ctype.model_fields if _ not in RESERVED_FIELDS]
+
+
+def column_spec(annotation: Any, value: Any) -> tuple[np.dtype, tuple[int, ...]]:
+    while hasattr(annotation, '__supertype__'):
+        annotation = annotation.__supertype__
+    if annotation in SCALAR_DTYPES:
+        return np.dtype(SCALAR_DTYPES[annotation]), ()
+    if isinstance(value, np.ndarray):
+        return value.dtype, value.shape
+    return np.dtype(object), ()
+
+
+def to_column(ctype: Type[Component], name: str, values: list[Any]) -> np.ndarray:
+    dtype, shape = column_spec(ctype.model_fields[name].annotation, values[0] if values else None)
+    res = allocate(dtype, shape, len(values))
+    if dtype == object:
+        for i, value in enumerate(values):
+            res[i] = value
+    elif values:
+        res[...] = values
+    return res
+
+
+def component_block(ctype: Type[Component], n: int, cids: Iterable[int], values: dict[str, Any]) -> dict[str, np.ndarray]:
+    """Full columns for n new components: given values must have one row per component, defaults are broadcast."""
+    unknown = set(values) - set(component_fields(ctype))
+    if unknown:
+        raise ValueError(f'{ctype.__name__}: unknown fields {sorted(unknown)}')
+
+    res = {'cid': np.fromiter(cids, dtype=np.int64, count=n)}
+    for name in component_fields(ctype):
+        if name == 'cid':
+            continue
+        info = ctype.model_fields[name]
+        if name in values:
+            data = np.asarray(values[name])
+            if len(data) != n:
+                raise ValueError(f'{ctype.__name__}.{name}: expected {n} rows, got {len(data)}')
+            dtype, shape = column_spec(info.annotation, data[0])
+            res[name] = allocate(dtype, shape, n)
+            res[name][...] = data
+            continue
+        default = info.get_default(call_default_factory=True)
+        dtype, shape = column_spec(info.annotation, default)
+        res[name] = allocate(dtype, shape, n)
+        if dtype == object and info.default_factory is not None:
+            res[name][0] = default
+            for i in range(1, n):
+                res[name][i] = info.default_factory()
+        else:
+            res[name][...] = default
+    return res
+
+
+def allocate(dtype: np.dtype, shape: tuple[int, ...], capacity: int) -> np.ndarray:
+    if dtype == object:
+        return np.full((capacity, *shape), None, dtype=object)
+    return np.zeros((capacity, *shape), dtype=dtype)
+
+
+class Archetype:
+    """Entities sharing the exact same component type set, stored as one numpy column per component field.
+
+    Rows [0:size] are valid, removal swaps the last row into the hole so the storage stays contiguous.
+    """
+
+    def __init__(self, types: ArchetypeKey):
+        self.types = types
+        self.size = 0
+        self.capacity = 0
+        self.eids = np.zeros(0, dtype=np.int64)
+        self.columns: dict[Type[Component], dict[str, np.ndarray]] = {_: {} for _ in types}
+
+    def __repr__(self):
+        names = ', '.join(sorted(_.__name__ for _ in self.types))
+        return f'Archetype[{names}](size={self.size})'
+
+    @property
+    def entities(self) -> np.ndarray:
+        return self.eids[:self.size]
+
+    def column(self, ctype: Type[Component], name: str) -> np.ndarray:
+        return self.columns[ctype][name][:self.size]
+
+    def reserve(self, n: int):
+        required = self.size + n
+        if required <= self.capacity:
+            return
+        capacity = max(self.capacity, INITIAL_CAPACITY)
+        while capacity < required:
+            capacity *= 2
+
+        self.eids = self._grow(self.eids, capacity)
+        for columns in self.columns.values():
+            for name, data in columns.items():
+                columns[name] = self._grow(data, capacity)
+        self.capacity = capacity
+
+    def append(self, eid: EntityId, components: dict[Type[Component], Component]) -> int:
+        self.reserve(1)
+        row = self.size
+        for ctype, item in components.items():
+            self._ensure_columns(ctype, item)
+            self.write(ctype, row, item)
+        self.eids[row] = eid
+        self.size += 1
+        return row
+
+    def append_block(self, eids: np.ndarray, blocks: dict[Type[Component], dict[str, np.ndarray]]) -> int:
+        """Append n rows at once (see component_block), returns the first row."""
+        n = len(eids)
+        self.reserve(n)
+        start = self.size
+        for ctype, block in blocks.items():
+            columns = self.columns[ctype]
+            for name, data in block.items():
+                if name not in columns:
+                    columns[name] = allocate(data.dtype, data.shape[1:], self.capacity)
+                columns[name][start:start + n] = data
+        self.eids[start:start + n] = eids
+        self.size += n
+        return start
+
+    def append_from(self, source: 'Archetype', row: int, components: dict[Type[Component], Component]) -> int:
+        """Copy one row of source (restricted to the types of this archetype) then set the extra components."""
+        self.reserve(1)
+        target = self.size
+        for ctype in self.types:
+            if ctype in components:
+                self._ensure_columns(ctype, components[ctype])
+                self.write(ctype, target, components[ctype])
+                continue
+            for name, data in source.columns[ctype].items():
+                if name not in self.columns[ctype]:
+                    self.columns[ctype][name] = allocate(data.dtype, data.shape[1:], self.capacity)
+                self.columns[ctype][name][target] = data[row]
+        self.eids[target] = source.eids[row]
+        self.size += 1
+        return target
+
+    def remove(self, row: int) -> EntityId | None:
+        """Swap-remove a row: returns the entity moved into that row (if any)."""
+        last = self.size - 1
+        moved = None
+        for columns in self.columns.values():
+            for data in columns.values():
+                if row != last:
+                    data[row] = data[last]
+                if data.dtype == object:
+                    data[last] = None
+        if row != last:
+            self.eids[row] = self.eids[last]
+            moved = EntityId(int(self.eids[row]))
+        self.size -= 1
+        return moved
+
+    def remove_rows(self, rows: Iterable[int]) -> list[tuple[EntityId, int]]:
+        """Batched swap-remove: surviving rows past the new size fill the holes, returns (moved entity, new row)."""
+        rows = np.unique(np.fromiter(rows, dtype=np.int64))
+        if len(rows) == 0:
+            return []
+        size = self.size - len(rows)
+        holes = rows[rows < size]
+        tail = np.setdiff1d(np.arange(size, self.size), rows, assume_unique=True)
+        for columns in self.columns.values():
+            for data in columns.values():
+                data[holes] = data[tail]
+                if data.dtype == object:
+                    data[size:self.size] = None
+        self.eids[holes] = self.eids[tail]
+        self.size = size
+        return list(zip(self.eids[holes].tolist(), holes.tolist()))
+
+    def write(self, ctype: Type[Component], row: int, item: Component):
+        columns = self.columns[ctype]
+        for name in component_fields(ctype):
+            columns[name][row] = getattr(item, name)
+
+    def read(self, ctype: Type[Component], row: int) -> dict[str, Any]:
+        return {
+            name: data[row].copy() if data.ndim > 1 else data.item(row)
+            for name, data in self.columns[ctype].items()
+        }
+
+    def _ensure_columns(self, ctype: Type[Component], item: Component):
+        columns = self.columns[ctype]
+        if columns:
+            return
+        for name in component_fields(ctype):
+            annotation = ctype.model_fields[name].annotation
+            dtype, shape = column_spec(annotation, getattr(item, name))
+            columns[name] = allocate(dtype, shape, self.capacity)
+
+    @staticmethod
+    def _grow(data: np.ndarray, capacity: int):
+        res = allocate(data.dtype, data.shape[1:], capacity)
+        res[:len(data)] = data
+        return res
@@ -0,0 +1,329 @@
+from typing import Type, Iterable, Iterator, Any, override
+
+import numpy as np
+
+from python_ecs.component import Component
+from python_ecs.signature import Signature
+from python_ecs.storage.archetype import Archetype, ArchetypeKey, component_fields, to_column, allocate
+from python_ecs.storage.batch import Batch, Columns
+from python_ecs.storage.component_view import ComponentView
+from python_ecs.storage.database import Database
+from python_ecs.storage.index import Index
+from python_ecs.storage.snapshot import Section, type_name
+from python_ecs.types import EntityId
+
+
+class ComponentTable[T: Component]:
+    """Index-like access to one component type of an ArchetypeDatabase: items are ComponentView rows."""
+
+    def __init__(self, db: 'ArchetypeDatabase', ttype: Type[T]):
+        self.db = db
+        self.ttype = ttype
+
+    @property
+    def entities(self) -> set[EntityId]:
+        return set(self.db.entity_array([self.ttype]).tolist())
+
+    def list_all(self, eids: Iterable[EntityId] = None) -> list[T]:
+        if eids is not None:
+            return list(map(self.read, eids))
+        return [
+            ComponentView(self.db, self.ttype, eid)
+            for eid in self.db.entity_array([self.ttype]).tolist()
+        ]
+
+    def create(self, item: T):
+        self.db.attach(item.eid, item)
+
+    def read(self, eid: EntityId) -> T | None:
+        location = self.db.locate(eid)
+        if location is None or self.ttype not in location[0].types:
+            return None
+        return ComponentView(self.db, self.ttype, eid)
+
+    def read_any(self) -> T:
+        for archetype in self.db.archetypes_with([self.ttype]):
+            if archetype.size > 0:
+                return ComponentView(self.db, self.ttype, EntityId(int(archetype.eids[0])))
+        raise StopIteration
+
+    def destroy(self, eid: EntityId):
+        item = self.read(eid)
+        if item is None:
+            return None
+        res = item.load()
+        self.db.detach(eid, self.ttype)
+        return res
+
+    def destroy_all(self, eids: Iterable[EntityId]):
+        for _ in eids:
+            self.destroy(_)
+
+
+class ArchetypeDatabase(Database):
+    """Columnar storage: entities are grouped by archetype (their exact component type set).
+
+    Each component field is a contiguous numpy column, adding or removing a component moves exactly one row
+    between archetypes. Signature tables are kept as plain Index (they hold views over the columns).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.archetypes: dict[ArchetypeKey, Archetype] = {}
+        self._location: dict[EntityId, tuple[Archetype, int]] = {}
+        self._matching: dict[ArchetypeKey, list[Archetype]] = {}
+
+    def locate(self, eid: EntityId) -> tuple[Archetype, int] | None:
+        return self._location.get(eid)
+
+    @override
+    def entity_types(self, eid: EntityId) -> frozenset[Type[Component]]:
+        location = self._location.get(eid)
+        if location is None:
+            return frozenset()
+        return location[0].types
+
+    def get_archetype(self, types: Iterable[Type[Component]]) -> Archetype:
+        key = frozenset(types)
+        if key not in self.archetypes:
+            archetype = Archetype(key)
+            self.archetypes[key] = archetype
+            for query, matching in self._matching.items():
+                if query <= key:
+                    matching.append(archetype)
+        return self.archetypes[key]
+
+    def archetypes_with(self, types: Iterable[Type[Component]]) -> list[Archetype]:
+        key = frozenset(types)
+        if key not in self._matching:
+            self._matching[key] = [_ for _ in self.archetypes.values() if key <= _.types]
+        return self._matching[key]
+
+    def entity_array(self, types: Iterable[Type[Component]]) -> np.ndarray:
+        chunks = [_.entities for _ in self.archetypes_with(types) if _.size > 0]
+        if not chunks:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(chunks)
+
+    @override
+    def get_table[T:Component | Signature](self, ttype: Type[T]) -> Index[T]:
+        if ttype not in self.tables:
+            if issubclass(ttype, Component):
+                self.tables[ttype] = ComponentTable(self, ttype)
+            else:
+                self.tables[ttype] = Index(ttype=ttype)
+        return self.tables[ttype]
+
+    @override
+    def find_any[T: Component](self, what: Type[T], having: list[Type[Component]] = None) -> T:
+        for archetype in self.archetypes_with([what, *(having or [])]):
+            if archetype.size > 0:
+                return ComponentView(self, what, EntityId(int(archetype.eids[0])))
+
+    @override
+    def batches[T: Component | Signature](self, signature: Type[T]) -> Iterator[Batch[T]]:
+        """One batch per matching archetype: arrays are views over the columns (no copy, no commit needed)."""
+        types = signature.signature()
+        for archetype in self.archetypes_with(types):
+            if archetype.size == 0:
+                continue
+            yield Batch(signature, archetype.entities, {
+                ctype: Columns(ctype, {
+                    name: archetype.column(ctype, name)
+                    for name in archetype.columns[ctype]
+                })
+                for ctype in types
+            })
+
+    def attach(self, eid: EntityId, item: Component):
+        """Add (or overwrite) one component of an existing entity: one row move."""
+        ctype = item.type_id
+        source, row = self._location[eid]
+        if ctype in source.types:
+            if not isinstance(item, ComponentView):
+                source.write(ctype, row, item)
+                self.mark_changed(ctype, eid)
+            return
+        target = self.get_archetype(source.types | {ctype})
+        self._move(eid, target, {ctype: item})
+        self._match_queries(eid)
+        self._match_spatial([eid])
+        self.changes.mark(ctype, [eid])
+
+    def detach(self, eid: EntityId, ctype: Type[Component]):
+        """Remove one component of an existing entity: one row move."""
+        location = self._location.get(eid)
+        if location is None or ctype not in location[0].types:
+            return
+        target = self.get_archetype(location[0].types - {ctype})
+        self._move(eid, target, {})
+        self._match_queries(eid)
+        self._match_spatial([eid])
+
+    # -----------------------------------------------------------------------------
+
+    @override
+    def _create_entity(self, eid: EntityId, components: list[Component]):
+        components = {_.type_id: _ for _ in components}
+        archetype = self.get_archetype(components.keys())
+        row = archetype.append(eid, components)
+        self._location[eid] = (archetype, row)
+
+    @override
+    def _spawn_block(self, eids: np.ndarray, blocks: dict[Type[Component], dict[str, np.ndarray]]):
+        archetype = self.get_archetype(blocks.keys())
+        start = archetype.append_block(eids, blocks)
+        for row, eid in enumerate(eids.tolist(), start=start):
+            self._location[eid] = (archetype, row)
+
+    @override
+    def _sections(self) -> list[Section]:
+        sections = []
+        for archetype in sorted(self.archetypes.values(), key=lambda _: sorted(map(type_name, _.types))):
+            if archetype.size == 0:
+                continue
+            order = np.argsort(archetype.entities, kind='stable')
+            ctypes = sorted(archetype.types, key=type_name)
+            sections.append(Section(ctypes, archetype.entities[order], {
+                ctype: {name: data[:archetype.size][order] for name, data in archetype.columns[ctype].items()}
+                for ctype in ctypes
+            }))
+        return sections
+
+    @override
+    def _restore_section(self, section: Section):
+        """Columns of the section are used as is (memory mapped when loaded with mmap=True)."""
+        archetype = self.get_archetype(section.types)
+        archetype.eids = section.eids
+        for ctype, columns in section.columns.items():
+            archetype.columns[ctype].update(columns)
+        archetype.size = archetype.capacity = len(section.eids)
+        for row, eid in enumerate(section.eids.tolist()):
+            self._location[eid] = (archetype, row)
+
+    @override
+    def _create_entities(self, types: frozenset[Type[Component]], items: list[list[Component]]):
+        """Births of one archetype are appended as a single block (the given instances are only copied)."""
+        rows = [{_.type_id: _ for _ in components} for components in items]
+        eids = np.array([_[0].eid for _ in items], dtype=np.int64)
+        self._spawn_block(eids, {
+            ctype: {
+                name: to_column(ctype, name, [getattr(_[ctype], name) for _ in rows])
+                for name in component_fields(ctype)
+            }
+            for ctype in types
+        })
+
+    @override
+    def _set_components(self, eid: EntityId, added: dict[Type[Component], Component], removed: set[Type[Component]]):
+        """All the changes of an entity are applied with one row move."""
+        source, row = self._location[eid]
+        types = (source.types - removed) | added.keys()
+        if types == source.types:
+            for ctype, item in added.items():
+                source.write(ctype, row, item)
+        else:
+            self._move(eid, self.get_archetype(types), added)
+
+    @override
+    def _destroy_entities(self, eids: set[EntityId]):
+        """Rows are removed archetype by archetype (see Archetype.remove_rows)."""
+        groups: dict[Archetype, tuple[list[int], list[EntityId]]] = {}
+        for eid in eids:
+            location = self._location.pop(eid, None)
+            if location is None:
+                continue
+            rows, group = groups.setdefault(location[0], ([], []))
+            rows.append(location[1])
+            group.append(eid)
+        for archetype, (rows, group) in groups.items():
+            for moved, row in archetype.remove_rows(rows):
+                self._location[moved] = (archetype, row)
+            for table in self._signature_tables(archetype.types):
+                table.destroy_all(group)
+
+    @override
+    def _component_types(self) -> set[Type[Component]]:
+        return {ctype for _ in self.archetypes.values() if _.size > 0 for ctype in _.types}
+
+    @override
+    def _read_columns(self, ctype: Type[Component], eids: list[EntityId]) -> dict[str, np.ndarray]:
+        """Gathered archetype by archetype."""
+        if not eids:
+            return super()._read_columns(ctype, eids)
+        res = {}
+        for archetype, (positions, rows) in self._rows(eids).items():
+            for name, data in archetype.columns[ctype].items():
+                if name not in res:
+                    res[name] = allocate(data.dtype, data.shape[1:], len(eids))
+                res[name][positions] = data[rows]
+        return res
+
+    @override
+    def _field_values(self, ctype: Type[Component], field: str, eids: Iterable[EntityId]) -> list[Any]:
+        """Gathered from the field column archetype by archetype (no row view built)."""
+        eids = list(eids)
+        res = None
+        for archetype, (positions, rows) in self._rows(eids).items():
+            data = archetype.column(ctype, field)
+            if res is None:
+                res = allocate(data.dtype, data.shape[1:], len(eids))
+            res[positions] = data[rows]
+        return [] if res is None else list(res) if res.ndim > 1 else res.tolist()
+
+    @override
+    def _write_columns(self, ctype: Type[Component], eids: list[EntityId], columns: dict[str, np.ndarray]):
+        for archetype, (positions, rows) in self._rows(eids).items():
+            for name, data in columns.items():
+                archetype.columns[ctype][name][rows] = data[positions]
+        self.mark_changed(ctype, eids)
+
+    def _rows(self, eids: list[EntityId]) -> dict[Archetype, tuple[list[int], list[int]]]:
+        """Positions in eids and rows of the entities, per archetype."""
+        res = {}
+        for i, eid in enumerate(eids):
+            archetype, row = self._location[eid]
+            positions, rows = res.setdefault(archetype, ([], []))
+            positions.append(i)
+            rows.append(row)
+        return res
+
+    @override
+    def _union_tables(self, signature: list[Type[Component]]) -> set[EntityId]:
+        res = set()
+        for _ in signature:
+            res.update(self.entity_array([_]).tolist())
+        return res
+
+    @override
+    def _intersect_tables(self, signature: list[Type[Component]]) -> set[EntityId]:
+        return set(self.entity_array(signature).tolist())
+
+    def _signature_tables(self, types: frozenset[Type[Component]]) -> list[Index]:
+        return [_ for _ in self._tables_of(types) if isinstance(_, Index)]
+
+    @override
+    def _positions(self, ctype: Type[Component], eids: Iterable[EntityId] = None) -> tuple[np.ndarray, np.ndarray]:
+        if eids is not None:
+            eids = list(eids)
+            positions = np.zeros((len(eids), 3))
+            for archetype, (index, rows) in self._rows(eids).items():
+                positions[index] = archetype.column(ctype, 'raw')[rows]
+            return np.array(eids, dtype=np.int64), positions
+        archetypes = [_ for _ in self.archetypes_with([ctype]) if _.size > 0]
+        if not archetypes:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 3))
+        return (
+            np.concatenate([_.entities for _ in archetypes]),
+            np.concatenate([_.column(ctype, 'raw') for _ in archetypes]),
+        )
+
+    def _move(self, eid: EntityId, target: Archetype, components: dict[Type[Component], Component]):
+        source, row = self._location[eid]
+        self._location[eid] = (target, target.append_from(source, row, components))
+        self._remove_row(source, row)
+
+    def _remove_row(self, archetype: Archetype, row: int):
+        moved = archetype.remove(row)
+        if moved is not None:
+            self._location[moved] = (archetype, row)
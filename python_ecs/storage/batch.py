@@ -0,0 +1,81 @@
+from typing import Type, Any, Iterable
+
+import numpy as np
+
+from python_ecs.component import Component, plain_setattr
+from python_ecs.signature import Signature
+from python_ecs.storage.archetype import component_fields
+from python_ecs.types import EntityId
+
+
+class Columns:
+    """Field arrays of one component type: `columns.x` is the array of all x values of the batch."""
+
+    def __init__(self, ctype: Type[Component], arrays: dict[str, np.ndarray]):
+        object.__setattr__(self, 'ctype', ctype)
+        object.__setattr__(self, 'arrays', arrays)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.arrays[name]
+        except KeyError:
+            raise AttributeError(f'{self.ctype.__name__}: no column {name}')
+
+    def __setattr__(self, name: str, value: Any):
+        current = self.__getattr__(name)
+        if value is not current:
+            current[...] = value
+
+
+class Batch[T: Signature | Component]:
+    """All matching entities of a signature, as numpy arrays.
+
+    For a Signature, columns are reached through its field names (`batch.pos.x`), for a Component directly
+    (`batch.x`). Arrays must be modified in place, `commit()` writes them back to the storage when they are
+    copies.
+    """
+
+    def __init__(self, signature: Type[T], eids: np.ndarray, columns: dict[Type[Component], Columns]):
+        self.signature = signature
+        self.eids = eids
+        self.columns = columns
+        self._items: dict[Type[Component], list[Component]] = {}
+
+    def __len__(self):
+        return len(self.eids)
+
+    def __getattr__(self, name: str):
+        signature = self.__dict__['signature']
+        if issubclass(signature, Signature):
+            mapping = dict(zip(signature.field_names(), signature.signature()))
+            if name in mapping:
+                return self.columns[mapping[name]]
+        else:
+            return getattr(self.columns[signature], name)
+        raise AttributeError(name)
+
+    @staticmethod
+    def gather(signature: Type[T], eids: Iterable[EntityId], tables: dict[Type[Component], Any]) -> 'Batch[T]':
+        """Copy the fields of the given components into fresh arrays (storage agnostic)."""
+        eids = list(eids)
+        res = Batch(signature, np.array(eids, dtype=np.int64), {})
+        for ctype, table in tables.items():
+            items = table.list_all(eids)
+            res._items[ctype] = items
+            res.columns[ctype] = Columns(ctype, {
+                name: np.array([getattr(_, name) for _ in items])
+                for name in component_fields(ctype)
+            })
+        return res
+
+    def commit(self):
+        """Write the arrays back to the components, the caller records the writes (see BatchSystem.update)."""
+        for ctype, items in self._items.items():
+            assign = plain_setattr(ctype)
+            for name, data in self.columns[ctype].arrays.items():
+                if data.ndim > 1:
+                    for item, value in zip(items, data):
+                        getattr(item, name)[...] = value
+                else:
+                    for item, value in zip(items, data.tolist()):
+                        assign(item, name, value)
@@ -0,0 +1,80 @@
+import threading
+from typing import Type, Iterable
+
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+
+class ChangeTracker:
+    """Per component type change versions: the last version each entity component was written at.
+
+    Only the types registered with track() are recorded, marking any other type is a no-op. Entries are kept
+    ordered by version, so changed() walks back from the most recent write and costs O(changed).
+    """
+
+    def __init__(self):
+        self.version = 1  # 0 is before any write
+        self.versions: dict[Type[Component], dict[EntityId, int]] = {}
+        self._lock = threading.Lock()
+
+    def track(self, ctype: Type[Component]):
+        self.versions.setdefault(ctype, {})
+
+    def tick(self) -> int:
+        with self._lock:
+            self.version += 1
+            return self.version
+
+    def mark(self, ctype: Type[Component], eids: Iterable[EntityId]):
+        versions = self.versions.get(ctype)
+        if versions is None:
+            return
+        eids = list(eids)
+        for _ in eids:
+            versions.pop(_, None)
+        versions.update(dict.fromkeys(eids, self.version))
+
+    def changed(self, ctype: Type[Component], since: int) -> set[EntityId]:
+        """Entities whose ctype component was written after version `since`."""
+        res = set()
+        for eid, version in reversed(self.versions.get(ctype, {}).items()):
+            if version <= since:
+                break
+            res.add(eid)
+        return res
+
+    def forget(self, eids: Iterable[EntityId]):
+        eids = list(eids)
+        for versions in self.versions.values():
+            for _ in eids:
+                versions.pop(_, None)
+
+
+class Journal:
+    """Structural changes applied since the last drain: born and dead entities, removed components.
+
+    Entities born then destroyed within the same period are dropped from both sets.
+    """
+
+    def __init__(self):
+        self.born: set[EntityId] = set()
+        self.dead: set[EntityId] = set()
+        self.removed: set[tuple[EntityId, Type[Component]]] = set()
+
+    def birth(self, eids: Iterable[EntityId]):
+        self.born.update(eids)
+
+    def death(self, eids: Iterable[EntityId]):
+        eids = set(eids)
+        self.dead.update(eids - self.born)
+        self.born.difference_update(eids)
+        if self.removed:
+            self.removed = {_ for _ in self.removed if _[0] not in eids}
+
+    def remove(self, eid: EntityId, ctype: Type[Component]):
+        self.removed.add((eid, ctype))
+
+    def drain(self) -> tuple[set[EntityId], set[EntityId], set[tuple[EntityId, Type[Component]]]]:
+        res = self.born, self.dead, self.removed
+        self.born, self.dead, self.removed = set(), set(), set()
+        return res
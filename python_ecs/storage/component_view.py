@@ -0,0 +1,115 @@
+import inspect
+from typing import Type, Any, TYPE_CHECKING
+
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+if TYPE_CHECKING:
+    from python_ecs.storage.archetype_database import ArchetypeDatabase
+
+BINARY_OPERATORS = ('add', 'sub', 'mul', 'matmul', 'truediv', 'floordiv', 'mod', 'pow', 'lshift', 'rshift', 'and', 'xor',
+                    'or')
+FORWARDED = (
+    *(f'__{_}__' for _ in BINARY_OPERATORS),
+    *(f'__r{_}__' for _ in BINARY_OPERATORS),
+    *(f'__i{_}__' for _ in BINARY_OPERATORS),
+    '__neg__', '__pos__', '__abs__', '__invert__',
+    '__lt__', '__le__', '__gt__', '__ge__',
+)
+
+
+class ComponentView:
+    """Thin proxy over one row of an archetype: behaves like an instance of the viewed Component type.
+
+    Field reads and writes go straight to the columns, methods and properties of the Component class are
+    bound to the view, so existing Component subclasses keep working unchanged. Operator and ordering dunders are
+    forwarded too (`view + Vec3(...)`), equality and hash compare the viewed row.
+    """
+    __slots__ = ('_db', '_ctype', '_eid')
+
+    def __init__(self, db: 'ArchetypeDatabase', ctype: Type[Component], eid: EntityId):
+        object.__setattr__(self, '_db', db)
+        object.__setattr__(self, '_ctype', ctype)
+        object.__setattr__(self, '_eid', eid)
+
+    @property
+    def __class__(self):
+        return self._ctype
+
+    @property
+    def eid(self) -> EntityId:
+        return self._eid
+
+    @property
+    def db(self) -> 'ArchetypeDatabase':
+        return self._db
+
+    def load(self) -> Component:
+        """Materialize the row as a detached Component instance."""
+        return self._ctype.model_construct(eid=self._eid, db=self._db, **self._row_values())
+
+    def _columns(self):
+        archetype, row = self._db.locate(self._eid)
+        return archetype.columns[self._ctype], row
+
+    def _row_values(self):
+        archetype, row = self._db.locate(self._eid)
+        return archetype.read(self._ctype, row)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        columns, row = self._columns()
+        if name in columns:
+            data = columns[name]
+            if data.ndim > 1:
+                return data[row]
+            return data.item(row)
+        attr = inspect.getattr_static(self._ctype, name)
+        if hasattr(attr, '__get__'):
+            return attr.__get__(self, self._ctype)
+        return attr
+
+    def __setattr__(self, name: str, value: Any):
+        columns, row = self._columns()
+        if name in columns:
+            columns[name][row] = value
+            self._db.mark_changed(self._ctype, self._eid)
+            return
+        attr = inspect.getattr_static(self._ctype, name, None)
+        if isinstance(attr, property) and attr.fset is not None:
+            attr.fset(self, value)
+            self._db.mark_changed(self._ctype, self._eid)
+            return
+        raise AttributeError(f'{self._ctype.__name__}: can not set attribute {name}')
+
+    def __eq__(self, other):
+        if isinstance(other, ComponentView):
+            return (self._db, self._ctype, self._eid) == (other._db, other._ctype, other._eid)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._db), self._ctype, self._eid))
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for k, v in self._row_values().items())
+        return f'{self._ctype.__name__}View(eid={self._eid}, {values})'
+
+
+def _forward(name: str):
+    """Dunder of ComponentView calling the one of the viewed Component type (special methods bypass __getattr__)."""
+
+    def method(self: ComponentView, *args: Any) -> Any:
+        impl = getattr(self._ctype, name, None)
+        if impl is not None:
+            return impl(self, *args)
+        if args:
+            return NotImplemented
+        raise TypeError(f'bad operand type for {name}: {self._ctype.__name__!r}')
+
+    method.__name__, method.__qualname__ = name, f'ComponentView.{name}'
+    return method
+
+
+for _name in FORWARDED:
+    setattr(ComponentView, _name, _forward(_name))
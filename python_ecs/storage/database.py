@@ -1,34 +1,252 @@
-from typing import Type, override
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Type, Iterator, Any, Self, Iterable, override
 
-from easy_kit.timing import time_func
-from python_ecs.component import Component
+import numpy as np
+
+from python_ecs.component import Component, CID_GEN, watch_writes
 from python_ecs.component_set import ComponentSet, flatten_components
+from python_ecs.events import EventBus
+from python_ecs.profiling import time_func
 from python_ecs.signature import Signature
+from python_ecs.storage.archetype import component_block, component_fields, to_column
+from python_ecs.storage.batch import Batch
+from python_ecs.storage.changes import ChangeTracker, Journal
 from python_ecs.storage.database_api import DatabaseAPI
 from python_ecs.storage.demography import Demography
-from python_ecs.storage.id_generator import IdGenerator
+from python_ecs.storage.entity_allocator import EntityAllocator
 from python_ecs.storage.index import Index
+from python_ecs.storage.pool import ComponentPool
+from python_ecs.storage.query import Query, QueryKey, query_key
+from python_ecs.storage.relations import Relation, CHILD_OF
+from python_ecs.storage.replication import Delta
+from python_ecs.storage.snapshot import Snapshot, Section, PathLike, type_name
+from python_ecs.storage.spatial import SpatialIndex, Point
+from python_ecs.storage.value_index import ValueIndex, SortedIndex, IndexKind, INDEX_KINDS
 from python_ecs.types import EntityId
 
-EID_GEN = IdGenerator()
-
 
 class Database(DatabaseAPI):
     def __init__(self):
         self._entities: set[EntityId] = set()
         self.tables: dict[Type[Component | Signature], Index] = {}
-        self.dirty: Demography = Demography()
+        self._dirty: Demography = Demography()
+        self._local = threading.local()
+        self.queries: dict[QueryKey, Query] = {}
+        self._types: dict[EntityId, frozenset[Type[Component]]] = {}
+        self.spatial: dict[Type[Component], SpatialIndex] = {}
+        self.value_indexes: dict[Type[Component], dict[str, ValueIndex]] = {}
+        self.relations: dict[str, Relation] = {CHILD_OF: Relation(CHILD_OF, exclusive=True, cascade=True)}
+        self.events = EventBus()
+        self.journal: Journal | None = None  # structural changes recorded for replication (see encode_delta)
+        self.pool: ComponentPool | None = None  # recycles the components of destroyed entities
+        self.changes = ChangeTracker()
+        self.allocator = EntityAllocator()  # entity id space of this database
+
+    @property
+    def dirty(self) -> Demography:
+        """Pending structural changes: the thread local buffer inside deferred(), the shared one otherwise."""
+        buffer = getattr(self._local, 'dirty', None)
+        if buffer is not None:
+            return buffer
+        return self._dirty
+
+    @contextmanager
+    def deferred(self) -> Iterator[Demography]:
+        """Record the structural changes of the current thread in a private buffer (see merge)."""
+        previous = getattr(self._local, 'dirty', None)
+        buffer = Demography()
+        self._local.dirty = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.dirty = previous
 
     @override
-    def find_any[T: Component](self, what: Type[T], having: list[Type[Component]] = None) -> T:
-        table = self.get_table(what)
-        eids = table.entities
-        for _ in having or []:
-            eids.intersection_update(self.get_table(_).entities)
+    def merge(self, buffer: Demography):
+        """Give entity ids to deferred births then queue them: merging in a fixed order keeps ids deterministic.
+
+        Inside an enclosing deferred() block, the buffer is only appended to the enclosing one.
+        """
+        outer = getattr(self._local, 'dirty', None)
+        if outer is not None:
+            outer.load(buffer)
+            return
+        for components in buffer.birth:
+            eid = self.allocator.new_id()
+            for _ in components:
+                _.eid = eid
+        self._dirty.load(buffer)
 
+    @override
+    def find_any[T: Component](self, what: Type[T], having: list[Type[Component]] = None) -> T:
+        signature = [what, *(having or [])]
+        query = self.queries.get(query_key(all=signature))
+        eids = query.entities if query is not None else self._intersect_tables(signature)
         if eids:
             eid = next(iter(eids))
-            return table.read(eid)
+            return self.get_table(what).read(eid)
+
+    @override
+    def register_query(self, query: Query) -> Query:
+        if query.key not in self.queries:
+            query.entities.clear()
+            for eid in self._entities:
+                if query.matches(self.entity_types(eid)):
+                    query.entities.add(eid)
+            self.queries[query.key] = query
+        return self.queries[query.key]
+
+    def query(self,
+              all: list[Type[Component]] = None,
+              any: list[Type[Component]] = None,
+              none: list[Type[Component]] = None) -> Query:
+        """Declare (or get) a query: it is maintained on every birth, death and component change from now on."""
+        key = query_key(all, any, none)
+        if key not in self.queries:
+            self.register_query(Query(all=key[0], any=key[1], none=key[2]))
+        return self.queries[key]
+
+    def entity_types(self, eid: EntityId) -> frozenset[Type[Component]]:
+        return self._types.get(eid, frozenset())
+
+    def is_alive(self, eid: EntityId) -> bool:
+        """False for stale ids (their slot was released, and maybe reused by another entity)."""
+        return self.allocator.alive(eid)
+
+    @override
+    def track_changes(self, ctype: Type[Component]):
+        """Start recording the writes of a component type, the entities having it count as changed."""
+        if ctype not in self.changes.versions:
+            watch_writes(ctype)
+            self.changes.track(ctype)
+            self.changes.mark(ctype, sorted(self.intersect_entities([ctype])))
+
+    @override
+    def mark_changed(self, ctype: Type[Component], eids: EntityId | Iterable[EntityId]):
+        """Record a write (done automatically for births, BatchSystem updates of their declared `_writes` and the
+        field assignments of tracked or indexed types).
+
+        In place modifications of array fields (e.g. `vec.raw[0] = 1`) are not detected.
+        """
+        if ctype not in self.changes.versions and ctype not in self.value_indexes:
+            return
+        if isinstance(eids, int):
+            eids = [eids]
+        elif isinstance(eids, np.ndarray):
+            eids = eids.tolist()
+        self.changes.mark(ctype, eids)
+        for index in self.value_indexes.get(ctype, {}).values():
+            # components of dead entities (or detached) may still be written
+            stored = [_ for _ in eids if _ in index]
+            index.update(stored, self._field_values(ctype, index.field, stored))
+
+    @override
+    def changed_entities(self, types: list[Type[Component]], since: int) -> set[EntityId]:
+        res = set()
+        for _ in types:
+            res.update(self.changes.changed(_, since))
+        return res
+
+    @override
+    def tick(self) -> int:
+        return self.changes.tick()
+
+    def spatial_index(self, ctype: Type[Component], cell_size: float = 1.0) -> SpatialIndex:
+        """Grid index over the positions of a Vec3 component type, kept up to date on births and deaths.
+
+        Moves are picked up by refresh_spatial (called by ECS.update at each frame): the type is change tracked,
+        see mark_changed for the writes that are detected.
+        """
+        if ctype not in self.spatial:
+            self.track_changes(ctype)
+            index = SpatialIndex(ctype, cell_size)
+            index.insert(*self._positions(ctype))
+            index.since = self.changes.version
+            self.tick()
+            self.spatial[ctype] = index
+        return self.spatial[ctype]
+
+    @time_func
+    def refresh_spatial(self):
+        """Move the entities whose position was written since the previous refresh."""
+        for ctype, index in self.spatial.items():
+            since, index.since = index.since, self.changes.version
+            self.tick()
+            # components removed since then are already out of the index
+            eids = sorted(_ for _ in self.changes.changed(ctype, since) if ctype in self.entity_types(_))
+            if eids:
+                index.update(*self._positions(ctype, eids))
+
+    def query_radius(self, center: Point, radius: float, ctype: Type[Component] = None) -> np.ndarray:
+        return self._spatial(ctype).query_radius(center, radius)
+
+    def query_box(self, low: Point, high: Point, ctype: Type[Component] = None) -> np.ndarray:
+        return self._spatial(ctype).query_box(low, high)
+
+    def k_nearest(self, center: Point, k: int, ctype: Type[Component] = None) -> np.ndarray:
+        return self._spatial(ctype).k_nearest(center, k)
+
+    @override
+    def value_index(self, ctype: Type[Component], field: str, kind: IndexKind = 'hash') -> ValueIndex:
+        """Secondary index on a component field: 'hash' for equality, 'sorted' for ranges and top k.
+
+        Kept up to date on births, deaths, component changes and field writes (see mark_changed).
+        """
+        indexes = self.value_indexes.setdefault(ctype, {})
+        if field not in indexes:
+            watch_writes(ctype)
+            index = INDEX_KINDS[kind](ctype, field)
+            eids = sorted(self.intersect_entities([ctype]))
+            index.insert(eids, self._field_values(ctype, field, eids))
+            indexes[field] = index
+        elif not isinstance(indexes[field], INDEX_KINDS[kind]):
+            raise ValueError(f'{ctype.__name__}.{field} already has a {type(indexes[field]).__name__}')
+        return indexes[field]
+
+    @override
+    def find_by(self, ctype: Type[Component], field: str, value: Any) -> set[EntityId]:
+        return self._value_index(ctype, field).find(value)
+
+    @override
+    def find_range(self, ctype: Type[Component], field: str, low: Any = None, high: Any = None) -> list[EntityId]:
+        return self._value_index(ctype, field, SortedIndex).range(low, high)
+
+    @override
+    def find_top(self, ctype: Type[Component], field: str, k: int, largest: bool = True) -> list[EntityId]:
+        return self._value_index(ctype, field, SortedIndex).top(k, largest)
+
+    def component_pool(self, max_size: int = 1024) -> ComponentPool:
+        """Enable the recycling of the components dropped by the database (see ComponentPool.acquire).
+
+        Once enabled, the components of destroyed entities (or removed from an entity) are reset and reused by
+        acquire: do not keep references to them. Spawning does not go through the pool: build the new components with
+        pool.acquire. Only the instances owned by the database are recycled, so ArchetypeDatabase (which copies the
+        given components into its columns) recycles nothing: the caller may release its own instances once created.
+        """
+        if self.pool is None:
+            self.pool = ComponentPool(max_size)
+        return self.pool
+
+    @override
+    def relation(self, name: str = CHILD_OF, exclusive: bool = False, cascade: bool = False) -> Relation:
+        """Declare (or get) a relation between entities, the CHILD_OF hierarchy is always declared."""
+        if name not in self.relations:
+            self.relations[name] = Relation(name, exclusive=exclusive, cascade=cascade)
+        return self.relations[name]
+
+    @override
+    def link(self, source: EntityId, target: EntityId, name: str = CHILD_OF):
+        """Immediate (not deferred): both entities must have an id, links of destroyed entities are removed."""
+        for _ in (source, target):
+            if not self.is_alive(_):
+                raise ValueError(f'{name}: {_} is not a live entity')
+        self._relation(name).link(source, target)
+
+    @override
+    def unlink(self, source: EntityId, target: EntityId = None, name: str = CHILD_OF):
+        self._relation(name).unlink(source, target)
 
     @override
     def entities(self):
@@ -37,61 +255,478 @@ class Database(DatabaseAPI):
     @override
     def create_all(self, items: list[ComponentSet]):
         items = list(map(flatten_components, items))
-        for components in items:
-            eid = EID_GEN.new_id()
-            for _ in components:
-                _.eid = eid
+        if getattr(self._local, 'dirty', None) is None:
+            for components in items:
+                eid = self.allocator.new_id()
+                for _ in components:
+                    _.eid = eid
 
         self.dirty.with_birth(items)
 
+    @override
+    @time_func
+    def spawn_many(self, component_types: list[Type[Component]], n: int, **column_arrays: dict[str, Any]) -> np.ndarray:
+        """Create n entities at once, applied immediately (no Demography, no validation).
+
+        column_arrays maps a component class name to its field values (one row per entity), missing fields get
+        their default: `spawn_many([Position, Speed], n, Position={'x': xs}, Speed={'x': vx, 'y': vy})`
+        """
+        names = {_.__name__ for _ in component_types}
+        unknown = set(column_arrays) - names
+        if unknown:
+            raise ValueError(f'spawn_many: unknown component types {sorted(unknown)}')
+
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        eids = self.allocator.gen(n)
+        blocks = {
+            ctype: component_block(ctype, n, CID_GEN.gen(n), column_arrays.get(ctype.__name__, {}))
+            for ctype in component_types
+        }
+        self._spawn_block(eids, blocks)
+
+        eid_list = eids.tolist()
+        self._entities.update(eid_list)
+        self._match_block(frozenset(component_types), eid_list)
+        if self.journal is not None:
+            self.journal.birth(eid_list)
+        return eids
+
     @override
     def destroy_all(self, items: Component | Signature | list[Component | Signature]):
         self.dirty.with_death(items)
 
+    @override
+    def add_component(self, eid: EntityId, item: Component):
+        self.dirty.with_component(eid, item)
+
+    @override
+    def remove_component(self, eid: EntityId, ctype: Type[Component]):
+        self.dirty.without_component(eid, ctype)
+
+    def drain(self) -> Demography:
+        """Pending structural changes, replaced by an empty buffer."""
+        res, self._dirty = self._dirty, Demography()
+        self._cascade(res.death)
+        return res
+
     @override
     def get_table[T:Component | Signature](self, ttype: Type[T]) -> Index[T]:
         if ttype not in self.tables:
             self.tables[ttype] = Index(ttype=ttype)
         return self.tables[ttype]
 
+    @override
+    def batches[T: Component | Signature](self, signature: Type[T]) -> Iterator[Batch[T]]:
+        types = signature.signature()
+        eids = sorted(self.intersect_entities(types))
+        if eids:
+            yield Batch.gather(signature, eids, {_: self.get_table(_) for _ in types})
+
+    def save(self, path: PathLike):
+        """Columnar binary snapshot (see storage.snapshot): one section per archetype, rows sorted by entity id."""
+        self.snapshot().save(path)
+
+    @classmethod
+    def load(cls, path: PathLike, mmap: bool = True) -> Self:
+        """Restore a snapshot with its entity id space, the component id generator is moved past the saved counter."""
+        snapshot = Snapshot.load(path, mmap=mmap)
+        db = cls()
+        for _ in snapshot.sections:
+            db._restore_section(_)
+        db._entities.update(snapshot.entities.tolist())
+        db.allocator.restore(snapshot.generations, snapshot.free)
+        CID_GEN.restore(snapshot.cid_gen)
+        return db
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(
+            sections=self._sections(),
+            entities=np.array(sorted(self._entities), dtype=np.int64),
+            generations=self.allocator.generations[:self.allocator.size],
+            free=np.array(self.allocator.free, dtype=np.int64),
+            cid_gen=CID_GEN.last_id,
+        )
+
+    @time_func
+    def encode_delta(self, frame: int, since: int, keyframe: bool = False) -> tuple[Delta, int]:
+        """Changes since the previous delta (change version since), with the version to give to the next call.
+
+        Every component type is change tracked from the first call, a keyframe holds the whole database.
+        """
+        if self.journal is None:
+            self.journal = Journal()
+        for ctype in self._component_types():
+            self.track_changes(ctype)
+
+        if keyframe:
+            self.journal.drain()
+            snapshot = self.snapshot()
+            delta = Delta(frame, keyframe=True, births=snapshot.sections,
+                          generations=snapshot.generations, free=snapshot.free)
+        else:
+            born, dead, removed = self.journal.drain()
+            births = defaultdict(list)
+            for eid in sorted(born):
+                births[self.entity_types(eid)].append(eid)
+            removals = defaultdict(list)
+            for eid, ctype in sorted(removed, key=lambda _: _[0]):
+                removals[ctype].append(eid)
+
+            changes = []
+            for ctype in self._component_types():
+                # written then removed components are in `removed`
+                eids = sorted(
+                    _ for _ in self.changes.changed(ctype, since)
+                    if _ not in born and ctype in self.entity_types(_)
+                )
+                if eids:
+                    changes.append(Section([ctype], np.array(eids, dtype=np.int64), {
+                        ctype: self._read_columns(ctype, eids)
+                    }))
+            delta = Delta(
+                frame,
+                deaths=np.array(sorted(dead), dtype=np.int64),
+                births=[self._section(types, eids) for types, eids in births.items() if types],
+                changes=changes,
+                removed={ctype: np.array(eids, dtype=np.int64) for ctype, eids in removals.items()},
+            )
+
+        version = self.changes.version
+        self.tick()
+        return delta, version
+
+    @time_func
+    def apply_delta(self, delta: Delta):
+        """Replay the changes of another database (entity ids are kept): deaths, births, removed then written
+        components, a keyframe replaces the whole content."""
+        if delta.keyframe:
+            self.update_demography(Demography(death=set(self._entities)))
+            self.allocator.restore(delta.generations, delta.free)
+        else:
+            self.update_demography(Demography(death=delta.deaths.tolist()))
+
+        for section in delta.births:
+            self.allocator.claim(section.eids.tolist())
+            self._spawn_block(section.eids, section.columns)
+            eids = section.eids.tolist()
+            self._entities.update(eids)
+            self._match_block(frozenset(section.types), eids)
+
+        status = Demography(removed=[
+            (eid, ctype)
+            for ctype, eids in delta.removed.items()
+            for eid in eids.tolist()
+        ])
+        for section in delta.changes:
+            ctype, = section.types
+            columns = section.columns[ctype]
+            eids = section.eids.tolist()
+            present = np.array([ctype in self.entity_types(_) for _ in eids], dtype=bool)
+            if present.any():
+                self._write_columns(ctype, section.eids[present].tolist(), {
+                    name: data[present] for name, data in columns.items()
+                })
+            # components added to existing entities
+            rows = {name: data.tolist() if data.ndim == 1 else data for name, data in columns.items()}
+            for i in np.flatnonzero(~present).tolist():
+                status.with_component(eids[i], ctype.model_construct(**{name: _[i] for name, _ in rows.items()}))
+        self.update_demography(status)
+
     @time_func
     def union_entities(self, signature: list[Type[Component]]):
-        res = set()
-        for _ in signature:
-            res.update(self.tables[_].by_entity.keys())
-        return res
+        """Read from a declared query if any (see query), from the tables otherwise."""
+        if not signature:
+            return set()
+        query = self.queries.get(query_key(any=signature))
+        if query is not None:
+            return set(query.entities)
+        return self._union_tables(signature)
 
     @time_func
     def intersect_entities(self, signature: list[Type[Component]]):
+        """Read from a declared query if any (see query), from the tables otherwise."""
         if not signature:
             return set()
-        first = signature[0]
-        if first not in self.tables:
-            return set()
-
-        res = self.tables[first].entities
-        for _ in signature[1:]:
-            res.intersection_update(self.tables[_].entities)
-            if not res:
-                return res
-        return res
+        query = self.queries.get(query_key(all=signature))
+        if query is not None:
+            return set(query.entities)
+        return self._intersect_tables(signature)
 
     # -----------------------------------------------------------------------------
 
     @time_func
     def update_demography(self, status: Demography):
-        death = status.death
+        death = self._cascade(status.death)
 
         self._entities.difference_update(death)
-        for table in self.tables.values():
-            table.destroy_all(death)
-
-        birth = filter(None, status.birth)
-        for components in birth:
-            self._entities.add(components[0].eid)
-            for c in components:
-                if c is None:
-                    continue
-                c.db = self
-                ctype = c.type_id
-                self.get_table(ctype).create(c)
+        for query in self.queries.values():
+            query.entities.difference_update(death)
+        for index in self.spatial.values():
+            index.remove(death)
+        for indexes in self.value_indexes.values():
+            for index in indexes.values():
+                index.remove(death)
+        self.changes.forget(death)
+        for relation in self.relations.values():
+            relation.forget(death)
+        self._destroy_entities(death)
+        self.allocator.release(death)
+        if self.journal is not None:
+            self.journal.death(death)
+
+        groups: dict[frozenset[Type[Component]], list[list[Component]]] = defaultdict(list)
+        for components in filter(None, status.birth):
+            components = [_ for _ in components if _ is not None]
+            # entities destroyed in the same buffer are never stored: their slot is already released
+            if components and components[0].eid not in death:
+                groups[frozenset(_.type_id for _ in components)].append(components)
+        for types, items in groups.items():
+            eids = [_[0].eid for _ in items]
+            self._entities.update(eids)
+            self._create_entities(types, items)
+            self._match_block(types, eids)
+            if self.journal is not None:
+                self.journal.birth(eids)
+
+        updates = self._component_changes(status, death)
+        for eid, (added, removed) in updates.items():
+            if self.journal is not None:
+                for _ in removed & self.entity_types(eid):
+                    self.journal.remove(eid, _)
+            self._set_components(eid, added, removed)
+            self._match_queries(eid)
+            for _ in added:
+                self.mark_changed(_, eid)
+        self._match_spatial(list(updates))
+
+    def _component_changes(self, status: Demography,
+                           death: set[EntityId]) -> dict[EntityId, tuple[dict[Type[Component], Component], set]]:
+        """Added and removed component types per living entity (a removal wins over an addition).
+
+        Ops of the entities destroyed by the same flush (death, cascade included) are dropped.
+        """
+        res = {}
+        for item in status.added:
+            if item.eid not in death and item.eid in self._entities:
+                added, removed = res.setdefault(item.eid, ({}, set()))
+                added[item.type_id] = item
+        for eid, ctype in status.removed:
+            if eid not in death and eid in self._entities:
+                added, removed = res.setdefault(eid, ({}, set()))
+                added.pop(ctype, None)
+                removed.add(ctype)
+        return res
+
+    def _union_tables(self, signature: list[Type[Component]]) -> set[EntityId]:
+        res = set()
+        for _ in signature:
+            if _ in self.tables:
+                res.update(self.tables[_].by_entity.keys())
+        return res
+
+    def _intersect_tables(self, signature: list[Type[Component]]) -> set[EntityId]:
+        if any(_ not in self.tables for _ in signature):
+            return set()
+        tables = sorted((self.tables[_] for _ in signature), key=lambda _: len(_.by_entity))
+        res = set(tables[0].by_entity.keys())
+        for _ in tables[1:]:
+            res.intersection_update(_.by_entity.keys())
+            if not res:
+                break
+        return res
+
+    def _match_block(self, types: frozenset[Type[Component]], eids: list[EntityId]):
+        """Index new entities sharing the same component types."""
+        for query in self.queries.values():
+            if query.matches(types):
+                query.entities.update(eids)
+        for ctype, index in self.spatial.items():
+            if ctype in types:
+                index.insert(*self._positions(ctype, eids))
+        for ctype, indexes in self.value_indexes.items():
+            if ctype in types:
+                for index in indexes.values():
+                    index.insert(eids, self._field_values(ctype, index.field, eids))
+        for ctype in types:
+            self.changes.mark(ctype, eids)
+
+    def _match_queries(self, eid: EntityId):
+        types = self.entity_types(eid)
+        for query in self.queries.values():
+            if query.matches(types):
+                query.entities.add(eid)
+            else:
+                query.entities.discard(eid)
+        for ctype, indexes in self.value_indexes.items():
+            for index in indexes.values():
+                if ctype in types:
+                    index.update([eid], self._field_values(ctype, index.field, [eid]))
+                else:
+                    index.remove([eid])
+
+    def _match_spatial(self, eids: list[EntityId]):
+        """Insert (remove) in one block the entities that gained (lost) a spatially indexed component type."""
+        for ctype, index in self.spatial.items():
+            entering, leaving = [], []
+            for eid in eids:
+                if ctype in self.entity_types(eid):
+                    if eid not in index:
+                        entering.append(eid)
+                elif eid in index:
+                    leaving.append(eid)
+            if leaving:
+                index.remove(leaving)
+            if entering:
+                index.insert(*self._positions(ctype, entering))
+
+    def _spatial(self, ctype: Type[Component] = None) -> SpatialIndex:
+        if ctype is None:
+            if len(self.spatial) != 1:
+                raise ValueError(f'spatial query: expected a component type ({len(self.spatial)} spatial indexes)')
+            return next(iter(self.spatial.values()))
+        if ctype not in self.spatial:
+            raise KeyError(f'no spatial index on {ctype.__name__} (see Database.spatial_index)')
+        return self.spatial[ctype]
+
+    def _relation(self, name: str) -> Relation:
+        if name not in self.relations:
+            raise KeyError(f'unknown relation {name!r} (see Database.relation)')
+        return self.relations[name]
+
+    def _cascade(self, death: set[EntityId]) -> set[EntityId]:
+        """Add (in place) the entities destroyed with death through cascading relations."""
+        cascading = [_ for _ in self.relations.values() if _.cascade and _.sources]
+        while cascading and death:
+            size = len(death)
+            for relation in cascading:
+                death.update(relation.descendants(death))
+            if len(death) == size:
+                break
+        return death
+
+    def _value_index(self, ctype: Type[Component], field: str, kind: Type[ValueIndex] = ValueIndex) -> ValueIndex:
+        index = self.value_indexes.get(ctype, {}).get(field)
+        if index is None:
+            raise KeyError(f'no value index on {ctype.__name__}.{field} (see Database.value_index)')
+        if not isinstance(index, kind):
+            raise TypeError(f'{ctype.__name__}.{field}: {kind.__name__} needed (got {type(index).__name__})')
+        return index
+
+    def _field_values(self, ctype: Type[Component], field: str, eids: Iterable[EntityId]) -> list[Any]:
+        table = self.get_table(ctype)
+        return [getattr(table.read(_), field) for _ in eids]
+
+    def _positions(self, ctype: Type[Component], eids: Iterable[EntityId] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Entity ids and (N, 3) positions of a Vec3 component type (all the entities having it by default)."""
+        if eids is None:
+            eids = sorted(self.intersect_entities([ctype]))
+        table = self.get_table(ctype)
+        eids = list(eids)
+        positions = np.array([table.read(_).raw for _ in eids], dtype=float).reshape(-1, 3)
+        return np.array(eids, dtype=np.int64), positions
+
+    def _destroy_entities(self, eids: set[EntityId]):
+        groups = defaultdict(list)
+        for eid in eids:
+            groups[self._types.pop(eid, frozenset())].append(eid)
+        for types, group in groups.items():
+            # unknown types (entities stored behind the database back): look everywhere
+            tables = self._tables_of(types) if types else self.tables.values()
+            for table in tables:
+                if self.pool is not None and issubclass(table.ttype, Component):
+                    self.pool.release(filter(None, map(table.destroy, group)))
+                else:
+                    table.destroy_all(group)
+
+    def _tables_of(self, types: frozenset[Type[Component]]) -> list[Index]:
+        """Tables that can hold an entity of these component types (its components and matching signatures)."""
+        return [
+            table for ttype, table in self.tables.items()
+            if ttype in types or (issubclass(ttype, Signature) and types.issuperset(ttype.signature()))
+        ]
+
+    def _sections(self) -> list[Section]:
+        types = defaultdict(set)
+        for ttype, table in self.tables.items():
+            if issubclass(ttype, Component):
+                for eid in table.by_entity:
+                    types[eid].add(ttype)
+        groups = defaultdict(list)
+        for eid in self._entities:
+            groups[frozenset(types[eid])].append(eid)
+
+        return [
+            self._section(key, sorted(groups[key]))
+            for key in sorted(groups, key=lambda _: sorted(map(type_name, _)))
+        ]
+
+    def _component_types(self) -> set[Type[Component]]:
+        return {_ for _ in self.tables if issubclass(_, Component)}
+
+    def _section(self, types: frozenset[Type[Component]], eids: list[EntityId]) -> Section:
+        ctypes = sorted(types, key=type_name)
+        return Section(ctypes, np.array(eids, dtype=np.int64), {
+            ctype: self._read_columns(ctype, eids)
+            for ctype in ctypes
+        })
+
+    def _write_columns(self, ctype: Type[Component], eids: list[EntityId], columns: dict[str, np.ndarray]):
+        """Overwrite the fields of stored components (one row per entity), recorded as a write."""
+        table = self.get_table(ctype)
+        values = {name: data.tolist() if data.ndim == 1 else list(data) for name, data in columns.items()}
+        for i, eid in enumerate(eids):
+            item = table.read(eid)
+            for name, data in values.items():
+                object.__setattr__(item, name, data[i])
+        self.mark_changed(ctype, eids)
+
+    def _read_columns(self, ctype: Type[Component], eids: list[EntityId]) -> dict[str, np.ndarray]:
+        items = self.get_table(ctype).list_all(eids)
+        return {
+            name: to_column(ctype, name, [getattr(_, name) for _ in items])
+            for name in component_fields(ctype)
+        }
+
+    def _restore_section(self, section: Section):
+        self._spawn_block(section.eids, {
+            ctype: {name: np.array(data) for name, data in columns.items()}
+            for ctype, columns in section.columns.items()
+        })
+
+    def _spawn_block(self, eids: np.ndarray, blocks: dict[Type[Component], dict[str, np.ndarray]]):
+        eid_list = eids.tolist()
+        for ctype, block in blocks.items():
+            table = self.get_table(ctype)
+            columns = {
+                name: data.tolist() if data.ndim == 1 else data
+                for name, data in block.items()
+            }
+            for i, eid in enumerate(eid_list):
+                table.create(ctype.model_construct(eid=eid, db=self, **{
+                    name: data[i] for name, data in columns.items()
+                }))
+        types = frozenset(blocks)
+        for eid in eid_list:
+            self._types[eid] = types
+
+    def _create_entities(self, types: frozenset[Type[Component]], items: list[list[Component]]):
+        for components in items:
+            self._create_entity(components[0].eid, components)
+
+    def _set_components(self, eid: EntityId, added: dict[Type[Component], Component], removed: set[Type[Component]]):
+        for ctype in removed:
+            item = self.get_table(ctype).destroy(eid)
+            if self.pool is not None and item is not None:
+                self.pool.release([item])
+        for ctype, item in added.items():
+            item.db = self
+            self.get_table(ctype).create(item)
+        # frozenset.union keeps the type (`| added.keys()` would build a set)
+        self._types[eid] = (self._types.get(eid, frozenset()) - removed).union(added)
+
+    def _create_entity(self, eid: EntityId, components: list[Component]):
+        self._types[eid] = frozenset(_.type_id for _ in components)
+        for c in components:
+            c.db = self
+            self.get_table(c.type_id).create(c)
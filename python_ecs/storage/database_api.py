@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Type
+from typing import Type, Iterator, Any, Iterable
+
+import numpy as np
 
 from python_ecs.component import Component
 from python_ecs.component_set import ComponentSet
 from python_ecs.signature import Signature
+from python_ecs.storage.batch import Batch
 from python_ecs.storage.index import Index
+from python_ecs.storage.demography import Demography
+from python_ecs.storage.query import Query
+from python_ecs.storage.relations import Relation, CHILD_OF
+from python_ecs.storage.value_index import ValueIndex, IndexKind
 from python_ecs.types import EntityId
 
 
@@ -18,10 +25,26 @@ class DatabaseAPI(ABC):
     def create_all(self, items: list[ComponentSet]):
         ...
 
+    @abstractmethod
+    def spawn_many(self, component_types: list[Type[Component]], n: int, **column_arrays: dict[str, Any]) -> np.ndarray:
+        ...
+
     @abstractmethod
     def destroy_all(self, items: Component | Signature | list[Component | Signature]):
         ...
 
+    @abstractmethod
+    def merge(self, buffer: Demography):
+        ...
+
+    @abstractmethod
+    def add_component(self, eid: EntityId, item: Component):
+        ...
+
+    @abstractmethod
+    def remove_component(self, eid: EntityId, ctype: Type[Component]):
+        ...
+
     @abstractmethod
     def get_table[T:Component | Signature](self, ttype: Type[T]) -> Index[T]:
         ...
@@ -29,3 +52,55 @@ class DatabaseAPI(ABC):
     @abstractmethod
     def find_any[T: Component](self, what: Type[T], having: list[Type[Component]]) -> T:
         ...
+
+    @abstractmethod
+    def register_query(self, query: Query) -> Query:
+        ...
+
+    @abstractmethod
+    def batches[T: Component | Signature](self, signature: Type[T]) -> Iterator[Batch[T]]:
+        ...
+
+    @abstractmethod
+    def track_changes(self, ctype: Type[Component]):
+        ...
+
+    @abstractmethod
+    def mark_changed(self, ctype: Type[Component], eids: EntityId | Iterable[EntityId]):
+        ...
+
+    @abstractmethod
+    def changed_entities(self, types: list[Type[Component]], since: int) -> set[EntityId]:
+        ...
+
+    @abstractmethod
+    def tick(self) -> int:
+        ...
+
+    @abstractmethod
+    def relation(self, name: str = CHILD_OF, exclusive: bool = False, cascade: bool = False) -> Relation:
+        ...
+
+    @abstractmethod
+    def link(self, source: EntityId, target: EntityId, name: str = CHILD_OF):
+        ...
+
+    @abstractmethod
+    def unlink(self, source: EntityId, target: EntityId = None, name: str = CHILD_OF):
+        ...
+
+    @abstractmethod
+    def value_index(self, ctype: Type[Component], field: str, kind: IndexKind = 'hash') -> ValueIndex:
+        ...
+
+    @abstractmethod
+    def find_by(self, ctype: Type[Component], field: str, value: Any) -> set[EntityId]:
+        ...
+
+    @abstractmethod
+    def find_range(self, ctype: Type[Component], field: str, low: Any = None, high: Any = None) -> list[EntityId]:
+        ...
+
+    @abstractmethod
+    def find_top(self, ctype: Type[Component], field: str, k: int, largest: bool = True) -> list[EntityId]:
+        ...
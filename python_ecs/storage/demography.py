@@ -1,31 +1,63 @@
-from typing import Self
+from numbers import Integral
+from typing import Self, Type, Iterable
 
-from pydantic import Field
-
-from easy_config.my_model import MyModel
-from easy_kit.timing import time_func
 from python_ecs.component import Component
+from python_ecs.profiling import time_func
 from python_ecs.signature import Signature
 from python_ecs.component_set import ComponentSet, flatten_components
 from python_ecs.types import EntityId
 
 
-class Demography(MyModel):
-    birth: list[list[Component]] = Field(default_factory=list)
-    death: set[EntityId] = Field(default_factory=set)
+class Demography:
+    """Command buffer of structural changes, applied in one batched pass by Database.update_demography.
+
+    Typed ops are kept in plain lists: spawns (birth), destructions (death), components added to or removed from
+    existing entities. Ops of the entities destroyed by the same flush (cascading relations included) are ignored,
+    their births too.
+    """
+    __slots__ = ('birth', 'death', 'added', 'removed')
+
+    def __init__(self,
+                 birth: list[list[Component]] = None,
+                 death: Iterable[EntityId] = None,
+                 added: list[Component] = None,
+                 removed: list[tuple[EntityId, Type[Component]]] = None):
+        self.birth: list[list[Component]] = birth if birth is not None else []
+        self.death: set[EntityId] = set(death) if death is not None else set()
+        self.added: list[Component] = added if added is not None else []
+        self.removed: list[tuple[EntityId, Type[Component]]] = removed if removed is not None else []
+
+    def __len__(self):
+        return len(self.birth) + len(self.death) + len(self.added) + len(self.removed)
+
+    def __repr__(self):
+        return (f'Demography(birth={len(self.birth)}, death={len(self.death)}, '
+                f'added={len(self.added)}, removed={len(self.removed)})')
 
     def clear(self):
         self.birth.clear()
         self.death.clear()
+        self.added.clear()
+        self.removed.clear()
 
     def with_birth(self, items: list[ComponentSet]):
         self.birth.extend(map(flatten_components, items))
         return self
 
-    def with_death(self, items: Component | Signature | list[Component | Signature]):
-        if isinstance(items, Component | Signature):
+    def with_death(self, items: EntityId | Component | Signature | Iterable[EntityId | Component | Signature]):
+        if isinstance(items, Integral | Component | Signature):
             items = [items]
-        self.death.update([_.eid for _ in items])
+        self.death.update([int(_) if isinstance(_, Integral) else _.eid for _ in items])
+        return self
+
+    def with_component(self, eid: EntityId, item: Component):
+        """Add (or replace) a component of an existing entity."""
+        item.eid = eid
+        self.added.append(item)
+        return self
+
+    def without_component(self, eid: EntityId, ctype: Type[Component]):
+        self.removed.append((eid, ctype))
         return self
 
     @time_func
@@ -34,4 +66,6 @@ class Demography(MyModel):
             return self
         self.death.update(other.death)
         self.birth.extend(other.birth)
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
         return self
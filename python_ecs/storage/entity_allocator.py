@@ -0,0 +1,122 @@
+import threading
+from collections import deque
+from typing import Iterable
+
+import numpy as np
+
+from python_ecs.types import EntityId
+
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+def entity_index[T: (int, np.ndarray)](eid: T) -> T:
+    """Dense slot of an entity id (usable as a numpy array index)."""
+    return eid & INDEX_MASK
+
+
+def entity_generation[T: (int, np.ndarray)](eid: T) -> T:
+    return eid >> INDEX_BITS
+
+
+class EntityAllocator:
+    """Generational entity ids: a slot index in the low bits, the generation of the slot in the high bits.
+
+    Released slots go to a free list and are reused (oldest first) with a bumped generation, so indexes stay
+    dense while a stale id never matches the entity that reused its slot.
+    """
+
+    def __init__(self):
+        self.generations = np.zeros(0, dtype=np.int64)
+        self.live = np.zeros(0, dtype=bool)
+        self.size = 0
+        self.free: deque[int] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of live ids."""
+        return self.size - len(self.free)
+
+    def new_id(self) -> EntityId:
+        """Scalar path of gen: pops the free list or takes the next slot (no array built)."""
+        with self._lock:
+            if self.free:
+                index = self.free.popleft()
+                self.live[index] = True
+                return EntityId(int(self.generations[index]) << INDEX_BITS | index)
+            index = self.size
+            if index == len(self.live):
+                self._reserve(index + 1)
+            self.size += 1
+            self.live[index] = True
+            # never used slots are at generation 0
+            return EntityId(index)
+
+    def gen(self, n: int) -> np.ndarray:
+        with self._lock:
+            reused = [self.free.popleft() for _ in range(min(n, len(self.free)))]
+            fresh = n - len(reused)
+            self._reserve(self.size + fresh)
+            index = np.concatenate([
+                np.array(reused, dtype=np.int64),
+                np.arange(self.size, self.size + fresh, dtype=np.int64),
+            ])
+            self.size += fresh
+            self.live[index] = True
+            return (self.generations[index] << INDEX_BITS) | index
+
+    def release(self, eids: Iterable[EntityId]):
+        """Free the slots of live ids (stale or unknown ids are ignored)."""
+        with self._lock:
+            for eid in eids:
+                if self.alive(eid):
+                    index = entity_index(eid)
+                    self.generations[index] += 1
+                    self.live[index] = False
+                    self.free.append(index)
+
+    def alive(self, eid: EntityId) -> bool:
+        index = entity_index(eid)
+        return (
+                0 <= eid
+                and index < self.size
+                and self.live[index]
+                and self.generations[index] == entity_generation(eid)
+        )
+
+    def restore(self, generations: np.ndarray, free: Iterable[int]):
+        with self._lock:
+            self.generations = np.array(generations, dtype=np.int64)
+            self.size = len(self.generations)
+            self.free = deque(int(_) for _ in free)
+            self.live = np.ones(self.size, dtype=bool)
+            self.live[list(self.free)] = False
+
+    def claim(self, eids: Iterable[EntityId]):
+        """Mark ids allocated by another allocator (e.g. of a replicated database) as live."""
+        eids = np.fromiter(eids, dtype=np.int64)
+        if len(eids) == 0:
+            return
+        index = entity_index(eids)
+        with self._lock:
+            size = max(self.size, int(index.max()) + 1)
+            self._reserve(size)
+            # skipped slots are free until claimed
+            self.free.extend(range(self.size, size))
+            self.size = size
+            self.generations[index] = entity_generation(eids)
+            self.live[index] = True
+            claimed = set(index.tolist())
+            self.free = deque(_ for _ in self.free if _ not in claimed)
+
+    def _reserve(self, size: int):
+        if size <= len(self.generations):
+            return
+        capacity = max(16, len(self.generations))
+        while capacity < size:
+            capacity *= 2
+        generations = np.zeros(capacity, dtype=np.int64)
+        generations[:len(self.generations)] = self.generations
+        live = np.zeros(capacity, dtype=bool)
+        live[:len(self.live)] = self.live
+        self.generations, self.live = generations, live
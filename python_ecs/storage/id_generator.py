@@ -7,4 +7,14 @@ class IdGenerator:
         return self._last_id
 
     def gen(self, n: int):
-        return [self.new_id() for _ in range(n)]
+        start = self._last_id + 1
+        self._last_id += n
+        return range(start, start + n)
+
+    @property
+    def last_id(self):
+        return self._last_id
+
+    def restore(self, last_id: int):
+        """Never go backwards: ids stay unique in the process after a restore."""
+        self._last_id = max(self._last_id, last_id)
@@ -0,0 +1,108 @@
+import copy
+import functools
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Type, Iterable, Any, Callable
+
+from python_ecs.component import Component
+
+MUTABLE_DEFAULTS = (list, dict, set)
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0  # acquire served by a recycled instance
+    misses: int = 0  # acquire that had to construct an instance
+    released: int = 0  # instances kept for reuse
+    dropped: int = 0  # instances left to the garbage collector (pool full)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+    def add(self, other: 'PoolStats'):
+        self.hits += other.hits
+        self.misses += other.misses
+        self.released += other.released
+        self.dropped += other.dropped
+
+
+@functools.lru_cache()
+def field_defaults(ctype: Type[Component]) -> tuple[tuple[str, Any, Callable[[], Any] | None], ...]:
+    """(name, default, default factory) of each field."""
+    return tuple((name, info.default, info.default_factory) for name, info in ctype.model_fields.items())
+
+
+class ComponentPool:
+    """Free lists of detached component instances per type, recycled by acquire instead of constructing new ones.
+
+    Released instances are reset at acquire time: every field gets its default (a fresh cid, eid -1, no db) or the
+    given value, without validation (as model_construct). Only release instances nothing references anymore.
+    The database only releases; acquire is called by the code that builds new components.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size  # kept instances per type
+        self.limits: dict[Type[Component], int] = {}
+        self.free: dict[Type[Component], list[Component]] = defaultdict(list)
+        self.stats: dict[Type[Component], PoolStats] = defaultdict(PoolStats)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of instances kept for reuse."""
+        return sum(map(len, self.free.values()))
+
+    def limit(self, ctype: Type[Component], max_size: int):
+        """Pool size of one type (0 disables pooling of the type)."""
+        with self._lock:
+            self.limits[ctype] = max_size
+            del self.free[ctype][max_size:]
+
+    def acquire[T: Component](self, ctype: Type[T], **values: Any) -> T:
+        unknown = values.keys() - ctype.model_fields.keys()
+        if unknown:
+            raise ValueError(f'{ctype.__name__}: unknown fields {sorted(unknown)}')
+        with self._lock:
+            free = self.free.get(ctype)
+            item = free.pop() if free else None
+            stats = self.stats[ctype]
+            if item is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        if item is None:
+            return ctype.model_construct(**values)
+
+        for name, default, factory in field_defaults(ctype):
+            if name in values:
+                value = values[name]
+            elif factory is not None:
+                value = factory()
+            elif isinstance(default, MUTABLE_DEFAULTS):
+                value = copy.copy(default)
+            else:
+                value = default
+            # plain slot / __dict__ write: not recorded as a change
+            object.__setattr__(item, name, value)
+        return item
+
+    def release(self, items: Iterable[Component]):
+        with self._lock:
+            for item in items:
+                ctype = item.__class__
+                free = self.free[ctype]
+                stats = self.stats[ctype]
+                if len(free) < self.limits.get(ctype, self.max_size):
+                    object.__setattr__(item, 'db', None)
+                    free.append(item)
+                    stats.released += 1
+                else:
+                    stats.dropped += 1
+
+    def total(self) -> PoolStats:
+        res = PoolStats()
+        for _ in self.stats.values():
+            res.add(_)
+        return res
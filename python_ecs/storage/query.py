@@ -0,0 +1,38 @@
+from typing import Type, Iterable
+
+from pydantic import Field
+
+from easy_config.my_model import MyModel
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+type QueryKey = tuple[frozenset[Type[Component]], frozenset[Type[Component]], frozenset[Type[Component]]]
+
+
+def query_key(all: Iterable[Type[Component]] = None,
+              any: Iterable[Type[Component]] = None,
+              none: Iterable[Type[Component]] = None) -> QueryKey:
+    return frozenset(all or []), frozenset(any or []), frozenset(none or [])
+
+
+class Query(MyModel):
+    """Persistent entity filter: entities having all of `all`, at least one of `any` and none of `none`.
+
+    Once registered with a database, `entities` is maintained incrementally on births, deaths and component
+    changes, so reading it is free.
+    """
+    all: frozenset[Type[Component]] = Field(default_factory=frozenset)
+    any: frozenset[Type[Component]] = Field(default_factory=frozenset)
+    none: frozenset[Type[Component]] = Field(default_factory=frozenset)
+    entities: set[EntityId] = Field(default_factory=set)
+
+    @property
+    def key(self) -> QueryKey:
+        return self.all, self.any, self.none
+
+    def matches(self, types: frozenset[Type[Component]]) -> bool:
+        return (
+                self.all <= types
+                and (not self.any or not self.any.isdisjoint(types))
+                and self.none.isdisjoint(types)
+        )
@@ -0,0 +1,130 @@
+import threading
+from collections import defaultdict
+from typing import Iterable
+
+import numpy as np
+
+from python_ecs.types import EntityId
+
+CHILD_OF = 'child_of'  # hierarchy: exclusive (one parent) and cascading (children die with their parent)
+
+
+class Relation:
+    """Links between entities (source -> target) stored as adjacency sets in both directions.
+
+    exclusive: a source has at most one target (linking again replaces it), e.g. a parent.
+    cascade: the sources of a destroyed target are destroyed with it (recursively), otherwise their links are
+    just removed.
+    """
+
+    def __init__(self, name: str, exclusive: bool = False, cascade: bool = False):
+        self.name = name
+        self.exclusive = exclusive
+        self.cascade = cascade
+        self.targets: dict[EntityId, set[EntityId]] = defaultdict(set)
+        self.sources: dict[EntityId, set[EntityId]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of links."""
+        return sum(map(len, self.targets.values()))
+
+    def link(self, source: EntityId, target: EntityId):
+        if source == target:
+            raise ValueError(f'{self.name}: {source} can not be linked to itself')
+        with self._lock:
+            if self.exclusive:
+                self._unlink(source, None)
+            self.targets[source].add(target)
+            self.sources[target].add(source)
+
+    def unlink(self, source: EntityId, target: EntityId = None):
+        """Remove a link (all the links of source when target is None)."""
+        with self._lock:
+            self._unlink(source, target)
+
+    def targets_of(self, source: EntityId) -> set[EntityId]:
+        return set(self.targets.get(source, ()))
+
+    def target_of(self, source: EntityId) -> EntityId | None:
+        """Single target of an exclusive relation (e.g. the parent)."""
+        for _ in self.targets.get(source, ()):
+            return _
+
+    def sources_of(self, target: EntityId) -> set[EntityId]:
+        return set(self.sources.get(target, ()))
+
+    def pairs(self, targets: Iterable[EntityId] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Batched reverse lookup: (sources, targets) arrays of the links pointing to targets (all by default)."""
+        if targets is None:
+            targets = self.sources.keys()
+        res = [(source, target) for target in targets for source in sorted(self.sources.get(target, ()))]
+        array = np.array(res, dtype=np.int64).reshape(-1, 2)
+        return array[:, 0], array[:, 1]
+
+    def descendants(self, roots: Iterable[EntityId]) -> set[EntityId]:
+        """Entities reachable from roots through reverse links (sources of sources...), roots excluded."""
+        res = set()
+        stack = list(roots)
+        while stack:
+            for _ in self.sources.get(stack.pop(), ()):
+                if _ not in res:
+                    res.add(_)
+                    stack.append(_)
+        return res
+
+    def levels(self, roots: Iterable[EntityId] = None) -> list[np.ndarray]:
+        """Topological order by depth: level 0 are the roots (entities without target by default), each next level
+        the sources of the previous one, so a transform propagation can run one vectorized pass per level.
+
+        An entity linked to several targets comes after all of them, a cycle raises a ValueError.
+        """
+        complete = roots is None
+        if complete:
+            roots = sorted(set(self.sources) - set(self.targets))
+        roots = list(roots)
+        pending = {_: len(self.targets.get(_, ())) for _ in self.descendants(roots)}
+        if complete and len(pending) < len(self.targets):
+            raise ValueError(f'{self.name}: cycle between entities without root')
+
+        res = []
+        level = roots
+        while level:
+            res.append(np.array(level, dtype=np.int64))
+            following = []
+            for target in level:
+                for source in self.sources.get(target, ()):
+                    pending[source] -= 1
+                    if pending[source] == 0:
+                        following.append(source)
+            following.sort()
+            level = following
+        if any(pending.values()):
+            raise ValueError(f'{self.name}: cycle or links to entities outside of the traversal')
+        return res
+
+    def ordered(self, roots: Iterable[EntityId] = None) -> list[EntityId]:
+        """Targets before their sources (e.g. parents before children), see levels."""
+        return [eid for level in self.levels(roots) for eid in level.tolist()]
+
+    def forget(self, eids: Iterable[EntityId]):
+        """Remove every link of destroyed entities."""
+        with self._lock:
+            for eid in eids:
+                self._unlink(eid, None)
+                for source in self.sources.pop(eid, ()):
+                    self._discard(self.targets, source, eid)
+
+    def _unlink(self, source: EntityId, target: EntityId | None):
+        targets = self.targets.get(source, set()) if target is None else {target}
+        for _ in list(targets):
+            self._discard(self.targets, source, _)
+            self._discard(self.sources, _, source)
+
+    @staticmethod
+    def _discard(adjacency: dict[EntityId, set[EntityId]], key: EntityId, value: EntityId):
+        items = adjacency.get(key)
+        if items is not None:
+            items.discard(value)
+            if not items:
+                del adjacency[key]
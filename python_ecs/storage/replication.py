@@ -0,0 +1,145 @@
+import json
+import struct
+from typing import Type, Any, BinaryIO, Iterator
+
+import numpy as np
+
+from python_ecs.component import Component
+from python_ecs.storage.snapshot import Section, encode_section, decode_section, type_name, resolve_type, \
+    _block, _align, _objects
+
+DELTA_MAGIC = b'PYECSDLT'
+
+
+class Delta:
+    """Changes of a database during one frame, or a full image of it (keyframe), in columnar form.
+
+    Births are sections of full components, changes are single type sections with the full rows of the components
+    written during the frame, removed components are eid arrays per type. A keyframe holds all the entities as
+    births, with the entity id space. Object columns other than strings are pickled: only read trusted streams.
+    """
+
+    def __init__(self,
+                 frame: int,
+                 keyframe: bool = False,
+                 deaths: np.ndarray = None,
+                 births: list[Section] = None,
+                 changes: list[Section] = None,
+                 removed: dict[Type[Component], np.ndarray] = None,
+                 generations: np.ndarray = None,
+                 free: np.ndarray = None):
+        self.frame = frame
+        self.keyframe = keyframe
+        self.deaths = deaths if deaths is not None else np.zeros(0, dtype=np.int64)
+        self.births = births or []
+        self.changes = changes or []
+        self.removed = removed or {}
+        self.generations = generations
+        self.free = free
+
+    def __repr__(self):
+        return (f'Delta(frame={self.frame}, keyframe={self.keyframe}, deaths={len(self.deaths)}, '
+                f'births={sum(len(_.eids) for _ in self.births)}, changes={sum(len(_.eids) for _ in self.changes)})')
+
+    def write(self, out: BinaryIO) -> int:
+        """Length prefixed message (header then aligned blocks), returns the number of bytes written."""
+        blocks: list[np.ndarray] = []
+        header = {
+            'frame': self.frame,
+            'keyframe': self.keyframe,
+            'deaths': _block(blocks, self.deaths),
+            'births': [encode_section(blocks, _) for _ in self.births],
+            'changes': [encode_section(blocks, _) for _ in self.changes],
+            'removed': {type_name(ctype): _block(blocks, eids) for ctype, eids in self.removed.items()},
+        }
+        if self.keyframe:
+            header['generations'] = _block(blocks, self.generations)
+            header['free'] = _block(blocks, self.free)
+        raw = json.dumps(header).encode()
+        payload = bytearray(sum(_align(_.nbytes) for _ in blocks))
+        offset = 0
+        for data in blocks:
+            payload[offset:offset + data.nbytes] = np.ascontiguousarray(data).tobytes()
+            offset += _align(data.nbytes)
+        message = DELTA_MAGIC + struct.pack('<QQ', len(raw), len(payload)) + raw + payload
+        out.write(message)
+        return len(message)
+
+    @staticmethod
+    def read(source: BinaryIO) -> 'Delta | None':
+        """Next message of a stream (None at the end of the stream)."""
+        prefix = _read_exact(source, len(DELTA_MAGIC) + 16)
+        if prefix is None:
+            return None
+        if prefix[:len(DELTA_MAGIC)] != DELTA_MAGIC:
+            raise ValueError('not a database delta stream')
+        header_size, payload_size = struct.unpack('<QQ', prefix[len(DELTA_MAGIC):])
+        header = json.loads(_read_exact(source, header_size))
+        payload = _read_exact(source, payload_size) or b''
+
+        def read(spec: dict[str, Any]) -> np.ndarray:
+            if 'pickled' in spec:
+                return _objects(read(spec['pickled']))
+            dtype, shape = np.dtype(spec['dtype']), tuple(spec['shape'])
+            count = int(np.prod(shape))
+            data = np.frombuffer(payload, dtype=dtype, count=count, offset=spec['offset'] if count else 0)
+            data = data.reshape(shape).copy()
+            if data.dtype.kind == 'U':
+                data = data.astype(object)
+            return data
+
+        return Delta(
+            frame=header['frame'],
+            keyframe=header['keyframe'],
+            deaths=read(header['deaths']),
+            births=[decode_section(_, read) for _ in header['births']],
+            changes=[decode_section(_, read) for _ in header['changes']],
+            removed={resolve_type(name): read(spec) for name, spec in header['removed'].items()},
+            generations=read(header['generations']) if 'generations' in header else None,
+            free=read(header['free']) if 'free' in header else None,
+        )
+
+
+class DeltaWriter:
+    """Streams the changes of a database to a file-like object (file, pipe, socket.makefile('wb')).
+
+    Every keyframe_interval frames (and at the first one) a keyframe is sent, so a replica can join the stream or
+    recover from a lost message. See ECS(replication=...) and Database.apply_delta.
+
+    Deltas rely on change tracking: from the first write, every component type of the database is tracked, which
+    adds a mark_changed call to each field assignment of these types (see watch_writes). BatchSystems must declare
+    the types they write in `_writes`.
+    """
+
+    def __init__(self, out: BinaryIO, keyframe_interval: int = 60):
+        self.out = out
+        self.keyframe_interval = keyframe_interval
+        self.frame = 0
+        self.since = 0  # change version of the previous delta
+        self.bytes = 0  # total written
+
+    def write(self, db: 'Database', keyframe: bool = False) -> Delta:
+        keyframe = keyframe or db.journal is None or self.frame % self.keyframe_interval == 0
+        delta, self.since = db.encode_delta(self.frame, self.since, keyframe)
+        self.bytes += delta.write(self.out)
+        self.out.flush()
+        self.frame += 1
+        return delta
+
+
+def read_deltas(source: BinaryIO) -> Iterator[Delta]:
+    while (delta := Delta.read(source)) is not None:
+        yield delta
+
+
+def _read_exact(source: BinaryIO, size: int) -> bytes | None:
+    chunks = []
+    while size > 0:
+        chunk = source.read(size)
+        if not chunk:
+            if chunks:
+                raise EOFError('truncated delta stream')
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
@@ -0,0 +1,165 @@
+import importlib
+import json
+import pickle
+import struct
+from pathlib import Path
+from typing import Type, Any, Callable
+
+import numpy as np
+
+from python_ecs.component import Component
+
+MAGIC = b'PYECS001'
+ALIGNMENT = 64
+
+type PathLike = Path | str
+
+
+class Section:
+    """Entities of one archetype: an eid block and one block per component field."""
+
+    def __init__(self, types: list[Type[Component]], eids: np.ndarray, columns: dict[Type[Component], dict[str, np.ndarray]]):
+        self.types = types
+        self.eids = eids
+        self.columns = columns
+
+
+class Snapshot:
+    """Columnar binary image of a database: sections, entity table, entity id space and component id counter.
+
+    Object columns other than strings are pickled: only load trusted files.
+    """
+
+    def __init__(self,
+                 sections: list[Section],
+                 entities: np.ndarray,
+                 generations: np.ndarray,
+                 free: np.ndarray,
+                 cid_gen: int):
+        self.sections = sections
+        self.entities = entities
+        self.generations = generations
+        self.free = free
+        self.cid_gen = cid_gen
+
+    def save(self, path: PathLike):
+        blocks: list[np.ndarray] = []
+        header = {
+            'cid_gen': self.cid_gen,
+            'entities': _block(blocks, self.entities),
+            'generations': _block(blocks, self.generations),
+            'free': _block(blocks, self.free),
+            'sections': [encode_section(blocks, _) for _ in self.sections],
+        }
+        raw = json.dumps(header).encode()
+        with Path(path).open('wb') as out:
+            out.write(MAGIC)
+            out.write(struct.pack('<Q', len(raw)))
+            out.write(raw)
+            position = _pad(out, len(MAGIC) + 8 + len(raw))
+            for data in blocks:
+                out.write(np.ascontiguousarray(data).tobytes())
+                position = _pad(out, position + data.nbytes)
+
+    @staticmethod
+    def load(path: PathLike, mmap: bool = True) -> 'Snapshot':
+        path = Path(path)
+        with path.open('rb') as _:
+            if _.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path}: not a database snapshot')
+            size, = struct.unpack('<Q', _.read(8))
+            header = json.loads(_.read(size))
+        start = _align(len(MAGIC) + 8 + size)
+
+        def read(spec: dict[str, Any]) -> np.ndarray:
+            if 'pickled' in spec:
+                return _objects(read(spec['pickled']))
+            shape = tuple(spec['shape'])
+            if shape[0] == 0:
+                return np.zeros(shape, dtype=spec['dtype'])
+            data = np.memmap(path, dtype=spec['dtype'], mode='c', offset=start + spec['offset'], shape=shape)
+            if not mmap:
+                data = np.array(data)
+            if data.dtype.kind == 'U':
+                data = data.astype(object)
+            return data
+
+        sections = [decode_section(_, read) for _ in header['sections']]
+        entities = read(header['entities'])
+        generations, free = np.array(read(header['generations'])), read(header['free'])
+        return Snapshot(sections, entities, generations, free, header['cid_gen'])
+
+
+def encode_section(blocks: list[np.ndarray], section: Section) -> dict[str, Any]:
+    """Header of a section, its arrays are appended to blocks."""
+    return {
+        'eids': _block(blocks, section.eids),
+        'types': {
+            type_name(ctype): {
+                name: _column(blocks, data, f'{ctype.__name__}.{name}')
+                for name, data in section.columns[ctype].items()
+            }
+            for ctype in section.types
+        },
+    }
+
+
+def decode_section(spec: dict[str, Any], read: Callable[[dict[str, Any]], np.ndarray]) -> Section:
+    types = {resolve_type(name): columns for name, columns in spec['types'].items()}
+    return Section(
+        types=list(types),
+        eids=read(spec['eids']),
+        columns={
+            ctype: {name: read(_) for name, _ in columns.items()}
+            for ctype, columns in types.items()
+        }
+    )
+
+
+def type_name(ctype: type) -> str:
+    return f'{ctype.__module__}:{ctype.__qualname__}'
+
+
+def resolve_type(name: str) -> type:
+    module, qualname = name.split(':')
+    res = importlib.import_module(module)
+    for _ in qualname.split('.'):
+        res = getattr(res, _)
+    return res
+
+
+def _column(blocks: list[np.ndarray], data: np.ndarray, label: str) -> dict[str, Any]:
+    if data.dtype == object:
+        values = data.tolist()
+        if all(isinstance(_, str) for _ in values):
+            data = np.array(values, dtype=str) if values else np.zeros(0, dtype='U1')
+        else:
+            # no fixed size representation (None, tuples, models...): pickled as a byte block, types are kept
+            try:
+                raw = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise TypeError(f'{label}: values can not be encoded ({e})') from e
+            return {'pickled': _block(blocks, np.frombuffer(raw, dtype=np.uint8))}
+    return _block(blocks, data)
+
+
+def _objects(raw: np.ndarray) -> np.ndarray:
+    """Object column of a pickled byte block (see _column)."""
+    values = pickle.loads(raw.tobytes())
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _block(blocks: list[np.ndarray], data: np.ndarray) -> dict[str, Any]:
+    offset = sum(_align(_.nbytes) for _ in blocks)
+    blocks.append(data)
+    return {'dtype': data.dtype.str, 'shape': list(data.shape), 'offset': offset}
+
+
+def _align(size: int) -> int:
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _pad(out, position: int) -> int:
+    aligned = _align(position)
+    out.write(b'\0' * (aligned - position))
+    return aligned
@@ -0,0 +1,157 @@
+import itertools
+import math
+from collections import defaultdict
+from typing import Type, Iterable
+
+import numpy as np
+
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+type Cell = tuple[int, int, int]
+type Point = np.ndarray | Iterable[float]
+
+EMPTY = np.zeros(0, dtype=np.int64)
+
+
+class SpatialIndex:
+    """Uniform grid over the positions of one Vec3 component type (its `raw` field).
+
+    Entities are kept sorted by id with their last known position and cell. Births, deaths and component changes
+    come in blocks (one insert / remove per demography flush, merged into the sorted arrays), positions are
+    refreshed in bulk (`update`): only the entities that changed cell touch the buckets. Queries only look at the
+    cells overlapping the searched area, distances are computed with numpy.
+    """
+
+    def __init__(self, ctype: Type[Component], cell_size: float = 1.0):
+        if cell_size <= 0:
+            raise ValueError(f'SpatialIndex: cell_size must be > 0 (got {cell_size})')
+        self.ctype = ctype
+        self.cell_size = cell_size
+        self.eids = EMPTY
+        self.positions = np.zeros((0, 3))
+        self.cells = np.zeros((0, 3), dtype=np.int64)
+        self.buckets: dict[Cell, set[EntityId]] = defaultdict(set)
+        self.since = 0  # change version of the last refresh (see Database.refresh_spatial)
+
+    def __len__(self):
+        return len(self.eids)
+
+    def __contains__(self, eid: EntityId):
+        i = np.searchsorted(self.eids, eid)
+        return i < len(self.eids) and self.eids[i] == eid
+
+    def cell(self, position: Point) -> Cell:
+        return tuple(np.floor(np.asarray(position, dtype=float) / self.cell_size).astype(np.int64).tolist())
+
+    def insert(self, eids: np.ndarray, positions: np.ndarray):
+        eids = np.asarray(eids, dtype=np.int64)
+        if len(eids) == 0:
+            return
+        order = np.argsort(eids, kind='stable')
+        eids = eids[order]
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)[order]
+        cells = self._cells(positions)
+        for eid, cell in zip(eids.tolist(), map(tuple, cells.tolist())):
+            self.buckets[cell].add(eid)
+
+        # merged into the sorted arrays: O(N + k log k), the indexed entities are not sorted again
+        at = np.searchsorted(self.eids, eids)
+        self.eids = np.insert(self.eids, at, eids)
+        self.positions = np.insert(self.positions, at, positions, axis=0)
+        self.cells = np.insert(self.cells, at, cells, axis=0)
+
+    def remove(self, eids: Iterable[EntityId]):
+        eids = np.fromiter(eids, dtype=np.int64)
+        if len(eids) == 0 or len(self.eids) == 0:
+            return
+        mask = np.isin(self.eids, eids)
+        if not mask.any():
+            return
+        for eid, cell in zip(self.eids[mask].tolist(), map(tuple, self.cells[mask].tolist())):
+            self._discard(cell, eid)
+        keep = ~mask
+        self.eids = self.eids[keep]
+        self.positions = self.positions[keep]
+        self.cells = self.cells[keep]
+
+    def update(self, eids: np.ndarray, positions: np.ndarray):
+        """New positions of indexed entities (unknown ids are ignored)."""
+        eids = np.asarray(eids, dtype=np.int64)
+        if len(eids) == 0 or len(self.eids) == 0:
+            return
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        rows = np.minimum(np.searchsorted(self.eids, eids), len(self.eids) - 1)
+        known = self.eids[rows] == eids
+        rows, positions = rows[known], positions[known]
+
+        cells = self._cells(positions)
+        changed = (cells != self.cells[rows]).any(axis=1)
+        for row, cell in zip(rows[changed].tolist(), map(tuple, cells[changed].tolist())):
+            eid = int(self.eids[row])
+            self._discard(tuple(self.cells[row].tolist()), eid)
+            self.buckets[cell].add(eid)
+        self.positions[rows] = positions
+        self.cells[rows] = cells
+
+    def query_box(self, low: Point, high: Point) -> np.ndarray:
+        """Entities inside the axis aligned box [low, high], sorted by id."""
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        rows = self._candidates(low, high)
+        inside = np.all((self.positions[rows] >= low) & (self.positions[rows] <= high), axis=1)
+        return self.eids[np.sort(rows[inside])]
+
+    def query_radius(self, center: Point, radius: float) -> np.ndarray:
+        """Entities at distance <= radius of center, sorted by id."""
+        center = np.asarray(center, dtype=float)
+        rows = self._candidates(center - radius, center + radius)
+        delta = self.positions[rows] - center
+        inside = np.einsum('ij,ij->i', delta, delta) <= radius * radius
+        return self.eids[np.sort(rows[inside])]
+
+    def k_nearest(self, center: Point, k: int) -> np.ndarray:
+        """The k entities closest to center, nearest first (ties broken by id)."""
+        center = np.asarray(center, dtype=float)
+        if k <= 0 or len(self.eids) == 0:
+            return EMPTY
+        k = min(k, len(self.eids))
+        extent = np.abs(self.positions - center).max()
+        radius = self.cell_size
+        while True:
+            rows = self._candidates(center - radius, center + radius)
+            delta = self.positions[rows] - center
+            dist = np.einsum('ij,ij->i', delta, delta)
+            found = dist <= radius * radius
+            if found.sum() >= k or radius >= extent * math.sqrt(3):
+                rows, dist = rows[found], dist[found]
+                order = np.lexsort((self.eids[rows], dist))[:k]
+                return self.eids[rows[order]]
+            radius *= 2
+
+    # -----------------------------------------------------------------------------
+
+    def _cells(self, positions: np.ndarray) -> np.ndarray:
+        return np.floor(positions / self.cell_size).astype(np.int64)
+
+    def _discard(self, cell: Cell, eid: EntityId):
+        bucket = self.buckets.get(cell)
+        if bucket is not None:
+            bucket.discard(eid)
+            if not bucket:
+                del self.buckets[cell]
+
+    def _candidates(self, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        """Rows of the entities in the cells overlapping [low, high]."""
+        lo = self._cells(low)
+        hi = self._cells(high)
+        count = int(np.prod(hi - lo + 1))
+        if count <= len(self.buckets):
+            cells = itertools.product(*(range(a, b + 1) for a, b in zip(lo.tolist(), hi.tolist())))
+        else:
+            # sparse grid: cheaper to scan the occupied cells
+            cells = [_ for _ in self.buckets if all(a <= c <= b for a, c, b in zip(lo.tolist(), _, hi.tolist()))]
+        eids = [eid for cell in cells if cell in self.buckets for eid in self.buckets[cell]]
+        if not eids:
+            return EMPTY
+        return np.searchsorted(self.eids, np.array(eids, dtype=np.int64))
@@ -0,0 +1,121 @@
+import bisect
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Type, Iterable, Any, Literal
+
+from python_ecs.component import Component
+from python_ecs.types import EntityId
+
+type IndexKind = Literal['hash', 'sorted']
+
+
+class ValueIndex(ABC):
+    """Secondary index of the values of one component field, kept up to date by the Database."""
+
+    def __init__(self, ctype: Type[Component], field: str):
+        if field not in ctype.model_fields:
+            raise ValueError(f'{ctype.__name__} has no field {field!r}')
+        self.ctype = ctype
+        self.field = field
+        self.values: dict[EntityId, Any] = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, eid: EntityId):
+        return eid in self.values
+
+    def update(self, eids: Iterable[EntityId], values: Iterable[Any]):
+        """Insert or move entities to their new values (unchanged values cost a lookup)."""
+        moved_eids, moved_values = [], []
+        for eid, value in zip(eids, values):
+            if eid not in self.values or self.values[eid] != value:
+                moved_eids.append(eid)
+                moved_values.append(value)
+        if moved_eids:
+            self.remove(moved_eids)
+            self.insert(moved_eids, moved_values)
+
+    def insert(self, eids: Iterable[EntityId], values: Iterable[Any]):
+        for eid, value in zip(eids, values):
+            self.values[eid] = value
+            self._add(eid, value)
+
+    def remove(self, eids: Iterable[EntityId]):
+        for eid in eids:
+            if eid in self.values:
+                self._discard(eid, self.values.pop(eid))
+
+    @abstractmethod
+    def _add(self, eid: EntityId, value: Any):
+        ...
+
+    @abstractmethod
+    def _discard(self, eid: EntityId, value: Any):
+        ...
+
+
+class HashIndex(ValueIndex):
+    """Equality lookups (values must be hashable)."""
+
+    def __init__(self, ctype: Type[Component], field: str):
+        super().__init__(ctype, field)
+        self.buckets: dict[Any, set[EntityId]] = defaultdict(set)
+
+    def find(self, value: Any) -> set[EntityId]:
+        return set(self.buckets.get(value, ()))
+
+    def _add(self, eid: EntityId, value: Any):
+        self.buckets[value].add(eid)
+
+    def _discard(self, eid: EntityId, value: Any):
+        bucket = self.buckets[value]
+        bucket.discard(eid)
+        if not bucket:
+            del self.buckets[value]
+
+
+class SortedIndex(ValueIndex):
+    """Range and top k lookups: (value, eid) pairs kept sorted, values must be comparable."""
+
+    def __init__(self, ctype: Type[Component], field: str):
+        super().__init__(ctype, field)
+        self.keys: list[tuple[Any, EntityId]] = []
+
+    def insert(self, eids: Iterable[EntityId], values: Iterable[Any]):
+        eids, values = list(eids), list(values)
+        if len(eids) > len(self.keys):
+            # bulk insert: one sort rather than n insertions
+            self.values.update(zip(eids, values))
+            self.keys = sorted((value, eid) for eid, value in self.values.items())
+            return
+        super().insert(eids, values)
+
+    def find(self, value: Any) -> set[EntityId]:
+        return set(self.range(value, value))
+
+    def range(self, low: Any = None, high: Any = None) -> list[EntityId]:
+        """Entities with low <= value <= high (None: unbounded), by increasing value."""
+        start = 0 if low is None else bisect.bisect_left(self.keys, low, key=lambda _: _[0])
+        stop = len(self.keys) if high is None else bisect.bisect_right(self.keys, high, key=lambda _: _[0])
+        return [eid for _, eid in self.keys[start:stop]]
+
+    def top(self, k: int, largest: bool = True) -> list[EntityId]:
+        """k entities with the largest (or smallest) values, best first."""
+        if largest:
+            return [eid for _, eid in reversed(self.keys[max(0, len(self.keys) - k):])]
+        return [eid for _, eid in self.keys[:k]]
+
+    def _add(self, eid: EntityId, value: Any):
+        bisect.insort(self.keys, (value, eid))
+
+    def _discard(self, eid: EntityId, value: Any):
+        i = bisect.bisect_left(self.keys, (value, eid))
+        if i < len(self.keys) and self.keys[i] == (value, eid):
+            del self.keys[i]
+
+
+INDEX_KINDS: dict[str, Type[ValueIndex]] = {
+    'hash': HashIndex,
+    'sorted': SortedIndex,
+}
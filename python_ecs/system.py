@@ -5,11 +5,23 @@ from typing import Type, override
 from easy_config.my_model import MyModel
 from python_ecs.component import Component
 from python_ecs.signature import Signature
+from python_ecs.storage.batch import Batch
 from python_ecs.storage.database_api import DatabaseAPI
+from python_ecs.storage.demography import Demography
+from python_ecs.types import EntityId
 
 
 class BaseSystem(MyModel):
     periodicity_sec: float = 0  # expected (or minimum) time between two updates
+    priority: int = 0  # systems of negative priority are deferred when the frame budget is exceeded
+    _reads: list[Type[Component]] = None  # component types read by update (None: unknown)
+    _writes: list[Type[Component]] = None  # component types written by update (None: unknown)
+
+    def reads(self) -> frozenset[Type[Component]] | None:
+        return None if self._reads is None else frozenset(self._reads)
+
+    def writes(self) -> frozenset[Type[Component]] | None:
+        return None if self._writes is None else frozenset(self._writes)
 
     def at_interval(self, periodicity_sec: float):
         self.periodicity_sec = periodicity_sec
@@ -22,8 +34,23 @@ class BaseSystem(MyModel):
 
 class System[T: Signature | Component](BaseSystem):
     _signature: Type[T] = None
+    _changed: list[Type[Component]] = None  # only update the entities whose components of these types were written
+    _since: int = 0  # change version of the previous update
+
+    @override
+    def reads(self) -> frozenset[Type[Component]] | None:
+        if self._reads is None and self._signature is not None:
+            return frozenset(self._signature.signature())
+        return super().reads()
 
-    def update_single(self, db: DatabaseAPI, item: T, dt: float):
+    @override
+    def writes(self) -> frozenset[Type[Component]] | None:
+        if self._writes is None and self._signature is not None:
+            return frozenset(self._signature.signature())
+        return super().writes()
+
+    def update_single(self, db: DatabaseAPI, item: T, dt: float) -> Demography | None:
+        """May return the structural changes to apply (merged into the database pending changes)."""
         pass
 
     def register(self, item: T):
@@ -32,11 +59,50 @@ class System[T: Signature | Component](BaseSystem):
     def unregister(self, item: T):
         pass
 
+    def register_batch(self, items: list[T]):
+        for _ in items:
+            self.register(_)
+
+    def changed_entities(self, db: DatabaseAPI) -> set[EntityId]:
+        """Entities whose `_changed` components were written since the previous call (all of them at first)."""
+        for _ in self._changed:
+            db.track_changes(_)
+        since, self._since = self._since, db.tick()
+        res = db.changed_entities(self._changed, since)
+        # writes done after this call (including the ones of this system) get a newer version than since
+        db.tick()
+        return res
+
     @override
     def update(self, db: DatabaseAPI, dt: float):
-        items = db.get_table(self._signature).list_all()
+        table = db.get_table(self._signature)
+        if self._changed is None:
+            items = table.list_all()
+        else:
+            items = list(filter(None, map(table.read, sorted(self.changed_entities(db)))))
         for item in items:
-            self.update_single(db, item, dt)
+            status = self.update_single(db, item, dt)
+            if status is not None:
+                db.merge(status)
+
+
+class BatchSystem[T: Signature | Component](System[T]):
+    """Vectorized system: update_batch receives numpy arrays of all matching entities at once.
+
+    The writes of the types declared in `_writes` are recorded once per batch (see Database.mark_changed), the
+    other columns are written back without being recorded.
+    """
+
+    def update_batch(self, db: DatabaseAPI, batch: Batch[T], dt: float):
+        pass
+
+    @override
+    def update(self, db: DatabaseAPI, dt: float):
+        for batch in db.batches(self._signature):
+            self.update_batch(db, batch, dt)
+            batch.commit()
+            for _ in self._writes or ():
+                db.mark_changed(_, batch.eids)
 
 
 class SystemBag(System):
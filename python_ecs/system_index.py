@@ -0,0 +1,55 @@
+from collections import defaultdict
+from typing import Type
+
+from python_ecs.component import Component
+from python_ecs.system import System
+from python_ecs.types import EntityId
+
+
+class SystemIndex:
+    """Dispatch index of ECS.apply_demography.
+
+    Maps a component type set to the systems whose signature it can satisfy (computed once per distinct set) and
+    each entity to the systems it has been registered to (with the number of entities of each system).
+    """
+
+    def __init__(self):
+        self._key: tuple[int, ...] = ()
+        self._systems: list[System] = []
+        self._by_types: dict[frozenset[Type[Component]], list[System]] = {}
+        self._registered: dict[EntityId, list[System]] = defaultdict(list)
+        self._counts: dict[int, int] = defaultdict(int)
+
+    def update(self, systems: list[System]):
+        """Invalidate the type index when the system list changed."""
+        key = tuple(map(id, systems))
+        if key != self._key:
+            self._key = key
+            self._systems = list(systems)
+            self._by_types.clear()
+
+    @property
+    def systems(self) -> list[System]:
+        return self._systems
+
+    def interested(self, types: frozenset[Type[Component]]) -> list[System]:
+        if types not in self._by_types:
+            self._by_types[types] = [
+                _ for _ in self._systems
+                if types.issuperset(_._signature.signature())
+            ]
+        return self._by_types[types]
+
+    def register(self, eid: EntityId, sys: System):
+        self._registered[eid].append(sys)
+        self._counts[id(sys)] += 1
+
+    def unregister(self, eid: EntityId) -> list[System]:
+        systems = self._registered.pop(eid, [])
+        for _ in systems:
+            self._counts[id(_)] -= 1
+        return systems
+
+    def count(self, sys: System) -> int:
+        """Number of entities registered to a system."""
+        return self._counts.get(id(sys), 0)
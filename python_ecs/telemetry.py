@@ -0,0 +1,101 @@
+import json
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+type PathLike = Path | str
+
+
+@dataclass
+class SystemStats:
+    name: str
+    start: float = 0.  # seconds since the frame start
+    duration: float = 0.
+    entities: int = 0  # entities matching the system signature
+    skipped: bool = False  # not due (periodicity)
+    failed: bool = False
+    thread: int = 0
+
+
+@dataclass
+class FrameStats:
+    index: int
+    start: float  # epoch seconds
+    duration: float = 0.
+    demography_duration: float = 0.  # time spent in ECS.apply_demography
+    births: int = 0
+    deaths: int = 0
+    entities: int = 0
+    systems: list[SystemStats] = field(default_factory=list)
+
+    def system(self, name: str) -> SystemStats | None:
+        for _ in self.systems:
+            if _.name == name:
+                return _
+
+
+class FrameHistory:
+    """Ring buffer of the last frame stats of an ECS, with percentile queries and trace export."""
+
+    def __init__(self, capacity: int = 1024):
+        self.frames: deque[FrameStats] = deque(maxlen=capacity)
+        self.count = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def record(self, frame: FrameStats):
+        self.frames.append(frame)
+        self.count += 1
+
+    def values(self, metric: str = 'duration', system: str = None) -> np.ndarray:
+        """Metric of the buffered frames, or of one system (only the frames where it actually ran)."""
+        if system is None:
+            return np.array([getattr(_, metric) for _ in self.frames], dtype=float)
+        res = []
+        for frame in self.frames:
+            stats = frame.system(system)
+            if stats is not None and not stats.skipped:
+                res.append(getattr(stats, metric))
+        return np.array(res, dtype=float)
+
+    def percentiles(self, metric: str = 'duration', system: str = None) -> dict[str, float]:
+        values = self.values(metric, system)
+        if len(values) == 0:
+            return {f'p{_}': 0. for _ in PERCENTILES}
+        return dict(zip([f'p{_}' for _ in PERCENTILES], np.percentile(values, PERCENTILES).tolist()))
+
+    def export_jsonl(self, path: PathLike):
+        with Path(path).open('w') as _:
+            for frame in self.frames:
+                _.write(json.dumps(asdict(frame)) + '\n')
+
+    def export_chrome_trace(self, path: PathLike):
+        """chrome://tracing (or Perfetto) compatible file: one event per frame and per executed system."""
+        events = []
+        for frame in self.frames:
+            ts = frame.start * 1e6
+            events.append({
+                'name': f'frame {frame.index}', 'ph': 'X', 'pid': 0, 'tid': 0,
+                'ts': ts, 'dur': frame.duration * 1e6,
+                'args': {
+                    'births': frame.births,
+                    'deaths': frame.deaths,
+                    'entities': frame.entities,
+                    'demography_duration': frame.demography_duration,
+                },
+            })
+            for _ in frame.systems:
+                if _.skipped:
+                    continue
+                events.append({
+                    'name': _.name, 'ph': 'X', 'pid': 0, 'tid': _.thread,
+                    'ts': ts + _.start * 1e6, 'dur': _.duration * 1e6,
+                    'args': {'entities': _.entities, 'failed': _.failed},
+                })
+        with Path(path).open('w') as _:
+            json.dump({'traceEvents': events}, _)
@@ -0,0 +1,93 @@
+import heapq
+
+from python_ecs.system import BaseSystem
+
+
+class FixedTimestep:
+    """Fixed dt accumulator: real elapsed time is consumed by whole steps of step_sec.
+
+    At most max_steps are run per update to catch up after a spike (the excess is dropped so a slow frame can not
+    snowball), the remainder gives the interpolation factor `alpha` between the last two steps.
+    """
+
+    def __init__(self, step_sec: float = 1 / 60, max_steps: int = 5):
+        if step_sec <= 0:
+            raise ValueError(f'FixedTimestep: step_sec must be > 0 (got {step_sec})')
+        self.step_sec = step_sec
+        self.max_steps = max_steps
+        self.accumulator = 0.
+        self.dropped = 0.  # time discarded by the max_steps cap
+
+    @property
+    def alpha(self) -> float:
+        return self.accumulator / self.step_sec
+
+    def advance(self, elapsed: float) -> int:
+        """Number of steps to run for elapsed seconds of real time."""
+        self.accumulator += elapsed
+        steps = int(self.accumulator // self.step_sec)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.step_sec
+            self.accumulator -= (steps - self.max_steps) * self.step_sec
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_sec
+        return steps
+
+
+class PeriodicityBuckets:
+    """Systems grouped by periodicity_sec, buckets are kept in a heap of next due times.
+
+    A frame only touches the buckets that are due, the others cost nothing. Systems are returned in the system
+    list order with the time elapsed since their previous run. A deferred system (see defer) is run at the next
+    frame, with the elapsed time accumulated since its last actual run.
+    """
+
+    def __init__(self):
+        self._key: tuple[tuple[int, float], ...] = ()
+        self._order: dict[int, int] = {}
+        self._buckets: dict[float, list[BaseSystem]] = {}
+        self._last: dict[float, float] = {}
+        self._heap: list[tuple[float, float]] = []
+        self._deferred: dict[int, tuple[BaseSystem, float]] = {}
+        self.overdue: set[int] = set()  # ids of the systems run late by the current frame
+
+    def update(self, systems: list[BaseSystem]):
+        """Rebuild the buckets when the system list (or a periodicity) changed."""
+        key = tuple((id(_), _.periodicity_sec) for _ in systems)
+        if key == self._key:
+            return
+        self._key = key
+        self._order = {id(_): i for i, _ in enumerate(systems)}
+        self._buckets = {}
+        for _ in systems:
+            self._buckets.setdefault(_.periodicity_sec, []).append(_)
+        self._last = {k: v for k, v in self._last.items() if k in self._buckets}
+        self._heap = [(self._last[_] + _, _) for _ in self._last]
+        heapq.heapify(self._heap)
+        self._deferred = {k: v for k, v in self._deferred.items() if k in self._order}
+
+    def due(self, now: float) -> list[tuple[BaseSystem, float]]:
+        for period in self._buckets:
+            if period not in self._last:
+                self._last[period] = now
+                heapq.heappush(self._heap, (now + period, period))
+
+        res = []
+        ready = []
+        while self._heap and self._heap[0][0] <= now:
+            ready.append(heapq.heappop(self._heap)[1])
+        for period in ready:
+            elapsed = now - self._last[period]
+            self._last[period] = now
+            heapq.heappush(self._heap, (now + period, period))
+            res.extend((_, elapsed) for _ in self._buckets[period] if id(_) not in self._deferred)
+
+        self.overdue = set(self._deferred)
+        res.extend((sys, now - last) for sys, last in self._deferred.values())
+        self._deferred.clear()
+        res.sort(key=lambda _: self._order[id(_[0])])
+        return res
+
+    def defer(self, sys: BaseSystem, last: float):
+        """Skip a due system: it will run at the next frame (last is the time of its previous actual run)."""
+        self._deferred[id(sys)] = (sys, last)
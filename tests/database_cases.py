@@ -0,0 +1,21 @@
+import functools
+from typing import Callable, Any
+from unittest import TestCase
+
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+
+STORAGE_TYPES: tuple[type[Database], ...] = (Database, ArchetypeDatabase)
+
+
+def each_database[T: TestCase](test: Callable[[T, Database], Any]) -> Callable[[T], None]:
+    """Run a test method once per storage type (one subtest each), given a fresh database."""
+
+    @functools.wraps(test)
+    def run(self: T):
+        for dtype in STORAGE_TYPES:
+            with self.subTest(storage=dtype.__name__):
+                test(self, dtype())
+
+    return run
+
@@ -0,0 +1,93 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.demography import Demography
+from tests.test_ecs import Position, Speed, Info, Move, MoveSystem
+
+
+class TestArchetypeDatabase(TimingTestCase):
+
+    def test_storage(self):
+        db = ArchetypeDatabase()
+        db.create_all([
+            [Info(), Position(x=3)],
+            [Position(x=1, y=2), Speed(x=2)],
+            [Position(x=5), Speed(y=1)],
+        ])
+        db.update_demography(db.dirty)
+
+        self.assertEqual(len(db.archetypes), 2)
+        self.assertEqual(len(db.get_table(Position).entities), 3)
+        self.assertEqual(len(db.intersect_entities([Position, Speed])), 2)
+
+        pos = db.find_any(Position, having=[Speed])
+        self.assertIsInstance(pos, Position)
+        self.assertIsInstance(pos.get(Speed), Speed)
+
+        pos.x += 10
+        self.assertEqual(db.get_table(Position).read(pos.eid).x, pos.x)
+
+    def test_row_move(self):
+        db = ArchetypeDatabase()
+        db.create_all([[Position(x=1), Speed(x=2)], [Position(x=7)]])
+        db.update_demography(db.dirty)
+        first, second = sorted(db.entities())
+
+        db.get_table(Info).create(Info(eid=second, name='added'))
+        self.assertEqual(db.get_table(Info).read(second).name, 'added')
+        self.assertEqual(db.get_table(Position).read(second).x, 7)
+
+        db.get_table(Speed).destroy(first)
+        self.assertIsNone(db.get_table(Speed).read(first))
+        self.assertEqual(db.get_table(Position).read(first).x, 1)
+
+        db.update_demography(Demography(death={first}))
+        self.assertIsNone(db.locate(first))
+        self.assertEqual(db.get_table(Position).read(second).x, 7)
+
+    def test_vec3_column(self):
+        db = ArchetypeDatabase()
+        db.create_all([Vec3.create(1, 2, 3), Vec3.create(3, 4, 0)])
+        db.update_demography(db.dirty)
+
+        items = db.get_table(Vec3).list_all()
+        self.assertEqual(sorted(_.norm() for _ in items), [14 ** .5, 5.0])
+        items[0].x = 10.
+        self.assertEqual(db.get_table(Vec3).read(items[0].eid).raw[0], 10.)
+
+    def test_view_operators(self):
+        db = ArchetypeDatabase()
+        db.create_all([Vec3.create(1, 2, 3), Vec3.create(3, 4, 0)])
+        db.update_demography(db.dirty)
+        a, b = db.get_table(Vec3).list_all()
+
+        self.assertEqual((a + Vec3.create(1, 1, 1)).raw.tolist(), [2., 3., 4.])
+        self.assertEqual((b - a).raw.tolist(), [2., 2., -3.])
+        self.assertEqual((a * 2).raw.tolist(), [2., 4., 6.])
+
+        view = a
+        view += b
+        self.assertIs(view, a)
+        self.assertEqual(db.get_table(Vec3).read(a.eid).raw.tolist(), [4., 6., 3.])
+        view /= 2
+        self.assertEqual(a.raw.tolist(), [2., 3., 1.5])
+
+        with self.assertRaises(TypeError):
+            _ = a @ b
+        with self.assertRaises(TypeError):
+            _ = -a
+
+    def test_ecs(self):
+        ecs = ECS(systems=[MoveSystem()], db=ArchetypeDatabase())
+        ecs.create_all([
+            [Info(), Position(x=1)],
+            [Position(y=2), Speed(y=2)],
+            [Info(), Position(x=6, y=6), Speed(x=2, y=1)],
+        ])
+        ecs.update()
+        ecs.update()
+
+        items = ecs.db.get_table(Move).list_all()
+        # the entity past x=3 is destroyed by MoveSystem
+        self.assertEqual(sorted((_.pos.x, _.pos.y) for _ in items), [(0, 6)])
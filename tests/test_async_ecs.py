@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from typing import override
+
+from pydantic import Field
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.async_ecs import AsyncECS, AsyncSystem
+from python_ecs.storage.database import Database
+from python_ecs.system import System
+from tests.test_ecs import Position, Info
+
+
+class UploadSystem(AsyncSystem[Info]):
+    """Slow I/O: takes several frames."""
+    _signature = Info
+    delay: float = .05
+    calls: int = 0
+    done: int = 0
+
+    @override
+    async def update(self, db: Database, dt: float):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        db.create_all([Position(x=1)])
+        self.done += 1
+
+
+class ThreadSystem(System[Info]):
+    _signature = Info
+    threads: set[int] = Field(default_factory=set)
+
+    @override
+    def update(self, db: Database, dt: float):
+        self.threads.add(threading.get_ident())
+        db.create_all([Info()])
+
+
+class ParentSystem(System[Info]):
+    """Links the entities it creates within the same update."""
+    _signature = Info
+
+    @override
+    def update(self, db: Database, dt: float):
+        for parent in sorted(db.intersect_entities([Info])):
+            child = Position()
+            db.create_all([[child]])
+            db.link(child.eid, parent)
+
+
+class TestAsyncEcs(TimingTestCase):
+
+    def test_offload(self):
+        blocking = ThreadSystem()
+        ecs = AsyncECS(systems=[blocking])
+        ecs.create_all([Info()])
+        asyncio.run(ecs.run(tick_hz=1000, frames=3))
+        self.assertNotIn(threading.get_ident(), blocking.threads)
+        self.assertEqual(len(ecs.db.entities()), 4)
+        self.assertIsNone(ecs._executor)  # default executor shut down by run
+
+    def test_async_system(self):
+        upload = UploadSystem()
+        ecs = AsyncECS(systems=[upload])
+        ecs.create_all([Info()])
+
+        async def main():
+            await ecs.run(tick_hz=100, frames=4)
+            self.assertEqual(upload.calls, 1)
+            self.assertEqual(upload.done, 0)
+            await ecs.join()
+
+        start = time.perf_counter()
+        asyncio.run(main())
+        self.assertGreaterEqual(time.perf_counter() - start, .05)
+        self.assertEqual(upload.done, 1)
+        frames = list(ecs.telemetry.frames)
+        self.assertFalse(frames[0].system('UploadSystem').skipped)
+        self.assertTrue(all(_.system('UploadSystem').skipped for _ in frames[1:]))
+
+        # changes done by the async system are applied at the next frame boundary
+        ecs.apply_demography()
+        self.assertEqual(len(ecs.db.intersect_entities([Position])), 1)
+
+        # the synchronous frame would drop the coroutine: refused before it starts
+        count = len(ecs.telemetry)
+        with self.assertRaises(TypeError):
+            ecs.update()
+        self.assertEqual(upload.calls, 1)
+        self.assertIsNone(ecs._frame)
+        self.assertEqual(len(ecs.telemetry), count)
+
+    def test_blocking_links(self):
+        ecs = AsyncECS(systems=[ParentSystem()])
+        ecs.create_all([Info()])
+        asyncio.run(ecs.run(tick_hz=1000, frames=1))
+        parent = next(iter(ecs.db.intersect_entities([Info])))
+        children = ecs.db.relation().sources_of(parent)
+        self.assertEqual(len(children), 1)
+        self.assertEqual(ecs.db.entity_types(*children), {Position})
+        self.assertFalse(ecs.telemetry.frames[-1].system('ParentSystem').failed)
+
+    def test_tick_hz(self):
+        ecs = AsyncECS(systems=[ThreadSystem()])
+        start = time.perf_counter()
+        asyncio.run(ecs.run(tick_hz=50, frames=5))
+        duration = time.perf_counter() - start
+        self.assertGreaterEqual(duration, 4 / 50)
+        self.assertEqual(len(ecs.telemetry), 5)
+
+    def test_stop(self):
+        ecs = AsyncECS(systems=[])
+
+        async def main():
+            asyncio.get_running_loop().call_later(.05, ecs.stop)
+            await ecs.run(tick_hz=100)
+
+        asyncio.run(main())
+        self.assertFalse(ecs.running)
+        self.assertGreater(len(ecs.telemetry), 1)
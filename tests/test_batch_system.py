@@ -0,0 +1,59 @@
+from typing import override
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.batch import Batch
+from python_ecs.storage.database import Database
+from python_ecs.system import BatchSystem
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info, Move
+
+
+class MoveBatchSystem(BatchSystem[Move]):
+    _signature = Move
+    _writes = [Position]
+
+    @override
+    def update_batch(self, db: Database, batch: Batch[Move], dt: float):
+        batch.pos.x += batch.speed.x
+        batch.pos.y = batch.pos.y + batch.speed.y
+
+
+class TestBatchSystem(TimingTestCase):
+
+    @each_database
+    def test_update(self, db: Database):
+        ecs = ECS(systems=[MoveBatchSystem()], db=db)
+        ecs.create_all([
+            [Info(), Position(x=1)],
+            [Position(y=2), Speed(y=2)],
+            [Info(), Position(x=6, y=6), Speed(x=2, y=1)],
+        ])
+        ecs.update()
+        ecs.update()
+
+        items = ecs.db.get_table(Position).list_all()
+        self.assertEqual(sorted((_.x, _.y) for _ in items), [(0, 6), (1, 0), (10, 8)])
+
+    def check_spawn(self, db: Database):
+        ecs = ECS(systems=[MoveBatchSystem()], db=db)
+        n = 1000
+        eids = ecs.spawn_many([Position, Speed], n, batch_size=300, Speed={
+            'x': np.ones(n, dtype=int),
+            'y': np.arange(n),
+        })
+        self.assertEqual(len(eids), n)
+        self.assertEqual(len(ecs.db.get_table(Move).entities), n)
+
+        ecs.update()
+        items = ecs.db.get_table(Position).list_all(eids[:3].tolist())
+        self.assertEqual([(_.x, _.y) for _ in items], [(1, 0), (1, 1), (1, 2)])
+
+    def test_spawn_database(self):
+        self.check_spawn(Database())
+
+    def test_spawn_archetype_database(self):
+        self.check_spawn(ArchetypeDatabase())
@@ -0,0 +1,46 @@
+import tempfile
+from pathlib import Path
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.benchmark import run_suite, save_results, load_results, compare, main, BENCHMARKS, BenchmarkResult
+
+
+class TestBenchmark(TimingTestCase):
+
+    def test_suite(self):
+        results = run_suite(scales=(100,), repeat=1)
+        self.assertEqual(len(results), 2 * len(BENCHMARKS))
+        self.assertEqual({_.name for _ in results}, set(BENCHMARKS))
+        self.assertTrue(all(_.value > 0 for _ in results))
+
+        memory = [_ for _ in results if _.name == 'memory_per_entity']
+        self.assertTrue(all(_.unit == 'bytes' for _ in memory))
+
+    def test_compare(self):
+        baseline = [
+            BenchmarkResult(name='create_all', storage='Database', scale=10, value=1.),
+            BenchmarkResult(name='system_update', storage='Database', scale=10, value=1.),
+        ]
+        current = [
+            BenchmarkResult(name='create_all', storage='Database', scale=10, value=1.05),
+            BenchmarkResult(name='system_update', storage='Database', scale=10, value=1.5),
+            BenchmarkResult(name='signature_cast', storage='Database', scale=10, value=9.),
+        ]
+        regressions = compare(baseline, current, threshold=.1)
+        self.assertEqual([_.key for _ in regressions], ['system_update[Database:10]'])
+        self.assertAlmostEqual(regressions[0].ratio, 1.5)
+        self.assertEqual(compare(baseline, current, threshold=.6), [])
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as root:
+            baseline = Path(root) / 'baseline.json'
+            args = ['run', '--scales', '50', '--storages', 'Database', '--benchmarks', 'system_update',
+                    '--repeat', '1']
+            self.assertEqual(main(args + ['--output', str(baseline)]), 0)
+            results = load_results(baseline)
+            self.assertEqual([_.key for _ in results], ['system_update[Database:50]'])
+
+            current = Path(root) / 'current.json'
+            save_results(current, [BenchmarkResult(**{**vars(results[0]), 'value': results[0].value * 10})])
+            self.assertEqual(main(['compare', str(baseline), str(baseline)]), 0)
+            self.assertEqual(main(['compare', str(baseline), str(current)]), 1)
@@ -0,0 +1,92 @@
+from typing import override
+
+from pydantic import Field
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.component import Component
+from python_ecs.ecs import ECS
+from python_ecs.storage.database import Database
+from python_ecs.system import System
+from tests.database_cases import each_database
+from tests.test_batch_system import MoveBatchSystem
+from tests.test_ecs import Position, Speed, Move
+
+
+class Heat(Component):
+    value: float = 0.
+
+
+class SyncSystem(System[Position]):
+    _signature = Position
+    _changed = [Position]
+    seen: list[int] = Field(default_factory=list)
+
+    @override
+    def update_single(self, db: Database, item: Position, dt: float):
+        self.seen.append(item.eid)
+
+
+class PushSystem(System[Move]):
+    _signature = Move
+    _changed = [Speed]
+
+    @override
+    def update_single(self, db: Database, item: Move, dt: float):
+        item.pos.x += item.speed.x
+
+
+class TestChanges(TimingTestCase):
+
+    @each_database
+    def test_changed_entities(self, db: Database):
+        sync = SyncSystem()
+        ecs = ECS(systems=[PushSystem(), sync], db=db)
+        ecs.create_all([
+            [Position(), Speed(x=1)],
+            [Position(), Speed()],
+            [Position(x=5)],
+        ])
+        ecs.update()
+        mover, idle, static = sorted(db.entities())
+        self.assertEqual(sorted(sync.seen), [mover, idle, static])
+
+        sync.seen.clear()
+        ecs.update()
+        self.assertEqual(sync.seen, [])
+
+        db.get_table(Speed).read(idle).x = 2
+        ecs.update()
+        self.assertEqual(sync.seen, [idle])
+        self.assertEqual(db.get_table(Position).read(idle).x, 2)
+
+        sync.seen.clear()
+        db.spawn_many([Position], 2)
+        ecs.update()
+        self.assertEqual(len(sync.seen), 2)
+
+    @each_database
+    def test_batch_writes(self, db: Database):
+        ecs = ECS(systems=[MoveBatchSystem()], db=db)
+        ecs.create_all([[Position(), Speed(x=1)] for _ in range(3)])
+        db.update_demography(db.drain())
+        db.track_changes(Position)
+        db.track_changes(Speed)
+        since = db.changes.version
+        db.tick()
+        ecs.update()
+        # only the declared _writes are recorded
+        self.assertEqual(len(db.changed_entities([Position], since)), 3)
+        self.assertEqual(db.changed_entities([Speed], since), set())
+
+    def test_untracked_writes(self):
+        db = Database()
+        db.create_all([[Heat()]])
+        db.update_demography(db.drain())
+        # no hook on the types the database does not track nor index
+        self.assertFalse(getattr(Heat.__setattr__, 'watched', False))
+
+        db.value_index(Heat, 'value', kind='sorted')
+        heat = db.get_table(Heat).read(next(iter(db.entities())))
+        heat.value = 3.
+        self.assertTrue(Heat.__setattr__.watched)
+        self.assertEqual(db.find_range(Heat, 'value', low=1.), [heat.eid])
@@ -0,0 +1,109 @@
+from typing import override
+
+from pydantic import Field
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from python_ecs.storage.changes import Journal
+from python_ecs.storage.demography import Demography
+from python_ecs.system import System
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info, Move
+
+
+class TrackSystem(System[Move]):
+    _signature = Move
+    registered: set[int] = Field(default_factory=set)
+
+    @override
+    def register(self, item: Move):
+        self.registered.add(item.eid)
+
+    @override
+    def unregister(self, item: Move):
+        self.registered.remove(item.eid)
+
+
+class SpawnSystem(System[Position]):
+    """Uses the ids of the entities it creates within the same update."""
+    _signature = Position
+
+    @override
+    def update_single(self, db: Database, item: Position, dt: float):
+        child = Info()
+        db.create_all([[child]])
+        db.link(child.eid, item.eid)
+
+
+class TestDemography(TimingTestCase):
+
+    @each_database
+    def test_update(self, db: Database):
+        db.create_all([[Position(x=i)] for i in range(6)] + [[Info(), Position(x=6), Speed(x=1)]])
+        db.update_demography(db.drain())
+        eids = sorted(db.entities())
+
+        db.update_demography(Demography(death=eids[1:4]))
+        self.assertEqual(sorted(db.entities()), [eids[0], *eids[4:]])
+        self.assertEqual(sorted(_.x for _ in db.get_table(Position).list_all()), [0, 4, 5, 6])
+
+        first, last = eids[0], eids[-1]
+        db.add_component(first, Speed(x=2))
+        db.add_component(first, Info(name='first'))
+        db.remove_component(last, Speed)
+        db.remove_component(last, Info)
+        db.add_component(eids[1], Info())  # dead: ignored
+        db.update_demography(db.drain())
+
+        self.assertEqual(db.entity_types(first), {Position, Speed, Info})
+        self.assertIsInstance(db.entity_types(first), frozenset)
+        self.assertEqual(db.entity_types(last), {Position})
+        self.assertEqual(db.get_table(Speed).read(first).x, 2)
+        self.assertEqual(db.get_table(Position).read(first).x, 0)
+        self.assertIsNone(db.get_table(Speed).read(last))
+        self.assertEqual(db.query(all=[Speed]).entities, {first})
+
+    @each_database
+    def test_cascaded_ops(self, db: Database):
+        parent, child = db.spawn_many([Position], 2).tolist()
+        db.link(child, parent)
+        db.track_changes(Speed)
+        db.journal = Journal()
+        born = Info()
+        db.create_all([[born]])
+        db.link(born.eid, child)
+        db.add_component(child, Speed(x=1))
+        db.add_component(born.eid, Speed(x=2))
+        db.remove_component(child, Position)
+        db.destroy_all(parent)
+        db.update_demography(db.drain())
+
+        self.assertEqual(list(db.entities()), [])
+        self.assertEqual(db.get_table(Speed).list_all(), [])
+        self.assertEqual(db.query(all=[Speed]).entities, set())
+        self.assertEqual(db.changed_entities([Speed], 0), set())
+        self.assertEqual((db.journal.born, db.journal.removed), (set(), set()))
+
+    def test_ecs(self):
+        track = TrackSystem()
+        ecs = ECS(systems=[track], db=ArchetypeDatabase())
+        ecs.create_all([[Position()], [Position(), Speed()]])
+        ecs.update()
+        still, moving = sorted(ecs.db.entities())
+        self.assertEqual(track.registered, {moving})
+
+        ecs.db.add_component(still, Speed(x=1))
+        ecs.db.remove_component(moving, Speed)
+        ecs.update()
+        self.assertEqual(track.registered, {still})
+        self.assertEqual(ecs.db.get_table(Move).read(still).speed.x, 1)
+        self.assertIsNone(ecs.db.get_table(Move).read(moving))
+
+    def test_ids_in_system(self):
+        ecs = ECS(systems=[SpawnSystem()])
+        ecs.create_all([[Position()]])
+        ecs.update()
+        parent, child = sorted(ecs.db.entities())
+        self.assertEqual(ecs.db.relation().sources_of(parent), {child})
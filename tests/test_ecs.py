@@ -1,4 +1,7 @@
+import json
+import tempfile
 import uuid
+from pathlib import Path
 from typing import override
 
 from pydantic import Field
@@ -49,8 +52,39 @@ class MoveSystem(System[Move]):
             ])
 
 
+class CountSystem(System[Move]):
+    _signature = Move
+    registered: set[int] = Field(default_factory=set)
+
+    @override
+    def register(self, item: Move):
+        self.registered.add(item.eid)
+
+    @override
+    def unregister(self, item: Move):
+        self.registered.remove(item.eid)
+
+
 class TestEcs(TimingTestCase):
 
+    def test_dispatch(self):
+        count = CountSystem()
+        ecs = ECS(systems=[count])
+        ecs.create_all([
+            Info(),
+            [Info(), Position(x=3)],
+            [Position(y=2), Speed(y=2)],
+            [Info(), Position(x=6, y=6), Speed(x=2, y=1)],
+        ])
+        ecs.update()
+        self.assertEqual(len(count.registered), 2)
+        self.assertEqual(len(ecs.db.get_table(Move).entities), 2)
+
+        ecs.db.destroy_all(ecs.db.get_table(Info).list_all())
+        ecs.update()
+        self.assertEqual(len(count.registered), 1)
+        self.assertEqual(len(ecs.db.get_table(Move).entities), 1)
+
     def test_ecs(self):
         # init systems
         ecs = ECS(systems=[
@@ -80,3 +114,33 @@ class TestEcs(TimingTestCase):
 
         print('update (move)')
         ecs.update()
+
+    def test_telemetry(self):
+        ecs = ECS(systems=[MoveSystem(), CountSystem().at_interval(3600)])
+        ecs.create_all([
+            [Info(), Position(x=3)],
+            [Info(), Position(x=6, y=6), Speed(x=2, y=1)],
+        ])
+        for _ in range(5):
+            ecs.update()
+
+        frames = ecs.telemetry.frames
+        self.assertEqual(len(frames), 5)
+        self.assertEqual(frames[0].births, 2)
+        # the moving entity goes past x=3 at the first frame: MoveSystem returns its death
+        self.assertEqual(frames[0].entities, 1)
+        self.assertEqual(frames[0].system('MoveSystem').entities, 1)
+        self.assertEqual(frames[0].deaths, 1)
+        self.assertEqual(frames[-1].system('MoveSystem').entities, 0)
+        self.assertEqual(ecs.db.queries, {})  # counted from the registered entities
+        self.assertTrue(frames[-1].system('CountSystem').skipped)
+        self.assertEqual(set(ecs.last_updates), {MoveSystem})
+        self.assertEqual(set(ecs.telemetry.percentiles(system='MoveSystem')), {'p50', 'p95', 'p99'})
+
+        with tempfile.TemporaryDirectory() as root:
+            ecs.telemetry.export_jsonl(Path(root) / 'frames.jsonl')
+            ecs.telemetry.export_chrome_trace(Path(root) / 'trace.json')
+            lines = (Path(root) / 'frames.jsonl').read_text().splitlines()
+            trace = json.loads((Path(root) / 'trace.json').read_text())
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(len(trace['traceEvents']), 5 + 5)
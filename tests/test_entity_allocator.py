@@ -0,0 +1,68 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.storage.entity_allocator import EntityAllocator, entity_index, entity_generation
+from tests.database_cases import each_database
+from tests.test_ecs import Position
+
+
+class TestEntityAllocator(TimingTestCase):
+
+    def test_allocator(self):
+        allocator = EntityAllocator()
+        eids = allocator.gen(4).tolist()
+        self.assertEqual(eids, [0, 1, 2, 3])
+
+        allocator.release([eids[1], eids[2], eids[1]])
+        self.assertEqual(len(allocator), 2)
+        self.assertFalse(allocator.alive(eids[1]))
+
+        reused = allocator.gen(3).tolist()
+        self.assertEqual([entity_index(_) for _ in reused], [1, 2, 4])
+        self.assertEqual([entity_generation(_) for _ in reused], [1, 1, 0])
+        self.assertTrue(allocator.alive(reused[0]))
+        self.assertFalse(allocator.alive(eids[1]))
+
+        # scalar path: same ids as gen
+        allocator.release(reused[:1])
+        eid, fresh = allocator.new_id(), allocator.new_id()
+        self.assertEqual((entity_index(eid), entity_generation(eid)), (1, 2))
+        self.assertEqual(fresh, 5)
+        self.assertTrue(allocator.alive(eid) and allocator.alive(fresh))
+        self.assertEqual(len(allocator), 6)
+
+        growing = EntityAllocator()
+        self.assertEqual([growing.new_id() for _ in range(40)], list(range(40)))
+        self.assertTrue(growing.alive(39))
+
+    @each_database
+    def test_reuse(self, db: Database):
+        eids = db.spawn_many([Position], 3).tolist()
+        db.update_demography(Demography(death=eids[:2]))
+        db.create_all([[Position(x=7)]])
+        db.update_demography(db.drain())
+
+        eid = max(db.entities())
+        self.assertEqual(entity_index(eid), 0)
+        self.assertFalse(db.is_alive(eids[0]))
+        self.assertIsNone(db.get_table(Position).read(eids[0]))
+        self.assertEqual(db.get_table(Position).read(eid).x, 7)
+
+    @each_database
+    def test_short_lived(self, db: Database):
+        p = Position()
+        db.create_all([[p]])
+        db.destroy_all(p)
+        db.update_demography(db.drain())
+        self.assertFalse(db.is_alive(p.eid))
+        self.assertEqual(list(db.entities()), [])
+        self.assertIsNone(db.get_table(Position).read(p.eid))
+
+        eid = db.spawn_many([Position], 1).item()
+        self.assertEqual((entity_index(eid), entity_generation(eid)), (0, 1))
+        self.assertEqual(list(db.entities()), [eid])
+        self.assertEqual(len(db.get_table(Position).entities), 1)
+
+    def test_id_spaces(self):
+        a, b = Database(), Database()
+        self.assertEqual(a.spawn_many([Position], 2).tolist(), b.spawn_many([Position], 2).tolist())
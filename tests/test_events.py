@@ -0,0 +1,116 @@
+from typing import override
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.events import Event, EventChannel, EventBus
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.system import System
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Move
+
+
+class Collision(Event):
+    a: int
+    b: int
+    force: float = 1.
+
+
+class CollideSystem(System[Move]):
+    _signature = Move
+
+    @override
+    def update(self, db: Database, dt: float):
+        eids = np.array(sorted(db.intersect_entities(Move.signature())))
+        db.events.emit_many(Collision, a=eids, b=eids[::-1], force=eids * 2.)
+
+
+class DamageSystem(System[Move]):
+    _signature = Move
+    received: list[int] = []
+
+    @override
+    def update(self, db: Database, dt: float):
+        if not hasattr(self, '_reader'):
+            self._reader = db.events.reader(Collision)
+        events = self._reader.read()
+        self.received.append(len(events))
+        for eid in events['a'][events['force'] > 2].tolist():
+            db.destroy_all(eid)
+
+
+class KillSystem(System[Move]):
+    _signature = Move
+
+    @override
+    def update_single(self, db: Database, item: Move, dt: float):
+        return Demography().with_death(item.eid)
+
+
+class TestEvents(TimingTestCase):
+
+    def test_channel(self):
+        channel = EventChannel(Collision, capacity=4)
+        channel.emit(a=1, b=2)
+        channel.emit_many(a=np.arange(3), b=7)
+        events, cursor, missed = channel.read(0)
+        self.assertEqual(events['a'].tolist(), [1, 0, 1, 2])
+        self.assertEqual(events['b'].tolist(), [2, 7, 7, 7])
+        self.assertEqual(events['force'].tolist(), [1.] * 4)
+        self.assertEqual((cursor, missed), (4, 0))
+
+        # the current and previous frames are kept: the buffer grows
+        channel.emit_many(3, a=5)
+        self.assertEqual(len(channel.buffer), 8)
+        self.assertEqual(channel.read(cursor)[0]['a'].tolist(), [5, 5, 5])
+
+        channel.swap()
+        channel.swap()
+        channel.emit_many(8, a=np.arange(8))
+        self.assertEqual(len(channel.buffer), 8)
+        events, cursor, missed = channel.read(2)
+        self.assertEqual((len(events), missed), (8, 5))
+
+    def test_reader(self):
+        bus = EventBus(capacity=2)
+        first = bus.reader(Collision)
+        bus.emit(Collision, a=1, b=2)
+        second = bus.reader(Collision)
+        bus.emit(Collision, a=3, b=4)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(first.read()['a'].tolist(), [1, 3])
+        self.assertEqual(second.read()['a'].tolist(), [1, 3])
+        self.assertEqual(len(first.read()), 0)
+
+        for _ in range(3):
+            bus.swap()
+        bus.emit(Collision, a=5, b=6)
+        self.assertEqual(first.read()['a'].tolist(), [5])
+        self.assertEqual(first.missed, 0)
+
+    def test_dtype(self):
+        self.assertEqual(Collision.dtype().names, ('a', 'b', 'force'))
+        with self.assertRaises(TypeError):
+            type('Empty', (Event,), {}).dtype()
+
+    @each_database
+    def test_systems(self, db: Database):
+        damage = DamageSystem()
+        ecs = ECS(db=db, systems=[CollideSystem(), damage])
+        items = [[Position(), Speed()] for _ in range(4)]
+        ecs.create_all(items)
+        eids = [_[0].eid for _ in items]
+        ecs.update()
+        ecs.update()
+        # force is 2 * eid: the last two entities are destroyed at the first frame
+        self.assertEqual(damage.received, [4, 2])
+        self.assertEqual(sorted(db.entities()), eids[:2])
+
+    def test_returned_demography(self):
+        ecs = ECS(systems=[KillSystem()])
+        ecs.create_all([[Position(), Speed()], [Position()]])
+        ecs.update()
+        self.assertEqual(len(ecs.db.entities()), 1)
+        self.assertEqual(Demography().with_death([np.int64(3), 4]).death, {3, 4})
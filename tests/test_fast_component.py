@@ -0,0 +1,106 @@
+from pydantic import ValidationError
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.component import Component
+from python_ecs.ecs import ECS
+from python_ecs.fast_component import FastComponent, fast_component
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.signature import Signature
+from python_ecs.storage.database import Database
+from python_ecs.system import System
+from tests.database_cases import each_database
+from tests.test_ecs import Speed
+
+
+class Body(FastComponent):
+    x: int = 0
+    mass: float = 1.
+
+
+class Tag(FastComponent, validate=True):
+    name: str
+
+
+class Inventory(FastComponent):
+    items: list[str] = []
+    counts: dict[str, int] = {}
+
+
+FastVec3 = fast_component(Vec3)
+
+
+class Falling(Signature):
+    body: Body
+    speed: Speed
+
+
+class FallSystem(System[Falling]):
+    _signature = Falling
+
+    def update_single(self, db: Database, item: Falling, dt: float):
+        item.body.x += item.speed.x
+
+
+class TestFastComponent(TimingTestCase):
+
+    def test_contract(self):
+        body = Body(x=2)
+        self.assertIsInstance(body, Component)
+        self.assertTrue(issubclass(Body, Component))
+        self.assertNotIsInstance(body, Speed)
+        self.assertFalse(issubclass(Body, Speed))
+        # component subclasses keep the native pydantic checks
+        self.assertIsNot(type(Speed).__instancecheck__, type(Component).__instancecheck__)
+        self.assertEqual((body.eid, body.mass), (-1, 1.))
+        self.assertEqual(Body.signature(), [Body])
+        self.assertIs(Body.cast([Speed(), body]), body)
+        self.assertFalse(hasattr(body, '__dict__'))
+        with self.assertRaises(AttributeError):
+            body.other = 1
+
+        self.assertEqual(Tag(name='a').name, 'a')
+        with self.assertRaises(ValidationError):
+            Tag(name=1)
+        with self.assertRaises(TypeError):
+            Tag()
+
+        vec = FastVec3.create(3, 4, 0)
+        self.assertEqual(vec.norm(), 5.)
+        self.assertEqual((vec * 2).raw.tolist(), [6., 8., 0.])
+
+    def test_mutable_defaults(self):
+        a, b = Inventory(), Inventory()
+        a.items.append('sword')
+        a.counts['sword'] = 1
+        self.assertEqual((b.items, b.counts), ([], {}))
+        self.assertEqual(Inventory.model_construct().items, [])
+        self.assertEqual(Inventory(items=['shield']).items, ['shield'])
+
+    @each_database
+    def test_tracked_writes(self, db: Database):
+        eid = db.spawn_many([Body], 1).item()
+        db.track_changes(Body)
+        db.value_index(Body, 'x')
+        since = db.changes.version
+        db.tick()
+        body = db.get_table(Body).read(eid)
+        body.x = 3
+        self.assertEqual(db.changed_entities([Body], since), {eid})
+        self.assertEqual(db.find_by(Body, 'x', 3), {eid})
+
+        # the copy constructor does not record writes
+        since = db.changes.version
+        db.tick()
+        self.assertEqual(body.model_copy().x, 3)
+        self.assertEqual(db.changed_entities([Body], since), set())
+
+    @each_database
+    def test_update(self, db: Database):
+        ecs = ECS(systems=[FallSystem()], db=db)
+        ecs.create_all([[Body(), Speed(x=2), FastVec3.create(1, 0, 0)], [Body(x=5)]])
+        ecs.update()
+        ecs.update()
+        moving = next(iter(db.query(all=[Body, Speed]).entities))
+        self.assertEqual(db.get_table(Body).read(moving).x, 4)
+        self.assertEqual(db.get_table(FastVec3).read(moving).x, 1.)
+        self.assertEqual(len(db.query(all=[Body]).entities), 2)
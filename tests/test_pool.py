@@ -0,0 +1,80 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from python_ecs.storage.pool import ComponentPool
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info
+
+
+class TestPool(TimingTestCase):
+
+    def test_pool(self):
+        pool = ComponentPool(max_size=2)
+        first = pool.acquire(Position, x=3)
+        self.assertEqual((first.x, first.y), (3, 0))
+
+        first.eid, first.y = 12, 5
+        pool.release([first, Position(), Position()])
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.stats[Position].dropped, 1)
+
+        cid = first.cid
+        item = pool.acquire(Position, y=1)
+        self.assertIsNot(item, first)
+        item = pool.acquire(Position, y=1)
+        self.assertIs(item, first)
+        self.assertEqual((item.x, item.y, item.eid, item.db), (0, 1, -1, None))
+        self.assertGreater(item.cid, cid)
+
+        stats = pool.stats[Position]
+        self.assertEqual((stats.hits, stats.misses, stats.released), (2, 1, 2))
+        self.assertAlmostEqual(pool.total().hit_rate, 2 / 3)
+
+        with self.assertRaises(ValueError):
+            pool.acquire(Position, z=1)
+
+    def test_limit(self):
+        pool = ComponentPool()
+        pool.release([Info(), Info()])
+        pool.limit(Info, 1)
+        self.assertEqual(len(pool), 1)
+        pool.limit(Info, 0)
+        pool.release([Info()])
+        self.assertEqual(len(pool), 0)
+
+        # fields with a default factory get a fresh value
+        pool.limit(Info, 1)
+        item = Info()
+        name = item.name
+        pool.release([item])
+        self.assertNotEqual(pool.acquire(Info).name, name)
+
+    @each_database
+    def test_database_pool(self, db: Database):
+        pool = db.component_pool(max_size=100)
+        ecs = ECS(db=db)
+        for wave in range(3):
+            ecs.create_all([
+                [pool.acquire(Position, x=wave), pool.acquire(Speed, x=1)]
+                for _ in range(10)
+            ])
+            ecs.update()
+            self.assertEqual({db.get_table(Position).read(_).x for _ in db.entities()}, {wave})
+            db.destroy_all(list(db.entities()))
+            ecs.update()
+        self.assertEqual(len(db.entities()), 0)
+
+        stats = pool.stats[Position]
+        if isinstance(db, ArchetypeDatabase):
+            # components are copied into the columns: the database owns no instance to recycle
+            self.assertEqual((stats.misses, stats.hits, stats.released), (30, 0, 0))
+        else:
+            self.assertEqual((stats.misses, stats.hits), (10, 20))
+
+        # an instance given by the caller is never handed out again while the caller holds it
+        item = pool.acquire(Position, x=7)
+        ecs.create_all([[item]])
+        ecs.update()
+        self.assertIsNot(pool.acquire(Position), item)
+        self.assertEqual(item.x, 7)
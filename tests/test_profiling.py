@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from easy_kit.timing import _TIMING
+from python_ecs.profiling import parse_mode, time_func_for
+
+
+def work(x: int):
+    return x + 1
+
+
+class TestProfiling(TestCase):
+
+    def test_parse_mode(self):
+        self.assertEqual(parse_mode('on'), ('on', 1))
+        self.assertEqual(parse_mode(' OFF '), ('off', 0))
+        self.assertEqual(parse_mode('sample:100'), ('sample', 100))
+        with self.assertRaises(ValueError):
+            parse_mode('sample:0')
+        with self.assertRaises(ValueError):
+            parse_mode('verbose')
+
+    def test_off(self):
+        self.assertIs(time_func_for('off')(work), work)
+
+    def test_sample(self):
+        _TIMING.setup_timing(show_at_exit=False)
+        func = time_func_for('sample', 10)(work)
+        for _ in range(100):
+            self.assertEqual(func(1), 2)
+        entry = _TIMING.db[work.__qualname__]
+        entry.compress()
+        self.assertEqual(entry.values['count'], 10)
@@ -0,0 +1,62 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.storage.query import Query
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info
+
+
+class TestQuery(TimingTestCase):
+
+    @each_database
+    def test_maintenance(self, db: Database):
+        moving = db.register_query(Query(all=[Position, Speed]))
+        static = db.query(all=[Position], none=[Speed])
+        named = db.query(any=[Info, Speed])
+
+        db.create_all([
+            [Info(), Position(x=3)],
+            [Position(x=1, y=2), Speed(x=2)],
+            [Info()],
+        ])
+        db.update_demography(db.dirty)
+        db.dirty.clear()
+        info, mover, other = sorted(db.entities())
+
+        self.assertIs(db.query(all=[Speed, Position]), moving)
+        self.assertEqual(moving.entities, {mover})
+        self.assertEqual(static.entities, {info})
+        self.assertEqual(named.entities, {info, mover, other})
+        self.assertEqual(db.query(none=[Info]).entities, {mover})
+
+        db.update_demography(Demography(death={mover}))
+        self.assertEqual(moving.entities, set())
+        self.assertEqual(named.entities, {info, other})
+        self.assertEqual(db.intersect_entities([Info, Position]), {info})
+
+    def test_undeclared(self):
+        db = Database()
+        db.create_all([[Position(x=1), Speed()], [Position(x=2)]])
+        db.update_demography(db.dirty)
+        # stored behind the database back: only visible to the tables
+        db.get_table(Position).create(Position(eid=100, x=3))
+        db.get_table(Speed).create(Speed(eid=100))
+
+        self.assertEqual(len(db.intersect_entities([Position, Speed])), 2)
+        self.assertEqual(len(db.union_entities([Position, Speed])), 3)
+        self.assertIn(db.find_any(Position, having=[Speed]).eid, db.intersect_entities([Speed]))
+        self.assertEqual(db.queries, {})
+        self.assertIsInstance(db.get_table(Position).entities, set)
+
+    def test_attach(self):
+        db = ArchetypeDatabase()
+        static = db.query(all=[Position], none=[Speed])
+        db.create_all([[Info(), Position(x=3)]])
+        db.update_demography(db.drain())
+
+        # a component stored through its table moves the entity to another archetype
+        eid, = static.entities
+        db.get_table(Speed).create(Speed(eid=eid))
+        self.assertEqual(db.query(all=[Position, Speed]).entities, {eid})
+        self.assertEqual(static.entities, set())
@@ -0,0 +1,71 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.storage.database import Database
+from python_ecs.storage.relations import Relation, CHILD_OF
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info, CountSystem
+
+
+class TestRelations(TimingTestCase):
+
+    def test_relation(self):
+        tree = Relation(CHILD_OF, exclusive=True)
+        # 0 <- 1 <- 3, 0 <- 2 <- 4 <- 5
+        for child, parent in [(1, 0), (2, 0), (3, 1), (4, 2), (5, 4)]:
+            tree.link(child, parent)
+        self.assertEqual([_.tolist() for _ in tree.levels()], [[0], [1, 2], [3, 4], [5]])
+        self.assertEqual(tree.ordered([2]), [2, 4, 5])
+        self.assertEqual(tree.descendants([2]), {4, 5})
+
+        sources, targets = tree.pairs([0, 4])
+        self.assertEqual(sources.tolist(), [1, 2, 5])
+        self.assertEqual(targets.tolist(), [0, 0, 4])
+
+        # exclusive: a new parent replaces the previous one
+        tree.link(5, 3)
+        self.assertEqual(tree.target_of(5), 3)
+        self.assertEqual(tree.sources_of(4), set())
+        self.assertEqual(len(tree), 5)
+
+        tree.forget([1])
+        self.assertEqual(tree.sources_of(0), {2})
+        self.assertEqual(tree.target_of(3), None)
+
+        with self.assertRaises(ValueError):
+            tree.link(3, 3)
+
+    def test_dag(self):
+        graph = Relation('depends_on')
+        graph.link(2, 0)
+        graph.link(2, 1)
+        graph.link(1, 0)
+        self.assertEqual(graph.ordered(), [0, 1, 2])
+        graph.link(0, 2)
+        with self.assertRaises(ValueError):
+            graph.levels()
+
+    @each_database
+    def test_cascade(self, db: Database):
+        count = CountSystem()
+        ecs = ECS(db=db, systems=[count])
+        ecs.create_all([[Position(), Speed()], [Position(), Speed()], [Info()], [Position(), Speed()]])
+        ecs.update()
+        root, child, grandchild, other = sorted(db.entities())
+        db.link(child, root)
+        db.link(grandchild, child)
+        db.relation('targets').link(other, root)
+        with self.assertRaises(ValueError):
+            db.link(root, 10 ** 6)
+        with self.assertRaises(KeyError):
+            db.link(root, other, name='unknown')
+
+        self.assertEqual(db.relation().ordered(), [root, child, grandchild])
+        self.assertEqual(len(count.registered), 3)
+
+        db.destroy_all([db.get_table(Position).read(root)])
+        ecs.apply_demography()
+        self.assertEqual(db.entities(), {other})
+        self.assertEqual(count.registered, {other})
+        self.assertEqual(len(db.relation()), 0)
+        # not cascading: the link is removed
+        self.assertEqual(db.relation('targets').targets_of(other), set())
@@ -0,0 +1,81 @@
+import io
+import os
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.storage.archetype import component_fields
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from python_ecs.storage.replication import Delta, DeltaWriter, read_deltas
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info, MoveSystem
+from tests.test_snapshot import Tagged
+
+
+def content(db: Database) -> dict[int, dict[str, dict]]:
+    res = {}
+    for eid in db.entities():
+        res[eid] = {}
+        for ctype in db.entity_types(eid):
+            item = db.get_table(ctype).read(eid)
+            values = {_: getattr(item, _) for _ in component_fields(ctype)}
+            res[eid][ctype.__name__] = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in values.items()}
+    return res
+
+
+class TestReplication(TimingTestCase):
+
+    def test_encoding(self):
+        db = Database()
+        db.create_all([[Info(name='a'), Position(x=1)], [Vec3.create(1, 2, 3)], [Tagged(tags=('a',), parent=2)]])
+        db.update_demography(db.drain())
+        delta, _ = db.encode_delta(0, 0, keyframe=True)
+
+        stream = io.BytesIO()
+        size = delta.write(stream)
+        delta.write(stream)
+        self.assertEqual(len(stream.getvalue()), 2 * size)
+        stream.seek(0)
+        deltas = list(read_deltas(stream))
+        self.assertEqual(len(deltas), 2)
+
+        replica = Database()
+        replica.apply_delta(deltas[0])
+        self.assertEqual(content(replica), content(db))
+
+        stream = io.BytesIO(stream.getvalue()[:size - 1])
+        with self.assertRaises(EOFError):
+            Delta.read(stream)
+
+    @each_database
+    def test_stream(self, db: Database):
+        self.replicate(db, type(db)())
+
+    def replicate(self, master: Database, replica: Database):
+        read, write = os.pipe()
+        with os.fdopen(write, 'wb') as out, os.fdopen(read, 'rb') as source:
+            ecs = ECS(db=master, systems=[MoveSystem()], replication=DeltaWriter(out, keyframe_interval=4))
+            ecs.create_all([
+                [Info(name='a'), Position(x=1)],
+                [Position(y=2), Speed(x=1, y=2)],
+                [Info(name='b'), Position(x=2, y=6), Speed(x=1, y=1)],
+            ])
+            for frame in range(6):
+                if frame == 2:
+                    eid = min(master.entities())
+                    master.remove_component(eid, Info)
+                    master.add_component(eid, Speed(x=3, y=1))
+                ecs.update()
+                delta = Delta.read(source)
+                self.assertEqual(delta.keyframe, frame % 4 == 0)
+                replica.apply_delta(delta)
+                self.assertEqual(content(replica), content(master))
+                self.assertEqual(replica.allocator.size, master.allocator.size)
+            self.assertGreater(ecs.replication.bytes, 0)
+            self.assertEqual((master.queries, replica.queries), ({}, {}))
+
+    def test_mixed(self):
+        self.replicate(ArchetypeDatabase(), Database())
@@ -0,0 +1,64 @@
+from typing import override
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.scheduler import Scheduler, build_stages
+from python_ecs.storage.database import Database
+from python_ecs.system import System
+from tests.test_batch_system import MoveBatchSystem
+from tests.test_ecs import Position, Speed, Info
+
+
+class RenameSystem(System[Info]):
+    _signature = Info
+
+    @override
+    def update_single(self, db: Database, item: Info, dt: float):
+        item.name = item.name.upper()
+
+
+class SpawnSystem(System[Info]):
+    _signature = Info
+    _reads = [Info]
+    _writes = []
+
+    @override
+    def update(self, db: Database, dt: float):
+        db.create_all([Speed(x=1)])
+
+
+class ResetSystem(System[Position]):
+    _signature = Position
+
+    @override
+    def update_single(self, db: Database, item: Position, dt: float):
+        item.y = 0
+
+
+class TestScheduler(TimingTestCase):
+
+    def test_stages(self):
+        move, rename, spawn, reset = MoveBatchSystem(), RenameSystem(), SpawnSystem(), ResetSystem()
+        stages = build_stages([move, rename, spawn, reset])
+        self.assertEqual(stages, [[move, rename], [spawn, reset]])
+
+        class Unknown(System):
+            pass
+
+        unknown = Unknown()
+        self.assertEqual(build_stages([move, unknown, rename]), [[move], [unknown], [rename]])
+
+    def test_parallel_update(self):
+        scheduler = Scheduler(max_workers=4)
+        ecs = ECS(systems=[MoveBatchSystem(), RenameSystem(), SpawnSystem(), ResetSystem()], scheduler=scheduler)
+        ecs.create_all([
+            [Info(name='a'), Position(x=1, y=1), Speed(x=1, y=1)],
+            [Info(name='b'), Position(x=2, y=2), Speed(x=1, y=1)],
+        ])
+        ecs.update()
+        scheduler.close()
+
+        self.assertEqual(len(scheduler.stages), 2)
+        self.assertEqual(sorted(_.name for _ in ecs.db.get_table(Info).list_all()), ['A', 'B'])
+        self.assertEqual(sorted((_.x, _.y) for _ in ecs.db.get_table(Position).list_all()), [(2, 0), (3, 0)])
+        self.assertEqual(len(ecs.db.get_table(Speed).entities), 3)
@@ -0,0 +1,81 @@
+from typing import override
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.sharded import ShardedScheduler, ShardDatabase
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.batch import Batch
+from python_ecs.system import BatchSystem
+from tests.test_batch_system import MoveBatchSystem
+from tests.test_ecs import Position, Speed, Info
+
+
+class SplitSystem(BatchSystem[Position]):
+    _signature = Position
+
+    @override
+    def update_batch(self, db: ShardDatabase, batch: Batch[Position], dt: float):
+        far = batch.eids[batch.x > 1000]
+        db.destroy_entities(far)
+        db.create_all([Info(name='split') for _ in far])
+
+
+class CountSystem(BatchSystem[Position]):
+    """Keeps a frame counter in its worker copies."""
+    _signature = Position
+    calls: int = 0
+
+    @override
+    def update_batch(self, db: ShardDatabase, batch: Batch[Position], dt: float):
+        self.calls += 1
+        db.create_all([Info(name=f'call {self.calls}')])
+
+
+class NameSystem(BatchSystem[Info]):
+    _signature = Info
+
+    @override
+    def update_batch(self, db: ShardDatabase, batch: Batch[Info], dt: float):
+        pass
+
+
+class TestSharded(TimingTestCase):
+
+    def test_sharded_update(self):
+        n = 10_000
+        with ShardedScheduler(workers=3) as scheduler:
+            ecs = ECS(systems=[MoveBatchSystem(), SplitSystem()], db=ArchetypeDatabase(), scheduler=scheduler)
+            eids = ecs.spawn_many([Position, Speed], n, Speed={'x': np.arange(n)})
+            ecs.update()
+
+            positions = ecs.db.get_table(Position)
+            self.assertEqual([positions.read(_).x for _ in eids[:5].tolist()], [0, 1, 2, 3, 4])
+            self.assertEqual(len(positions.entities), 1001)
+            self.assertEqual(len(ecs.db.get_table(Info).entities), n - 1001)
+
+            ecs.update()
+            self.assertEqual(len(positions.entities), 501)
+
+    def test_system_stats(self):
+        with ShardedScheduler(workers=2) as scheduler:
+            count = CountSystem()
+            ecs = ECS(systems=[count, NameSystem()], db=ArchetypeDatabase(), scheduler=scheduler)
+            ecs.spawn_many([Position], 10)
+            ecs.update()
+            ecs.update()
+
+            stats = ecs.telemetry.frames[-1].system('CountSystem')
+            self.assertFalse(stats.skipped or stats.failed)
+            self.assertEqual(stats.entities, 10)
+            self.assertGreater(stats.duration, 0)
+            self.assertIn(CountSystem, ecs.last_updates)
+
+            # each worker keeps its copy of the system across frames
+            names = sorted(_.name for _ in ecs.db.get_table(Info).list_all())
+            self.assertEqual(names, ['call 1', 'call 1', 'call 2', 'call 2'])
+            self.assertEqual(count.calls, 0)
+
+            # object columns (Info.name) can not be shared: the system fails without reaching the workers
+            self.assertTrue(ecs.telemetry.frames[-1].system('NameSystem').failed)
@@ -0,0 +1,40 @@
+from easy_kit.timing import TimingTestCase
+from python_ecs.signature import Signature
+from tests.test_ecs import Position, Speed, Info, Move
+
+
+class TestSignature(TimingTestCase):
+
+    def test_match(self):
+        self.assertTrue(Move.match([Info(), Speed(), Position()]))
+        self.assertFalse(Move.match([Info(), Position()]))
+        self.assertFalse(Move.match([Position(), Position()]))
+        self.assertFalse(Move.match([]))
+        # the shared mapping is not consumed by matching
+        self.assertEqual(Move.field_mapping(), {Position: 'pos', Speed: 'speed'})
+
+    def test_cast(self):
+        pos, speed = Position(x=1), Speed(y=2)
+        item = Move.cast([Info(), speed, pos])
+        self.assertIs(item.pos, pos)
+        self.assertIs(item.speed, speed)
+        self.assertIsNone(Move.cast([pos, Info()]))
+        # same layout: offsets are computed once
+        Move.cast([Info(), Speed(), Position()])
+        self.assertEqual(Move.matcher().layouts[(Info, Speed, Position)], (('speed', 1), ('pos', 2)))
+
+    def test_bind(self):
+        view = Move.cast([Position(), Speed()])
+        pos, speed = Position(x=5), Speed(x=3)
+        self.assertIs(view.bind([speed, pos]), view)
+        self.assertIs(view.pos, pos)
+        self.assertIs(view.speed, speed)
+        self.assertIsNone(view.bind([pos]))
+        self.assertIs(view.pos, pos)
+
+    def test_subclass(self):
+        class Tagged(Move):
+            info: Info
+
+        self.assertIsNone(Tagged.cast([Position(), Speed()]))
+        self.assertIsInstance(Tagged.cast([Position(), Speed(), Info()]), Signature)
@@ -0,0 +1,75 @@
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.component import CID_GEN, Component
+from python_ecs.ecs import ECS
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.storage.archetype_database import ArchetypeDatabase
+from python_ecs.storage.database import Database
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Speed, Info, Move, MoveSystem
+
+
+class Tagged(Component):
+    tags: tuple[str, ...] = ()
+    parent: int | None = None
+    extra: Any = None
+
+
+class TestSnapshot(TimingTestCase):
+
+    @each_database
+    def test_save_load(self, db: Database):
+        db.create_all([
+            [Info(name='a'), Position(x=3)],
+            [Position(x=1, y=2), Speed(x=2)],
+            [Info(name='b'), Vec3.create(1, 2, 3)],
+            [Tagged(tags=('x', 'y'), extra={'hp': 3})],
+            [Tagged(parent=7)],
+        ])
+        db.update_demography(db.dirty)
+        db.dirty.clear()
+
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / 'world.ecs'
+            db.save(path)
+
+            restored = type(db).load(path)
+            self.assertEqual(restored.entities(), db.entities())
+            self.assertEqual(restored.snapshot().entities.tolist(), sorted(db.entities()))
+            self.assertEqual(sorted(_.name for _ in restored.get_table(Info).list_all()), ['a', 'b'])
+            self.assertEqual(sorted((_.x, _.y) for _ in restored.get_table(Position).list_all()), [(1, 2), (3, 0)])
+            self.assertEqual(restored.get_table(Vec3).read_any().raw.tolist(), [1., 2., 3.])
+            self.assertEqual(
+                sorted(_.cid for _ in restored.get_table(Info).list_all()),
+                sorted(_.cid for _ in db.get_table(Info).list_all()),
+            )
+            self.assertGreater(Info().cid, CID_GEN.last_id - 1)
+            self.assertEqual(restored.allocator.generations.tolist(), db.allocator.generations[:db.allocator.size].tolist())
+            self.assertNotIn(restored.allocator.new_id(), db.entities())
+
+            # object columns keep their values and types
+            tagged = sorted(((_.tags, _.parent, _.extra) for _ in restored.get_table(Tagged).list_all()), key=str)
+            self.assertEqual(tagged, [(('x', 'y'), None, {'hp': 3}), ((), 7, None)])
+
+            ecs = ECS(systems=[MoveSystem()], db=restored)
+            ecs.register_all()
+            self.assertEqual(len(ecs.db.get_table(Move).entities), 1)
+            ecs.update()
+
+            if isinstance(restored, ArchetypeDatabase):
+                archetype, _ = restored.locate(next(iter(restored.query(all=[Vec3]).entities)))
+                self.assertIsInstance(archetype.columns[Vec3]['raw'], np.memmap)
+
+    def test_not_encodable(self):
+        db = Database()
+        db.create_all([Tagged(extra=threading.Lock())])
+        db.update_demography(db.drain())
+        with tempfile.TemporaryDirectory() as root:
+            with self.assertRaisesRegex(TypeError, 'Tagged.extra'):
+                db.save(Path(root) / 'world.ecs')
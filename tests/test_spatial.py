@@ -0,0 +1,89 @@
+from unittest import mock
+
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.storage.spatial import SpatialIndex
+from tests.test_ecs import Position
+from tests.database_cases import each_database
+
+
+class Location(Vec3):
+    pass
+
+
+class TestSpatial(TimingTestCase):
+
+    def test_index(self):
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(-10, 10, (500, 3))
+        eids = np.arange(500)
+        index = SpatialIndex(Location, cell_size=2.)
+        index.insert(eids, positions)
+
+        center = np.array([1., -2., 3.])
+        dist = np.linalg.norm(positions - center, axis=1)
+        self.assertEqual(index.query_radius(center, 4.).tolist(), eids[dist <= 4.].tolist())
+        self.assertEqual(index.k_nearest(center, 5).tolist(), eids[np.argsort(dist)[:5]].tolist())
+        inside = np.all((positions >= -1) & (positions <= 1), axis=1)
+        self.assertEqual(index.query_box([-1] * 3, [1] * 3).tolist(), eids[inside].tolist())
+
+        positions[:250] += 5
+        index.update(eids, positions)
+        index.remove(range(0, 500, 2))
+        dist = np.linalg.norm(positions - center, axis=1)
+        expected = [_ for _ in eids[dist <= 4.].tolist() if _ % 2]
+        self.assertEqual(index.query_radius(center, 4.).tolist(), expected)
+        self.assertEqual(len(index.k_nearest(center, 1000)), 250)
+
+    @each_database
+    def test_database_index(self, db: Database):
+        index = db.spatial_index(Location, cell_size=1.)
+        db.create_all([[Location.create(0, 0, 0)], [Location.create(3, 0, 0)]])
+        db.update_demography(db.dirty)
+        db.dirty.clear()
+        origin, other = sorted(db.entities())
+        spawned = db.spawn_many([Location], 3, Location={'raw': np.array([[0., 1., 0.], [0., 9., 0.], [9., 9., 9.]])})
+
+        self.assertEqual(len(index), 5)
+        self.assertEqual(db.query_radius([0, 0, 0], 1.5).tolist(), [origin, spawned[0]])
+        self.assertEqual(db.k_nearest([3, 1, 0], 2).tolist(), [other, spawned[0]])
+
+        db.get_table(Location).read(other).x = 0.5
+        db.refresh_spatial()
+        self.assertEqual(db.query_box([0, 0, 0], [1, 1, 1]).tolist(), [origin, other, spawned[0]])
+
+        # only the entities written since the previous refresh are read again (in place writes are not seen)
+        db.get_table(Location).read(origin).raw[0] = 9.
+        db.get_table(Location).read(int(spawned[1])).y = 0.
+        db.remove_component(int(spawned[1]), Location)
+        db.update_demography(db.drain())
+        db.refresh_spatial()
+        self.assertEqual(len(index), 4)
+        self.assertEqual(db.query_box([0, 0, 0], [1, 1, 1]).tolist(), [origin, other, spawned[0]])
+
+        db.update_demography(Demography(death={origin}))
+        self.assertEqual(db.query_radius([0, 0, 0], 1.5).tolist(), [other, spawned[0]])
+
+    @each_database
+    def test_component_waves(self, db: Database):
+        index = db.spatial_index(Location, cell_size=1.)
+        eids = db.spawn_many([Position], 100).tolist()
+        for i, eid in enumerate(eids):
+            db.add_component(eid, Location.create(i, 0, 0))
+
+        # one block per flush, whatever the number of entities gaining or losing the type
+        with mock.patch.object(index, 'insert', wraps=index.insert) as insert:
+            db.update_demography(db.drain())
+        self.assertEqual(insert.call_count, 1)
+        self.assertEqual(index.eids.tolist(), eids)
+
+        for eid in eids[::2]:
+            db.remove_component(eid, Location)
+        with mock.patch.object(index, 'remove', wraps=index.remove) as remove:
+            db.update_demography(db.drain())
+        self.assertEqual(len([_ for _ in remove.call_args_list if len(_.args[0])]), 1)
+        self.assertEqual(db.query_box([0, -1, -1], [10, 1, 1]).tolist(), eids[1:11:2])
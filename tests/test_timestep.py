@@ -0,0 +1,62 @@
+from typing import override
+
+from pydantic import Field
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.ecs import ECS
+from python_ecs.storage.database import Database
+from python_ecs.system import BaseSystem
+from python_ecs.timestep import FixedTimestep, PeriodicityBuckets
+
+
+class TraceSystem(BaseSystem):
+    calls: list[float] = Field(default_factory=list)
+
+    @override
+    def update(self, db: Database, dt: float):
+        self.calls.append(dt)
+
+
+class TestTimestep(TimingTestCase):
+
+    def test_fixed_timestep(self):
+        clock = FixedTimestep(step_sec=0.1, max_steps=3)
+        self.assertEqual(clock.advance(0.25), 2)
+        self.assertAlmostEqual(clock.alpha, 0.5)
+        self.assertEqual(clock.advance(10.), 3)
+        self.assertAlmostEqual(clock.dropped, 9.7)
+
+    def test_buckets(self):
+        fast, slow, other = TraceSystem(), TraceSystem().at_interval(1.), TraceSystem().at_interval(1.)
+        buckets = PeriodicityBuckets()
+        buckets.update([fast, slow, other])
+
+        self.assertEqual([_ for _, dt in buckets.due(0.)], [fast])
+        self.assertEqual([_ for _, dt in buckets.due(.5)], [fast])
+        buckets.defer(other, 0.)
+        self.assertEqual(buckets.due(1.), [(fast, .5), (slow, 1.), (other, 1.)])
+        self.assertEqual(buckets.overdue, {id(other)})
+        self.assertEqual(buckets.due(1.25), [(fast, .25)])
+        self.assertEqual(buckets.overdue, set())
+
+        buckets.defer(other, 1.)
+        self.assertEqual(buckets.due(1.5), [(fast, .25), (other, .5)])
+        self.assertEqual(buckets.overdue, {id(other)})
+
+    def test_budget(self):
+        main, background = TraceSystem(), TraceSystem(priority=-1)
+        ecs = ECS(systems=[main, background], budget_sec=0.)
+        for now in range(4):
+            ecs.tick(float(now))
+        self.assertEqual(main.calls, [0., 1., 1., 1.])
+        # deferred every other frame, with the time accumulated since its last run
+        self.assertEqual(background.calls, [1., 2.])
+        self.assertTrue(ecs.telemetry.frames[0].systems[1].skipped)
+
+    def test_fixed_update(self):
+        sys = TraceSystem()
+        ecs = ECS(systems=[sys], timestep=FixedTimestep(step_sec=1000.))
+        ecs.update()
+        ecs.update()
+        self.assertEqual(len(sys.calls), 1)
+        self.assertLess(ecs.alpha, 1.)
@@ -0,0 +1,85 @@
+import numpy as np
+
+from easy_kit.timing import TimingTestCase
+from python_ecs.storage.database import Database
+from python_ecs.storage.demography import Demography
+from python_ecs.storage.value_index import HashIndex, SortedIndex
+from tests.database_cases import each_database
+from tests.test_ecs import Position, Info
+
+
+class TestValueIndex(TimingTestCase):
+
+    def test_hash(self):
+        index = HashIndex(Info, 'name')
+        index.insert([1, 2, 3], ['a', 'b', 'a'])
+        self.assertEqual(index.find('a'), {1, 3})
+        index.update([1, 2], ['b', 'b'])
+        index.remove([3])
+        self.assertEqual(index.find('a'), set())
+        self.assertEqual(index.find('b'), {1, 2})
+        self.assertEqual(len(index), 2)
+
+    def test_sorted(self):
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 100, 200).tolist()
+        index = SortedIndex(Position, 'x')
+        index.insert(range(100), values[:100])
+        index.insert(range(100, 200), values[100:])
+
+        expected = sorted(_ for _ in range(200) if 10 <= values[_] <= 20)
+        self.assertEqual(sorted(index.range(10, 20)), expected)
+        self.assertEqual([values[_] for _ in index.top(3)], sorted(values, reverse=True)[:3])
+        self.assertEqual([values[_] for _ in index.top(3, largest=False)], sorted(values)[:3])
+
+        index.update([0], [1000])
+        index.remove([1])
+        self.assertEqual(index.top(1), [0])
+        self.assertNotIn(1, index.range())
+        self.assertEqual(len(index.range()), 199)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            HashIndex(Info, 'missing')
+
+    @each_database
+    def test_maintenance(self, db: Database):
+        db.create_all([Info(name='orc'), Info(name='elf'), [Info(name='orc'), Position(x=5)]])
+        db.update_demography(db.drain())
+        orc, elf, boss = sorted(db.entities())
+        spawned = db.spawn_many([Position], 3, Position={'x': np.array([1, 9, 3])}).tolist()
+
+        db.value_index(Info, 'name')
+        db.value_index(Position, 'x', kind='sorted')
+        with self.assertRaises(ValueError):
+            db.value_index(Position, 'x', kind='hash')
+        with self.assertRaises(TypeError):
+            db.find_range(Info, 'name', 'a', 'z')
+        with self.assertRaises(KeyError):
+            db.find_by(Position, 'y', 0)
+
+        self.assertEqual(db.find_by(Info, 'name', 'orc'), {orc, boss})
+        self.assertEqual(db.find_range(Position, 'x', 2, 5), [spawned[2], boss])
+        self.assertEqual(db.find_top(Position, 'x', 2), [spawned[1], boss])
+
+        # field writes
+        db.get_table(Info).read(elf).name = 'orc'
+        db.get_table(Position).read(spawned[1]).x = 0
+        self.assertEqual(db.find_by(Info, 'name', 'orc'), {orc, elf, boss})
+        self.assertEqual(db.find_top(Position, 'x', 1, largest=False), [spawned[1]])
+
+        # births, deaths and component changes
+        db.create_all([[Info(name='orc'), Position(x=7)]])
+        db.update_demography(Demography(death={orc}, added=[Position(eid=elf, x=4)], removed=[(boss, Info)]))
+        db.update_demography(db.drain())
+        newcomer = max(db.entities())
+        self.assertEqual(db.find_by(Info, 'name', 'orc'), {elf, newcomer})
+        self.assertEqual(db.find_range(Position, 'x', 4), [elf, boss, newcomer])
+
+        # vectorized writes (as BatchSystem does)
+        for batch in db.batches(Position):
+            batch.x += 10
+            batch.commit()
+            db.mark_changed(Position, batch.eids)
+        self.assertEqual(db.find_range(Position, 'x', 14, 15), [elf, boss])
+        self.assertEqual(db.find_top(Position, 'x', 1), [newcomer])
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_ecs.component import CID_GEN
+from python_ecs.provided.vec3 import Vec3
+from python_ecs.provided.vec3_array import Vec3Array
+
+
+class TestVec3Array(TestCase):
+
+    def test_no_cid(self):
+        a, b = Vec3.create(1, 2, 3), Vec3.create(3, 4, 0)
+        last = CID_GEN.last_id
+        c = (a + b) * 2 - Vec3.direction(a, b) / 2
+        self.assertEqual(c.raw.tolist(), [7., 11., 7.5])
+        self.assertEqual(Vec3.view(c.raw).norm(), c.norm())
+        # arithmetic results are temporaries: no component id drawn
+        self.assertEqual(CID_GEN.last_id, last)
+
+    def test_math(self):
+        arr = Vec3Array(np.array([[1., 2., 3.], [3., 4., 0.], [0., 0., 0.]]))
+        np.testing.assert_allclose(arr.norm(), [14 ** .5, 5., 0.])
+        np.testing.assert_allclose(arr.dot(Vec3.create(1, 1, 1)), [6., 7., 0.])
+        np.testing.assert_allclose((arr * np.array([[1.], [2.], [3.]])).raw[1], [6., 8., 0.])
+        np.testing.assert_allclose(arr.cross(Vec3.create(0, 0, 1)).raw[1], [4., -3., 0.])
+
+        unit = arr.normal()
+        np.testing.assert_allclose(unit.norm(), [1., 1., 0.])
+
+    def test_operand_shapes(self):
+        # N == 3: a (3,) array is a vector, not one scalar per row
+        arr = Vec3Array(np.ones((3, 3)))
+        np.testing.assert_allclose((arr + np.array([1., 0., 0.])).raw, [[2., 1., 1.]] * 3)
+        np.testing.assert_allclose((arr * np.array([[1.], [2.], [3.]])).x, [1., 2., 3.])
+        with self.assertRaises(ValueError):
+            Vec3Array(np.ones((4, 3))) * np.arange(4.)
+
+    def test_view(self):
+        raw = np.zeros((4, 3))
+        arr = Vec3Array(raw)
+        arr += Vec3.create(1, 0, 0)
+        self.assertEqual(raw[:, 0].tolist(), [1., 1., 1., 1.])
+
+        row = arr[2]
+        self.assertIsInstance(row, Vec3)
+        row.y = 5.
+        self.assertEqual(raw[2, 1], 5.)
+        self.assertEqual(len(arr[1:3]), 2)
+
+        with self.assertRaises(ValueError):
+            Vec3Array(np.zeros(3))